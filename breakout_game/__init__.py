@@ -2,5 +2,6 @@
 Breakout game package
 
 """
-from breakout_game import log, sprites, screens, utils
+from breakout_game import log, core, sprites, screens, utils
 from breakout_game.main import start
+from breakout_game.headless import start_headless
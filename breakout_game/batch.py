@@ -0,0 +1,156 @@
+"""
+Batch simulation of headless games in a pool of processes, for example to balance the powerup probabilities
+or the difficulty. The results are streamed as the games finish:
+
+    breakout-batch --games 1000 --difficulty 1 --seed 0
+"""
+import argparse
+import json
+import logging
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator
+
+from breakout_game.headless import HeadlessGame
+
+game_logger = logging.getLogger('')
+
+
+class BatchJob:
+    """
+    A game to simulate in a batch.
+
+    Attributes:
+        index (int): The number of the game in the batch.
+        seed (None, int): The seed of the random generator of the game. If None, the game is not reproducible.
+        level_difficulty (int): The difficulty of the game. Must be a number from 0 to 2.
+        level (int): The level to start the game at.
+        max_steps (None, int): The maximum number of steps of the game. If None, no limit.
+
+    Args:
+        index (int): The number of the game in the batch.
+        seed (None, int): The seed of the random generator of the game. Defaults to None.
+        level_difficulty (int): The difficulty of the game. Defaults to 0.
+        level (int): The level to start the game at. Defaults to 0.
+        max_steps (None, int): The maximum number of steps of the game. Defaults to None.
+
+    version: 1
+    """
+    def __init__(
+            self,
+            index: int,
+            seed: [None, int] = None,
+            level_difficulty: int = 0,
+            level: int = 0,
+            max_steps: [None, int] = None
+    ):
+        self.index: int = index
+        self.seed: [None, int] = seed
+        self.level_difficulty: int = level_difficulty
+        self.level: int = level
+        self.max_steps: [None, int] = max_steps
+
+
+def make_jobs(
+        games: int,
+        seed: [None, int] = None,
+        level_difficulty: int = 0,
+        level: int = 0,
+        max_steps: [None, int] = None
+) -> list[BatchJob]:
+    """
+    Make the jobs of games differing only by their seed.
+
+    Args:
+        games (int): The number of games.
+        seed (None, int): The seed of the first game. The next games get the next seeds. Defaults to None.
+            If None, the games are not reproducible.
+        level_difficulty (int): The difficulty of the games. Defaults to 0.
+        level (int): The level to start the games at. Defaults to 0.
+        max_steps (None, int): The maximum number of steps of a game. Defaults to None. If None, no limit.
+
+    Returns:
+        list[BatchJob]: The jobs.
+    """
+    return [
+        BatchJob(
+            index=index,
+            seed=None if seed is None else seed + index,
+            level_difficulty=level_difficulty,
+            level=level,
+            max_steps=max_steps
+        )
+        for index in range(games)
+    ]
+
+
+def run_job(job: BatchJob) -> dict:
+    """
+    Simulate the game of the job. Runs in a worker process.
+
+    Args:
+        job (BatchJob): The game to simulate.
+
+    Returns:
+        dict: The job and the result of the game, with the wall time of the simulation in seconds.
+    """
+    start = time.perf_counter()
+    game = HeadlessGame(level_difficulty=job.level_difficulty, level=job.level, seed=job.seed)
+    result = game.run(job.max_steps)
+    return {
+        'index': job.index,
+        'seed': job.seed,
+        'level_difficulty': job.level_difficulty,
+        'start_level': job.level,
+        **result,
+        'wall_time': time.perf_counter() - start
+    }
+
+
+def init_worker():
+    """
+    Prepare a worker process. The events of the games are not logged.
+    """
+    game_logger.setLevel(logging.WARNING)
+
+
+def run_batch(jobs: Iterable[BatchJob], max_workers: [None, int] = None) -> Iterator[dict]:
+    """
+    Simulate the games of the jobs in a pool of processes. The games share nothing, so the batch scales with
+    the number of processors.
+
+    Args:
+        jobs (Iterable[BatchJob]): The games to simulate.
+        max_workers (None, int): The number of worker processes. Defaults to None.
+            If None, the number of processors is used.
+
+    Yields:
+        dict: The result of each game as it finishes, in the order of finishing. See run_job.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker) as executor:
+        futures = [executor.submit(run_job, job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main():
+    """
+    Simulate a batch of games and print their results as lines of JSON.
+    """
+    parser = argparse.ArgumentParser(description='Simulate a batch of games in parallel.')
+    parser.add_argument('--games', type=int, default=1, help='Number of games to simulate.')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the first game.')
+    parser.add_argument('--difficulty', type=int, choices=[0, 1, 2], default=0, help='Difficulty of the games.')
+    parser.add_argument('--level', type=int, default=0, help='Level to start the games at.')
+    parser.add_argument('--max-steps', type=int, default=None, help='Maximum number of steps of a game.')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes.')
+    arguments = parser.parse_args()
+
+    jobs = make_jobs(arguments.games, arguments.seed, arguments.difficulty, arguments.level, arguments.max_steps)
+    for result in run_batch(jobs, arguments.workers):
+        print(json.dumps(result), flush=True)
+
+
+if __name__ == '__main__':
+    main()
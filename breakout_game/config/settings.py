@@ -53,13 +53,42 @@ RESOLUTIONS = {
 }
 
 # Change this if needed:
-SELECTED_RESOLUTION = RESOLUTIONS['1366x768']
+SELECTED_RESOLUTION_NAME = '1366x768'
+SELECTED_RESOLUTION = RESOLUTIONS[SELECTED_RESOLUTION_NAME]
 FPS = 60
+# The number of physics steps per second. Independent of the rendered frames per second.
+TICK_RATE = 120
+# The number of physics steps between the state hashes of an input recording.
+REPLAY_HASH_INTERVAL = TICK_RATE
+# The number of physics steps the frames shown run ahead of the game to hide the latency of slow displays.
+# Each step costs CPU time every frame. 0 disables run-ahead.
+RUN_AHEAD_TICKS = 0
+# The longest frame time in seconds caught up with physics steps. Longer hitches slow the game down instead.
+MAX_FRAME_TIME = 0.25
+# The most bounces of a ball calculated in one physics step. The ball stops at the last bounce for the step.
+MAX_BALL_BOUNCES = 8
+# If true, the multiply-balls powerup adds balls simulated in arrays instead of sprites.
+BALL_SWARM = True
+# The most balls the swarm may hold.
+MAX_SWARM_BALLS = 5000
+# If true, only the areas of the screen changed during the game are pushed to the display.
+DIRTY_RECT_RENDERING = False
+# How the game waits for the next frame: 'busy' or 'sleep-spin'.
+FRAME_STRATEGY = 'sleep-spin'
+# How menus wait for the next frame: 'busy', 'sleep-spin' or 'event-wait'.
+IDLE_FRAME_STRATEGY = 'event-wait'
+# The time in seconds spun before a frame instead of sleeping, since sleeping may overshoot.
+FRAME_SPIN_TIME = 0.002
+# The longest time in seconds a menu waits for an event.
+IDLE_TIMEOUT = 0.1
 
 WINDOW_WIDTH = SELECTED_RESOLUTION['window-width']
 WINDOW_HEIGHT = SELECTED_RESOLUTION['window-height']
 NUM_PIXELS = WINDOW_WIDTH * WINDOW_HEIGHT
 
+# The maximum memory in bytes the prepared level backgrounds may take in the cache.
+BACKGROUND_CACHE_BUDGET = 64 * 1024 * 1024
+
 # Fonts used
 GAME_FONT = path_utils.get_asset_path('fonts/joystix monospace.otf')
 MENU_FONT_SIZE = SELECTED_RESOLUTION['menu-font-size']
@@ -74,6 +103,9 @@ PADDLE_WIDTH = GAME_WINDOW_WIDTH // 2.5
 PADDLE_HEIGHT = WINDOW_HEIGHT // 40
 HEART_WIDTH = WINDOW_WIDTH // 30
 HEART_HEIGHT = WINDOW_HEIGHT // 20
+BALL_SIZE = round(WINDOW_WIDTH / 40)
+POWERUP_WIDTH = 52
+POWERUP_HEIGHT = 52
 
 # SPEEDS
 DEFAULT_PADDLE_SPEED_BASE = 800
@@ -118,11 +150,29 @@ COLOR_LEGEND = {
     7: path_utils.get_asset_path('images/blocks/7.png')
 }
 
-GAP_SIZE_COEFFICIENT = (WINDOW_WIDTH / 1366 + WINDOW_HEIGHT / 768) / 2
 GAP_SIZE_BASE = 5
+
+
+def get_block_size(resolution: dict) -> tuple[int, int]:
+    """
+    Get the size of a block at the resolution provided. The block size of the selected resolution is
+    BLOCK_WIDTH and BLOCK_HEIGHT.
+
+    Args:
+        resolution (dict): An entry of RESOLUTIONS.
+
+    Returns:
+        tuple[int, int]: The width and height of a block.
+    """
+    window_width, window_height = resolution['window-width'], resolution['window-height']
+    game_window_width = window_width - window_width // 4
+    gap_size = round((window_width / 1366 + window_height / 768) / 2 * GAP_SIZE_BASE)
+    return game_window_width // len(BLOCK_MAP[0]) - gap_size, window_height // len(BLOCK_MAP) - gap_size
+
+
+GAP_SIZE_COEFFICIENT = (WINDOW_WIDTH / 1366 + WINDOW_HEIGHT / 768) / 2
 GAP_SIZE = round(GAP_SIZE_COEFFICIENT * GAP_SIZE_BASE)
-BLOCK_HEIGHT = GAME_WINDOW_HEIGHT // len(BLOCK_MAP) - GAP_SIZE
-BLOCK_WIDTH = GAME_WINDOW_WIDTH // len(BLOCK_MAP[0]) - GAP_SIZE
+BLOCK_WIDTH, BLOCK_HEIGHT = get_block_size(SELECTED_RESOLUTION)
 
 
 # POWERUPS
@@ -188,5 +238,41 @@ POWERS = {
     },
 }
 
+# SOUNDS
+
+# Sound effects played through the sound bank. Each sound is decoded once and shared.
+SOUNDS = {
+    'hit-blocks': {
+        'path': path_utils.get_asset_path('sounds/hit blocks.mp3'),
+        'volume': 0.25
+    },
+    'break-blocks': {
+        'path': path_utils.get_asset_path('sounds/break blocks.mp3'),
+        'volume': 0.75
+    },
+    'hit-paddle': {
+        'path': path_utils.get_asset_path('sounds/hit paddle.mp3'),
+        'volume': 1.0
+    },
+    'get-powerup': {
+        'path': path_utils.get_asset_path('sounds/get powerup.mp3'),
+        'volume': 0.3
+    },
+    'lost-hp': {
+        'path': path_utils.get_asset_path('sounds/lost_hp.mp3'),
+        'volume': 1.0
+    },
+}
+
+# The number of mixer channels reserved for sound effects.
+SOUND_CHANNELS = 8
+# The maximum number of channels playing the same sound at once.
+SOUND_VOICE_LIMIT = 3
+
+# HUD
+
+# The step in seconds of the time left shown by powerup timers.
+HUD_TIMER_GRANULARITY = 0.1
+
 # HEALTH
 MAX_PLAYER_HEALTH = 3
@@ -0,0 +1,4 @@
+"""
+Rendering-free simulation core of the game.
+"""
+from .game_core import GameCore, INPUT_LEFT, INPUT_RIGHT, INPUT_LAUNCH
@@ -0,0 +1,364 @@
+"""
+Module describing the ball state: its movement, collisions and bouncing.
+"""
+
+from __future__ import annotations
+
+import math
+
+from typing import TYPE_CHECKING
+
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.utils import collision
+
+if TYPE_CHECKING:
+    from breakout_game.core.game_core import GameCore
+
+
+class BallState:
+    """
+    A ball. Handles collision detection and bouncing.
+
+    Attributes:
+        x (float): The left side of the ball.
+        y (float): The top side of the ball.
+        width (int): The width of the ball.
+        height (int): The height of the ball.
+        original_width (int): The width of the ball without powerups. Defaults to settings.BALL_SIZE.
+        original_height (int): The height of the ball without powerups. Defaults to settings.BALL_SIZE.
+        origin (tuple): The middle bottom position the ball was created at. New balls of the multiply-balls
+            powerup start there.
+        direction_x (float): The direction of movement along the x-axis.
+        direction_y (float): The direction of movement along the y-axis.
+        speed (int, float): Speed of the ball.
+        original_speed (int, float): Original speed of the ball. Used for powerups.
+        strength (int): Strength of the ball. Used to detect how much damage is dealt to blocks.
+            Defaults to 1
+        original_strength (int): Original strength of the ball. Used for powerups. Defaults to 1.
+        size_factor (int, float): The size of the ball relative to the original size. Defaults to 1.
+        tint (None, tuple): The color added to the ball image. Defaults to None. If None, the ball is not tinted.
+        active (bool): Whether the ball is active or not. Defaults to False.
+        lost_time (None, float): The time of the game the ball was lost at. The ball waits half a second
+            before following the paddle again. Defaults to None. None if the ball was never lost.
+
+    Args:
+        midbottom (tuple): The middle bottom position of the ball. Must be a tuple of (x, y).
+        speed (int, float): Speed of the ball.
+        angle_radians (int, float): The angle of the direction in radians. Defaults to math.pi / 2 (90 degrees).
+
+    version: 1
+    """
+    def __init__(self, midbottom: tuple, speed: (int, float), angle_radians: (int, float) = math.pi / 2):
+        self.original_width: int = settings.BALL_SIZE
+        self.original_height: int = settings.BALL_SIZE
+        self.width: int = self.original_width
+        self.height: int = self.original_height
+        self.x: float = midbottom[0] - self.width // 2
+        self.y: float = midbottom[1] - self.height
+        self.origin: tuple = tuple(midbottom)
+
+        self.direction_x: float = math.cos(angle_radians)
+        self.direction_y: float = math.sin(angle_radians)
+        self.speed: (int, float) = speed
+        self.original_speed: (int, float) = speed
+        self.strength: int = 1
+        self.original_strength: int = 1
+
+        self.size_factor: (int, float) = 1
+        self.tint: [None, tuple] = None
+
+        self.active: bool = False
+        self.lost_time: [None, float] = None
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """
+        The rectangle of the ball on the screen.
+
+        Returns:
+            pygame.Rect: The rectangle.
+        """
+        return pygame.Rect(round(self.x), round(self.y), self.width, self.height)
+
+    def set_direction_from_angle(self, angle: (int, float)):
+        """
+        Set direction from the angle presented in radians.
+
+        Args:
+            angle (int, float): Angle in radians
+        """
+        self.direction_x, self.direction_y = math.cos(angle), math.sin(angle)
+
+    def change_size_factor(self, size_factor: (int, float)):
+        """
+        Change the size of the ball relative to the original size. The ball keeps its center. Used in powerups.
+
+        Args:
+            size_factor (int, float): New size factor. 1 restores the original size.
+        """
+        center = self.rect.center
+        self.size_factor = size_factor
+        self.width = round(self.original_width * size_factor)
+        self.height = round(self.original_height * size_factor)
+        rect = pygame.Rect(0, 0, self.width, self.height)
+        rect.center = center
+        self.x, self.y = rect.x, rect.y
+
+    def lose(self, core: GameCore):
+        """
+        Lose the ball. The last ball in the game costs health and waits for the next launch,
+        other balls are removed.
+
+        Args:
+            core (GameCore): The game the ball is in.
+        """
+        self.lost_time = core.time
+        if len(core.balls) == 1 and len(core.ball_swarm) == 0:
+            core.lose_health()
+            self.active = False
+        else:
+            core.balls.remove(self)
+
+    def _frame_collision(self, core: GameCore):
+        """
+        Check if the ball collides with the game window, change its direction and position.
+
+        Args:
+            core (GameCore): The game the ball is in.
+        """
+        # Hit the left or the right side of the game window
+        left = round(self.x)
+        if left < 0:
+            self.x = 0
+            self.direction_x *= -1
+        elif left + self.width > settings.GAME_WINDOW_WIDTH:
+            self.x = settings.GAME_WINDOW_WIDTH - self.width
+            self.direction_x *= -1
+
+        # Hit the top or the bottom of the game window
+        top = round(self.y)
+        if top < 0:
+            self.y = 0
+            self.direction_y *= -1
+        elif top > settings.GAME_WINDOW_HEIGHT:
+            self.lose(core)
+
+    def _adjust_angle_on_paddle(self, overlapping_rect: pygame.Rect, paddle_rect: pygame.Rect):
+        """
+        Adjust the angle of the ball according to the position of the hit point on the paddle.
+
+        Args:
+            overlapping_rect (pygame.Rect): The area of the paddle hit.
+            paddle_rect (pygame.Rect): The rectangle of the paddle.
+        """
+        dist_from_paddle_center = overlapping_rect.centerx - paddle_rect.centerx
+        angle_ratio = abs(dist_from_paddle_center) / (paddle_rect.width / 2)
+        if angle_ratio != 0:
+            resulting_angle = math.pi / 2 - angle_ratio * (math.pi / 2 - math.pi / 6)
+            resulting_cotangent = 1 / math.tan(resulting_angle)
+            self.direction_x = math.copysign(resulting_cotangent * abs(self.direction_y), dist_from_paddle_center)
+        else:
+            self.direction_x = 0
+
+    def _bounce_off_overlap(self, rect: pygame.Rect, overlapping_rect: pygame.Rect, core: GameCore, on_paddle: bool):
+        """
+        Move the rectangle of the ball out of the overlapping rectangle and change the direction.
+
+        Args:
+            rect (pygame.Rect): The rectangle of the ball, moved in place.
+            overlapping_rect (pygame.Rect): The area shared by the ball and the blocks or the paddle.
+            core (GameCore): The game the ball is in.
+            on_paddle (bool): Whether the ball overlaps the paddle.
+        """
+        vertical = overlapping_rect.width >= overlapping_rect.height
+        horizontal = overlapping_rect.height >= overlapping_rect.width
+        if on_paddle and overlapping_rect.height > overlapping_rect.width:
+            # A special case to prevent the ball from clipping inside the paddle
+            paddle = core.paddle
+            # The ball is pushed by the path the paddle moves in 0.05 seconds, no matter the length of a step
+            paddle_push = abs(round(paddle.direction * paddle.speed * 0.05))
+            rect.x += paddle_push if paddle.direction > 0 else -paddle_push
+            self.direction_x = paddle.direction
+            return
+        if horizontal:
+            if self.direction_x < 0:
+                rect.left = overlapping_rect.right
+            else:
+                rect.right = overlapping_rect.left
+            self.direction_x *= -1
+        if vertical:
+            if self.direction_y < 0:
+                rect.top = overlapping_rect.bottom
+            else:
+                rect.bottom = overlapping_rect.top
+            self.direction_y *= -1
+        if on_paddle and overlapping_rect.width > overlapping_rect.height:
+            self._adjust_angle_on_paddle(overlapping_rect, core.paddle.rect)
+
+    def _get_targets(self, core: GameCore, displacement: tuple[float, float]) -> list[tuple]:
+        """
+        Get the blocks in the cells of the path of the ball and the paddle if it is near the path.
+
+        Args:
+            core (GameCore): The game the ball is in.
+            displacement (tuple[float, float]): The movement of the ball.
+
+        Returns:
+            list[tuple]: The (row, column) of each block, None for the paddle, with the rectangle of the target.
+        """
+        top = self.y + min(displacement[1], 0) - 2
+        bottom = self.y + max(displacement[1], 0) + self.height + 2
+        block_field = core.block_field
+        near_paddle = bottom >= core.paddle.y
+        if not near_paddle and not block_field.holds_blocks_between(top, bottom):
+            # Nothing is near the path
+            return []
+        path = pygame.Rect(
+            self.x + min(displacement[0], 0) - 2, top, abs(displacement[0]) + self.width + 4, bottom - top
+        )
+        targets = [(cell, block_field.get_rect(*cell)) for cell in block_field.query(path)]
+        if near_paddle:
+            targets.append((None, core.paddle.rect))
+        return [target for target in targets if path.colliderect(target[1])]
+
+    def _handle_overlaps(self, core: GameCore, targets: list[tuple]) -> bool:
+        """
+        Handle the blocks and the paddle already overlapping the ball, such as a paddle moved into the ball or
+        a ball grown into a block. Hits on the path of the ball are handled by _sweep.
+
+        Args:
+            core (GameCore): The game the ball is in.
+            targets (list[tuple]): The targets near the ball from _get_targets.
+
+        Returns:
+            bool: True if the ball bounced off an overlap.
+        """
+        box = (self.x, self.y, self.width, self.height)
+        colliding = [(cell, rect) for cell, rect in targets if collision.overlaps(box, rect)]
+        if not colliding:
+            return False
+        colliding_blocks = [cell for cell, _ in colliding if cell is not None]
+        on_paddle = len(colliding_blocks) < len(colliding)
+        rect = self.rect
+        overlaps = [rect.clip(target_rect) for _, target_rect in colliding]
+        self._bounce_off_overlap(rect, overlaps[0].unionall(overlaps[1:]), core, on_paddle)
+        if on_paddle:
+            core.play_sound('hit-paddle')
+        else:
+            self._damage_blocks(core, colliding_blocks)
+        self.x, self.y = rect.x, rect.y
+        return True
+
+    def _damage_blocks(self, core: GameCore, cells: list[tuple[int, int]]):
+        """
+        Deal the strength of the ball as damage to each block.
+
+        Args:
+            core (GameCore): The game the ball is in.
+            cells (list[tuple[int, int]]): The (row, column) of the blocks in the block field.
+        """
+        if cells:
+            rows, columns = zip(*cells)
+            core.damage_blocks(rows, columns, [self.strength] * len(cells))
+
+    def _handle_hit(self, core: GameCore, normal: tuple[int, int], hit_targets: list):
+        """
+        Bounce off the blocks and the paddle hit by the sweep. Blocks get damage, the paddle adjusts the angle
+        of the ball.
+
+        Args:
+            core (GameCore): The game the ball is in.
+            normal (tuple[int, int]): The normal of the faces hit.
+            hit_targets (list): The (row, column) of the blocks hit at the same time, None for the paddle.
+        """
+        self.direction_x, self.direction_y = collision.reflect((self.direction_x, self.direction_y), normal)
+        if None not in hit_targets:
+            self._damage_blocks(core, hit_targets)
+            return
+        paddle = core.paddle
+        paddle_rect = paddle.rect
+        if normal == (0, -1):
+            hit_left = max(self.x, paddle_rect.left)
+            hit_right = min(self.x + self.width, paddle_rect.right)
+            self._adjust_angle_on_paddle(
+                pygame.Rect(round(hit_left), paddle_rect.top, round(hit_right - hit_left), 0), paddle_rect
+            )
+        elif normal[1] == 0 and paddle.direction != 0:
+            self.direction_x = paddle.direction
+        core.play_sound('hit-paddle')
+
+    def _sweep(self, core: GameCore, distance: float, targets: [None, list[tuple]] = None):
+        """
+        Move the ball along its path and bounce off the blocks and the paddle on the way. The time of impact is
+        calculated along the path, so a fast ball cannot pass through thin objects and may bounce several
+        times in one step.
+
+        Args:
+            core (GameCore): The game the ball is in.
+            distance (float): The distance the ball moves in the step.
+            targets (None, list[tuple]): The targets near the path from _get_targets. Defaults to None.
+                If None, the targets are looked up.
+        """
+        # Axes the ball still moves along. An axis is blocked when the ball is pinched between two objects.
+        free_x, free_y = 1, 1
+        previous_time = None
+        for _ in range(settings.MAX_BALL_BOUNCES):
+            displacement = (self.direction_x * free_x * distance, self.direction_y * free_y * distance)
+            # Only the blocks in the cells of the path and the paddle near it are swept
+            if targets is None:
+                targets = self._get_targets(core, displacement)
+            hit = None
+            if targets:
+                hit = collision.find_first_hit(
+                    (self.x, self.y, self.width, self.height), displacement, [rect for _, rect in targets]
+                )
+            if hit is None:
+                self.x += displacement[0]
+                self.y += displacement[1]
+                break
+            self.x += displacement[0] * hit[0]
+            self.y += displacement[1] * hit[0]
+            distance *= 1 - hit[0]
+            if hit[0] <= collision.EPSILON and previous_time is not None and previous_time <= collision.EPSILON:
+                # Bounced back at once, the ball slides along the objects for the rest of the step
+                free_x, free_y = free_x * (hit[1][0] == 0), free_y * (hit[1][1] == 0)
+            previous_time = hit[0]
+            self._handle_hit(core, hit[1], [targets[index][0] for index in hit[2]])
+            targets = None
+
+    def update(self, core: GameCore, delta_time: (int, float), launch: bool):
+        """
+        Update the status of the ball. Handle movement, collisions and activation.
+
+        Args:
+            core (GameCore): The game the ball is in.
+            delta_time (int, float): Time passed since last step.
+            launch (bool): Whether the player launches the ball.
+        """
+        if self.active:
+            length = math.hypot(self.direction_x, self.direction_y)
+            if length != 0:
+                self.direction_x /= length
+                self.direction_y /= length
+
+            distance = self.speed * delta_time
+            displacement = (self.direction_x * distance, self.direction_y * distance)
+            targets = self._get_targets(core, displacement)
+            if not targets:
+                # Nothing is near the path, the ball moves freely
+                self.x += displacement[0]
+                self.y += displacement[1]
+            else:
+                self._sweep(core, distance, None if self._handle_overlaps(core, targets) else targets)
+            self._frame_collision(core)
+
+        elif self.lost_time is None or core.time - self.lost_time > 0.5:
+            paddle_rect = core.paddle.rect
+            self.x = paddle_rect.centerx - self.width // 2
+            self.y = paddle_rect.top - self.height
+
+            if launch:
+                self.active = True
+                self.direction_x, self.direction_y = 0, -1
@@ -0,0 +1,472 @@
+"""
+Module describing the ball swarm: extra balls kept in NumPy arrays and simulated in batches.
+"""
+from __future__ import annotations
+
+import math
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from breakout_game.config import settings
+from breakout_game.utils.collision import EPSILON
+
+if TYPE_CHECKING:
+    from breakout_game.core.game_core import GameCore
+    from breakout_game.core.ball import BallState
+
+
+def _axis_times(position, displacement, low, high):
+    """
+    Get the times moving intervals enter and leave static intervals along one axis, the same way as
+    collision.sweep_box does for a single box.
+
+    Args:
+        position: The starts of the moving intervals.
+        displacement: The movements of the intervals.
+        low: The starts of the static intervals, less the lengths of the moving intervals.
+        high: The ends of the static intervals.
+
+    Returns:
+        tuple: The entry and exit times as the fractions of the displacements. Infinite for intervals not moving.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        first = (low - position) / displacement
+        second = (high - position) / displacement
+    inside = (low < position) & (position < high)
+    still = displacement == 0
+    return (
+        np.where(still, np.where(inside, -np.inf, np.inf), np.minimum(first, second)),
+        np.where(still, np.where(inside, np.inf, -np.inf), np.maximum(first, second))
+    )
+
+
+class BallSwarm:
+    """
+    Balls stored as a structure of arrays instead of one object per ball.
+
+    The balls are moved and swept against the blocks and the paddle all at once. They behave like active
+    single balls: they bounce off the walls, blocks and the paddle, damage blocks and are lost at the bottom
+    of the window. Powerups act on all balls alike, so the size and tint are shared by the swarm.
+
+    Attributes:
+        core (GameCore): The game the balls are in.
+        enabled (bool): If true, the multiply-balls powerup fills the swarm. Defaults to settings.BALL_SWARM.
+        positions (np.ndarray): The top left corners of the balls, shape (n, 2). Defaults to no balls.
+        previous_positions (np.ndarray): The positions before the last physics step, shape (n, 2).
+            Used to interpolate the rendered positions. Defaults to no balls.
+        directions (np.ndarray): The unit directions of the balls, shape (n, 2). Defaults to no balls.
+        original_speeds (np.ndarray): The speeds of the balls without powerups, shape (n,).
+            Defaults to no balls.
+        original_strengths (np.ndarray): The strengths of the balls without powerups, shape (n,).
+            Defaults to no balls.
+        speed_factor (float): The factor the speed powerups apply to the original speeds. Defaults to 1.
+        strength_factor (int): The factor the strength powerups apply to the original strengths. Defaults to 1.
+        size_factor (int, float): The size of the balls relative to the original size. Defaults to 1.
+        tint (None, tuple): The color added to the ball image. Defaults to None.
+
+    Args:
+        core (GameCore): The game the balls are in.
+
+    version: 1
+    """
+    def __init__(self, core: GameCore):
+        self.core = core
+        self.enabled: bool = settings.BALL_SWARM
+
+        self.positions: np.ndarray = np.empty((0, 2))
+        self.previous_positions: np.ndarray = np.empty((0, 2))
+        self.directions: np.ndarray = np.empty((0, 2))
+        self.original_speeds: np.ndarray = np.empty(0)
+        self.original_strengths: np.ndarray = np.empty(0, dtype=int)
+
+        self.speed_factor: float = 1
+        self.strength_factor: int = 1
+        self.size_factor: (int, float) = 1
+        self.tint: [None, tuple] = None
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def get_snapshot(self) -> dict:
+        """
+        Get a copy of the state of the balls, to restore the swarm later.
+
+        Returns:
+            dict: The arrays and the factors of the swarm.
+        """
+        return {
+            'enabled': self.enabled,
+            'positions': self.positions.copy(),
+            'directions': self.directions.copy(),
+            'original_speeds': self.original_speeds.copy(),
+            'original_strengths': self.original_strengths.copy(),
+            'speed_factor': self.speed_factor,
+            'strength_factor': self.strength_factor,
+            'size_factor': self.size_factor,
+            'tint': self.tint
+        }
+
+    def restore_snapshot(self, snapshot: dict):
+        """
+        Restore the balls from a snapshot. The balls are not interpolated across the restore.
+
+        Args:
+            snapshot (dict): The state of the swarm from get_snapshot.
+        """
+        for name, value in snapshot.items():
+            setattr(self, name, value.copy() if isinstance(value, np.ndarray) else value)
+        self.previous_positions = self.positions.copy()
+
+    def clear(self):
+        """
+        Remove all balls.
+        """
+        self.positions = np.empty((0, 2))
+        self.previous_positions = np.empty((0, 2))
+        self.directions = np.empty((0, 2))
+        self.original_speeds = np.empty(0)
+        self.original_strengths = np.empty(0, dtype=int)
+
+    def get_size(self) -> tuple[int, int]:
+        """
+        Get the size shared by the balls, the same as the size of a single ball with the size factor.
+
+        Returns:
+            tuple[int, int]: The width and the height.
+        """
+        size = round(settings.BALL_SIZE * self.size_factor)
+        return size, size
+
+    def add_balls(self, centers, angles, speeds, strengths):
+        """
+        Add balls to the swarm. Balls beyond settings.MAX_SWARM_BALLS are not added.
+
+        Args:
+            centers: The centers of the balls, shape (n, 2).
+            angles: The angles of the directions in radians, shape (n,).
+            speeds: The original speeds of the balls, shape (n,).
+            strengths: The original strengths of the balls, shape (n,).
+        """
+        count = max(min(len(angles), settings.MAX_SWARM_BALLS - len(self)), 0)
+        if not self.enabled or count == 0:
+            return
+        angles = np.asarray(angles, dtype=float)[:count]
+        positions = np.asarray(centers, dtype=float)[:count] - np.array(self.get_size()) / 2
+        self.positions = np.concatenate([self.positions, positions])
+        self.previous_positions = np.concatenate([self.previous_positions, positions])
+        self.directions = np.concatenate([self.directions, np.column_stack([np.cos(angles), np.sin(angles)])])
+        self.original_speeds = np.concatenate([self.original_speeds, np.asarray(speeds, dtype=float)[:count]])
+        self.original_strengths = np.concatenate([self.original_strengths, np.asarray(strengths, dtype=int)[:count]])
+
+    def multiply(self, balls: list[BallState], angles: list[float]):
+        """
+        Add a ball in each direction for every single ball and every ball of the swarm.
+
+        Args:
+            balls (list[BallState]): The single balls in the game. New balls start at their origins.
+            angles (list[float]): The angles of the new balls in radians.
+        """
+        half_height = self.get_size()[1] / 2
+        centers = [(ball.origin[0], ball.origin[1] - half_height) for ball in balls]
+        speeds = [ball.original_speed for ball in balls]
+        strengths = [ball.original_strength for ball in balls]
+        if len(self) > 0:
+            centers += (self.positions + np.array(self.get_size()) / 2).tolist()
+            speeds += self.original_speeds.tolist()
+            strengths += self.original_strengths.tolist()
+        self.add_balls(
+            centers=[center for center in centers for _ in angles],
+            angles=list(angles) * len(centers),
+            speeds=[speed for speed in speeds for _ in angles],
+            strengths=[strength for strength in strengths for _ in angles]
+        )
+
+    def change_size_factor(self, size_factor: (int, float)):
+        """
+        Change the size of all balls relative to the original size. The balls keep their centers.
+
+        Args:
+            size_factor (int, float): New size factor. 1 restores the original size.
+        """
+        old_size = np.array(self.get_size())
+        self.size_factor = size_factor
+        if len(self) > 0:
+            shift = (old_size - np.array(self.get_size())) / 2
+            self.positions += shift
+            self.previous_positions += shift
+
+    def change_tint(self, tint: [None, tuple]):
+        """
+        Change the color added to the image of all balls.
+
+        Args:
+            tint (None, tuple): New tint. Must be a tuple of (r, g, b). None restores the original color.
+        """
+        self.tint = tint
+
+    def change_speed_factor(self, speed_factor: float):
+        """
+        Change the speed of all balls relative to their original speed.
+
+        Args:
+            speed_factor (float): New speed factor. 1 restores the original speed.
+        """
+        self.speed_factor = speed_factor
+
+    def change_strength_factor(self, strength_factor: int):
+        """
+        Change the strength of all balls relative to their original strength.
+
+        Args:
+            strength_factor (int): New strength factor. 1 restores the original strength.
+        """
+        self.strength_factor = strength_factor
+
+    def save_positions(self):
+        """
+        Remember the positions before a physics step. Used by the view to interpolate the rendered positions.
+        """
+        if len(self) > 0:
+            self.previous_positions = self.positions.copy()
+
+    def get_lowest_index(self) -> [None, int]:
+        """
+        Get the index of the lowest ball.
+
+        Returns:
+            None, int: None if there are no balls. Otherwise the index of the ball in the arrays.
+        """
+        if len(self) == 0:
+            return None
+        return int(np.argmax(self.positions[:, 1]))
+
+    def get_lowest(self) -> [None, tuple[float, float]]:
+        """
+        Get the lowest ball.
+
+        Returns:
+            None, tuple[float, float]: None if there are no balls. Otherwise the center x and the bottom.
+        """
+        index = self.get_lowest_index()
+        if index is None:
+            return None
+        width, height = self.get_size()
+        return self.positions[index, 0] + width / 2, self.positions[index, 1] + height
+
+    def _get_near_pairs(self, positions, displacements):
+        """
+        Get the pairs of a ball and a target near the path of the ball. Blocks are looked up in the cells of the
+        block field covered by the path, the paddle is checked against every path.
+
+        Args:
+            positions: The top left corners of the balls, shape (n, 2).
+            displacements: The movement of the balls, shape (n, 2).
+
+        Returns:
+            tuple: The indices of the balls, the targets as left, top, right and bottom, shape (k, 4), and the
+                cells of the blocks as flat indices of the block field, -1 for the paddle.
+        """
+        low = np.minimum(positions, positions + displacements)
+        high = np.maximum(positions, positions + displacements) + np.array(self.get_size())
+        block_field = self.core.block_field
+        balls, rows, columns = block_field.query_areas(low, high)
+
+        player_rect = self.core.paddle.rect
+        near_player = np.nonzero(
+            (low[:, 0] <= player_rect.right) & (high[:, 0] >= player_rect.left)
+            & (low[:, 1] <= player_rect.bottom) & (high[:, 1] >= player_rect.top)
+        )[0]
+        rects = np.concatenate([
+            block_field.get_rects(rows, columns),
+            np.tile(tuple(player_rect), (len(near_player), 1))
+        ]).astype(float)
+        rects[:, 2:] += rects[:, :2]
+        cells = np.concatenate([
+            np.ravel_multi_index((rows, columns), block_field.health.shape),
+            np.full(len(near_player), -1)
+        ])
+        return np.concatenate([balls, near_player]), rects, cells
+
+    def _sweep_pairs(self, positions, displacements, pair_rects):
+        """
+        Find the time of impact of each pair of a ball and a target.
+
+        Args:
+            positions: The top left corners of the balls of the pairs, shape (k, 2).
+            displacements: The movement of the balls of the pairs, shape (k, 2).
+            pair_rects: The targets of the pairs as left, top, right and bottom, shape (k, 4).
+
+        Returns:
+            tuple: The time of impact of each pair, infinite if the target is not hit, and the normal of the face
+                hit, shape (k, 2).
+        """
+        width, height = self.get_size()
+        x_entry, x_exit = _axis_times(positions[:, 0], displacements[:, 0], pair_rects[:, 0] - width, pair_rects[:, 2])
+        y_entry, y_exit = _axis_times(positions[:, 1], displacements[:, 1], pair_rects[:, 1] - height, pair_rects[:, 3])
+        entry = np.maximum(x_entry, y_entry)
+        leave = np.minimum(x_exit, y_exit)
+        times = np.where(
+            (entry <= leave) & (entry >= -EPSILON) & (entry <= 1) & (leave > EPSILON),
+            np.maximum(entry, 0),
+            np.inf
+        )
+        faces = np.column_stack([x_entry >= y_entry - EPSILON, y_entry >= x_entry - EPSILON])
+        return times, -np.sign(displacements) * faces
+
+    def _sweep(self, positions, displacements):
+        """
+        Find the first target hit by each ball moving along its displacement. Only the targets near the path
+        of a ball are swept, so the cost follows the number of balls, not the number of blocks.
+
+        Args:
+            positions: The top left corners of the balls, shape (n, 2).
+            displacements: The movement of the balls, shape (n, 2).
+
+        Returns:
+            tuple: The time of impact of each ball, infinite if nothing is hit, the target hit as the flat index
+                of the cell in the block field, -1 for the paddle, and the normal of the face hit, shape (n, 2).
+        """
+        balls, pair_rects, pair_targets = self._get_near_pairs(positions, displacements)
+        pair_times, pair_normals = self._sweep_pairs(positions[balls], displacements[balls], pair_rects)
+
+        # The earliest pair of each ball
+        order = np.lexsort((pair_times, balls))
+        first = order[np.unique(balls[order], return_index=True)[1]]
+        times = np.full(len(positions), np.inf)
+        target = np.zeros(len(positions), dtype=int)
+        normals = np.zeros((len(positions), 2))
+        times[balls[first]] = pair_times[first]
+        target[balls[first]] = pair_targets[first]
+        normals[balls[first]] = pair_normals[first]
+        return times, target, normals
+
+    def _bounce_off_paddle(self, indices):
+        """
+        Set the angle of the balls hitting the top of the paddle by the hit point, the same way as single balls.
+
+        Args:
+            indices: The indices of the balls.
+        """
+        player_rect = self.core.paddle.rect
+        width = self.get_size()[0]
+        left = np.maximum(self.positions[indices, 0], player_rect.left)
+        right = np.minimum(self.positions[indices, 0] + width, player_rect.right)
+        distance = (left + right) / 2 - player_rect.centerx
+        angle_ratio = np.minimum(np.abs(distance) / (player_rect.width / 2), 1)
+        angle = math.pi / 2 - angle_ratio * (math.pi / 2 - math.pi / 6)
+        cotangent = np.where(angle_ratio > 0, 1 / np.tan(angle), 0)
+        directions = self.directions[indices]
+        directions[:, 1] = -np.abs(directions[:, 1])
+        directions[:, 0] = np.sign(distance) * cotangent * np.abs(directions[:, 1])
+        self.directions[indices] = directions / np.linalg.norm(directions, axis=1)[:, None]
+
+    def _catch_on_paddle(self):
+        """
+        Put the falling balls overlapped by the paddle on top of it and bounce them. The paddle may move
+        into the balls between the steps.
+        """
+        player_rect = self.core.paddle.rect
+        width, height = self.get_size()
+        overlapped = (
+            (self.positions[:, 0] + width > player_rect.left) & (self.positions[:, 0] < player_rect.right)
+            & (self.positions[:, 1] + height > player_rect.top) & (self.positions[:, 1] < player_rect.bottom)
+            & (self.directions[:, 1] > 0)
+        )
+        if overlapped.any():
+            indices = np.nonzero(overlapped)[0]
+            self.positions[indices, 1] = player_rect.top - height
+            self._bounce_off_paddle(indices)
+            self.core.play_sound('hit-paddle')
+
+    def _damage_blocks(self, balls, cells):
+        """
+        Damage the blocks hit in one batch.
+
+        Args:
+            balls: The indices of the balls hitting blocks.
+            cells: The blocks hit as flat indices of the cells in the block field.
+        """
+        if len(balls) > 0:
+            rows, columns = np.divmod(cells, self.core.block_field.health.shape[1])
+            self.core.damage_blocks(rows, columns, self.original_strengths[balls] * self.strength_factor)
+
+    def _bounce_off_walls(self):
+        """
+        Bounce the balls off the left, right and top side of the game window.
+        """
+        for axis, low, high in ((0, 0, settings.GAME_WINDOW_WIDTH - self.get_size()[0]), (1, 0, math.inf)):
+            below = self.positions[:, axis] < low
+            above = self.positions[:, axis] > high
+            self.positions[below, axis] = low
+            self.positions[above, axis] = high
+            self.directions[below, axis] = np.abs(self.directions[below, axis])
+            self.directions[above, axis] = -np.abs(self.directions[above, axis])
+
+    def _remove_lost(self):
+        """
+        Remove the balls below the game window. If the last ball in the game is lost, the player looses health
+        and a new ball is put on the paddle.
+        """
+        lost = self.positions[:, 1] > settings.GAME_WINDOW_HEIGHT
+        if not lost.any():
+            return
+        speed, strength = float(self.original_speeds[lost][-1]), int(self.original_strengths[lost][-1])
+        self.positions = self.positions[~lost]
+        self.previous_positions = self.previous_positions[~lost]
+        self.directions = self.directions[~lost]
+        self.original_speeds = self.original_speeds[~lost]
+        self.original_strengths = self.original_strengths[~lost]
+        if len(self) == 0 and len(self.core.balls) == 0:
+            self.core.lose_health()
+            self.core.create_ball(
+                speed=int(speed * self.speed_factor),
+                original_speed=int(speed),
+                strength=strength * self.strength_factor,
+                original_strength=strength,
+                size_factor=self.size_factor,
+                tint=self.tint
+            )
+
+    def update(self, delta_time: (int, float)):
+        """
+        Move all balls and handle their collisions.
+
+        Each ball is swept against the blocks and the paddle, up to settings.MAX_BALL_BOUNCES times in a step.
+        The balls are swept together, so balls hitting a block at the same bounce all bounce off it, even if the
+        first of them destroys it. A destroyed block gets no more damage and is not hit by the next bounces.
+
+        Args:
+            delta_time (int, float): Time passed since last step.
+        """
+        if len(self) == 0:
+            return
+        self._catch_on_paddle()
+
+        distances = self.original_speeds * self.speed_factor * delta_time
+        for _ in range(settings.MAX_BALL_BOUNCES):
+            moving = np.nonzero(distances > 0)[0]
+            if len(moving) == 0:
+                break
+            displacements = self.directions[moving] * distances[moving, None]
+            times, target, normals = self._sweep(self.positions[moving], displacements)
+            hit = np.isfinite(times)
+            times = np.where(hit, times, 1)
+            self.positions[moving] += displacements * times[:, None]
+            distances[moving] = np.where(hit, distances[moving] * (1 - times), 0)
+
+            moving, target, normals = moving[hit], target[hit], normals[hit]
+            flip = normals * self.directions[moving] < 0
+            self.directions[moving] = np.where(flip, -self.directions[moving], self.directions[moving])
+
+            on_paddle = target < 0
+            top_of_paddle = on_paddle & (normals[:, 1] < 0) & (normals[:, 0] == 0)
+            if top_of_paddle.any():
+                self._bounce_off_paddle(moving[top_of_paddle])
+            if on_paddle.any():
+                self.core.play_sound('hit-paddle')
+            self._damage_blocks(moving[~on_paddle], target[~on_paddle])
+
+        self._bounce_off_walls()
+        self._remove_lost()
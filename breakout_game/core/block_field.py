@@ -0,0 +1,292 @@
+"""
+Module describing the block field: the blocks of a level kept in a grid of health values.
+"""
+import numpy as np
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.core.uniform_grid import UniformGrid
+
+
+class BlockField(UniformGrid):
+    """
+    The blocks of a level stored as a grid of health values instead of one sprite per block.
+
+    Each block takes one cell of the uniform grid, laid out the same way as the block map of the level. Empty cells
+    have no health. The rectangles of the blocks are calculated from their cells when needed. The field
+    knows nothing about drawing: the cells changed are recorded for the view to render them again.
+
+    Attributes:
+        cell_width (int, float): The width of a cell. Defaults to the width of a block with the gap.
+        cell_height (int, float): The height of a cell. Defaults to the height of a block with the gap.
+        block_width (int): The width of a block. Defaults to settings.BLOCK_WIDTH.
+        block_height (int): The height of a block. Defaults to settings.BLOCK_HEIGHT.
+        left (int, float): The left side of the blocks in the first column. Defaults to half of the gap.
+        top (int, float): The top side of the blocks in the first row. Defaults to half of the gap.
+        health (np.ndarray): The health of the block in each cell, indexed by (row, column).
+            Zero for empty cells. Defaults to an empty grid until a level is loaded.
+        health_rows (list[list[int]]): The same health as lists, read by the lookups of single balls, which
+            are faster on lists than on arrays.
+        first_row (int): The first row holding blocks. Defaults to 0.
+        last_row (int): The last row holding blocks. Lower than first_row if the field is empty. Defaults to -1.
+        changes (list[None, tuple[int, int]]): The (row, column) of the cells changed since the changes were
+            cleared last. None if the whole field changed. Defaults to an empty list.
+
+    Args:
+        cell_size (None, tuple): The width and height of a cell. Defaults to None.
+            If None, the size of a block with the gap.
+        block_size (None, tuple[int, int]): The width and height of a block. Defaults to None.
+            If None, (settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT).
+        topleft (None, tuple): The top left corner of the block in the first cell. Defaults to None.
+            If None, half of the gap from the corner of the game window.
+
+    version: 1
+    """
+    def __init__(
+            self,
+            cell_size: [None, tuple] = None,
+            block_size: [None, tuple[int, int]] = None,
+            topleft: [None, tuple] = None
+    ):
+        if block_size is None:
+            block_size = (settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT)
+        if cell_size is None:
+            cell_size = (block_size[0] + settings.GAP_SIZE, block_size[1] + settings.GAP_SIZE)
+        if topleft is None:
+            topleft = (settings.GAP_SIZE / 2, settings.GAP_SIZE / 2)
+        super().__init__(cell_size, topleft)
+        self.block_width, self.block_height = block_size
+        self.health: np.ndarray = np.zeros((0, 0), dtype=np.int32)
+        self.health_rows: list[list[int]] = []
+        self.first_row: int = 0
+        self.last_row: int = -1
+        self.changes: list[None, tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.health))
+
+    def load(self, block_map: list[str], level_number: int = 0):
+        """
+        Fill the field from the block map. A digit d puts a block with d * level_number + 1 health in its cell,
+        a space leaves the cell empty.
+
+        Args:
+            block_map (list[str]): The rows of the map.
+            level_number (int): Level number scaling the health of the blocks. Defaults to 0.
+        """
+        self.health = np.zeros((len(block_map), max(len(row) for row in block_map)), dtype=np.int32)
+        for row_index, row in enumerate(block_map):
+            for column_index, symbol in enumerate(row):
+                if symbol != ' ':
+                    self.health[row_index, column_index] = int(symbol) * level_number + 1
+        self.health_rows = self.health.tolist()
+        self.update_rows()
+        self.changes.append(None)
+
+    def clear(self):
+        """
+        Remove all blocks.
+        """
+        self.health[:] = 0
+        self.health_rows = self.health.tolist()
+        self.update_rows()
+        self.changes.append(None)
+
+    def get_snapshot(self) -> np.ndarray:
+        """
+        Get a copy of the health of the blocks, to restore the field later.
+
+        Returns:
+            np.ndarray: The health of the block in each cell.
+        """
+        return self.health.copy()
+
+    def restore_snapshot(self, snapshot: np.ndarray):
+        """
+        Restore the blocks from a snapshot. Only the cells differing from the snapshot are marked as changed,
+        unless the field has another shape.
+
+        Args:
+            snapshot (np.ndarray): The health of the block in each cell from get_snapshot.
+        """
+        if snapshot.shape == self.health.shape:
+            self.changes += [tuple(cell) for cell in np.argwhere(self.health != snapshot).tolist()]
+        else:
+            self.changes.append(None)
+        self.health = snapshot.copy()
+        self.health_rows = self.health.tolist()
+        self.update_rows()
+
+    def update_rows(self):
+        """
+        Find the first and the last row holding blocks. Lookups skip the rows outside them.
+        """
+        rows = np.nonzero(self.health.any(axis=1))[0]
+        self.first_row, self.last_row = (int(rows[0]), int(rows[-1])) if len(rows) > 0 else (0, -1)
+
+    def set_block(self, row: int, column: int, health: int):
+        """
+        Put a block in the cell, replacing the block there.
+
+        Args:
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+            health (int): The health of the block. Zero empties the cell.
+        """
+        self.health[row, column] = health
+        self.health_rows[row][column] = health
+        self.update_rows()
+        self.changes.append((row, column))
+
+    def holds_blocks_between(self, top: (int, float), bottom: (int, float)) -> bool:
+        """
+        Quickly check if any row holding blocks lies between the heights. The rows are checked without
+        looking at single cells.
+
+        Args:
+            top (int, float): The upper height.
+            bottom (int, float): The lower height.
+
+        Returns:
+            bool: True if any row holding blocks lies between the heights.
+        """
+        return (
+            self.first_row <= self.last_row
+            and top < self.top + (self.last_row + 1) * self.cell_height
+            and bottom > self.top + self.first_row * self.cell_height
+        )
+
+    def get_rect(self, row: int, column: int) -> pygame.Rect:
+        """
+        Get the rectangle of the block in the cell.
+
+        Args:
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+
+        Returns:
+            pygame.Rect: The rectangle.
+        """
+        left, top = self.get_cell_topleft(row, column)
+        return pygame.Rect(int(left), int(top), self.block_width, self.block_height)
+
+    def get_rects(self, rows, columns) -> np.ndarray:
+        """
+        Get the rectangles of the blocks in the cells, the same as get_rect.
+
+        Args:
+            rows: The rows of the cells, shape (n,).
+            columns: The columns of the cells, shape (n,).
+
+        Returns:
+            np.ndarray: The rectangles as left, top, width and height, shape (n, 4).
+        """
+        rects = np.empty((len(rows), 4), dtype=int)
+        rects[:, 0] = self.left + np.asarray(columns) * self.cell_width
+        rects[:, 1] = self.top + np.asarray(rows) * self.cell_height
+        rects[:, 2] = self.block_width
+        rects[:, 3] = self.block_height
+        return rects
+
+    def _get_cell_ranges(self, lows, highs) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the cells covered by areas, clipped to the field.
+
+        Args:
+            lows: The top left corners of the areas, shape (n, 2).
+            highs: The bottom right corners of the areas, shape (n, 2).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The first and the last column and row of each area, shape (n, 2).
+                The last are one lower than the first for areas outside the field.
+        """
+        first, last = self.get_cell_ranges(lows, highs)
+        first = np.maximum(first, 0)
+        last = np.minimum(last, np.array(self.health.shape[::-1]) - 1)
+        return first, np.maximum(last, first - 1)
+
+    def query(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        """
+        Get the blocks in the cells covered by the rectangle. The blocks may lie near the rectangle
+        without touching it.
+
+        Args:
+            rect (pygame.Rect): The area.
+
+        Returns:
+            list[tuple[int, int]]: The (row, column) of each block, row by row.
+        """
+        first_row, last_row, first_column, last_column = self.get_cell_range(rect)
+        first_row, last_row = max(first_row, self.first_row), min(last_row, self.last_row)
+        if first_row > last_row:
+            return []
+        first_column, last_column = max(first_column, 0), min(last_column, len(self.health_rows[0]) - 1)
+        cells = []
+        for row in range(first_row, last_row + 1):
+            health_row = self.health_rows[row]
+            for column in range(first_column, last_column + 1):
+                if health_row[column]:
+                    cells.append((row, column))
+        return cells
+
+    def query_areas(self, lows, highs) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the blocks in the cells covered by each of many areas at once.
+
+        Args:
+            lows: The top left corners of the areas, shape (n, 2).
+            highs: The bottom right corners of the areas, shape (n, 2).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The index of the area, the row and the column of each
+                pair of an area and a block.
+        """
+        first, last = self._get_cell_ranges(lows, highs)
+        spans = last - first + 1
+        areas, rows, columns = [], [], []
+        # Areas span a few cells, so the cells are visited by their offset from the first cell of each area
+        for row_offset in range(int(spans[:, 1].max(initial=0))):
+            for column_offset in range(int(spans[:, 0].max(initial=0))):
+                inside = np.nonzero((spans[:, 0] > column_offset) & (spans[:, 1] > row_offset))[0]
+                area_rows = first[inside, 1] + row_offset
+                area_columns = first[inside, 0] + column_offset
+                occupied = self.health[area_rows, area_columns] > 0
+                areas.append(inside[occupied])
+                rows.append(area_rows[occupied])
+                columns.append(area_columns[occupied])
+        if not areas:
+            return np.empty(0, dtype=int), np.empty(0, dtype=int), np.empty(0, dtype=int)
+        return np.concatenate(areas), np.concatenate(rows), np.concatenate(columns)
+
+    def damage(self, rows, columns, amounts) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Damage the blocks in the cells. A block gets no more damage than its health, cells hit several times
+        take the sum of the damage.
+
+        Args:
+            rows: The rows of the cells hit, shape (n,).
+            columns: The columns of the cells hit, shape (n,).
+            amounts: The damage dealt to each cell, shape (n,).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The blocks hit as flat indices of the cells, the damage
+                dealt to each of them and whether each of them is broken. Blocks dealt no damage are left out.
+        """
+        if len(rows) == 0:
+            return np.empty(0, dtype=int), np.empty(0, dtype=np.int32), np.empty(0, dtype=bool)
+        cells, inverse = np.unique(np.ravel_multi_index((rows, columns), self.health.shape), return_inverse=True)
+        amounts = np.bincount(inverse.ravel(), weights=amounts).astype(np.int32)
+        health = self.health.flat[cells]
+        dealt = np.minimum(amounts, health)
+        hit = dealt > 0
+        cells, health, dealt = cells[hit], health[hit] - dealt[hit], dealt[hit]
+        self.health.flat[cells] = health
+        columns_count = self.health.shape[1]
+        for cell, cell_health in zip(cells.tolist(), health.tolist()):
+            row, column = divmod(cell, columns_count)
+            self.health_rows[row][column] = cell_health
+            self.changes.append((row, column))
+        broken = health == 0
+        if broken.any():
+            self.update_rows()
+        return cells, dealt, broken
@@ -0,0 +1,120 @@
+"""
+Module describing the plain state of the paddle and the falling powerups.
+"""
+import pygame
+
+from breakout_game.config import settings
+
+
+class PaddleState:
+    """
+    The paddle moved by the player.
+
+    Attributes:
+        x (float): The left side of the paddle.
+        y (int): The top side of the paddle.
+        width (int): The width of the paddle.
+        height (int): The height of the paddle.
+        original_width (int): The width of the paddle without powerups.
+        speed (float): Speed of movement. Defaults to settings.DEFAULT_PADDLE_SPEED.
+        direction (int): The direction of the last movement: -1 to the left, 1 to the right and 0 if the paddle
+            stood still. Defaults to 0.
+
+    Args:
+        width (int): The width of the paddle.
+        height (int): The height of the paddle.
+        midbottom (tuple): The middle bottom position of the paddle. Must be a tuple of (x, y).
+
+    version: 1
+    """
+    def __init__(self, width: int, height: int, midbottom: tuple):
+        self.width: int = width
+        self.height: int = height
+        self.original_width: int = width
+        self.x: float = midbottom[0] - width // 2
+        self.y: int = midbottom[1] - height
+        self.speed: float = settings.DEFAULT_PADDLE_SPEED
+        self.direction: int = 0
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """
+        The rectangle of the paddle on the screen.
+
+        Returns:
+            pygame.Rect: The rectangle.
+        """
+        return pygame.Rect(round(self.x), self.y, self.width, self.height)
+
+    def move(self, direction: int, delta_time: (int, float)):
+        """
+        Move the paddle and keep it inside the game window.
+
+        Args:
+            direction (int): -1 to move to the left, 1 to the right, 0 to stand still.
+            delta_time (int, float): Time passed since last step.
+        """
+        self.direction = direction
+        self.x += direction * self.speed * delta_time
+        if round(self.x) + self.width > settings.GAME_WINDOW_WIDTH:
+            self.x = settings.GAME_WINDOW_WIDTH - self.width
+        self.x = max(self.x, 0)
+
+    def resize(self, width: int):
+        """
+        Change the width of the paddle. The paddle keeps its center.
+
+        Args:
+            width (int): New width. The original width restores the original size.
+        """
+        rect = self.rect
+        new_rect = pygame.Rect(0, 0, width, self.height)
+        new_rect.center = rect.center
+        self.x = new_rect.x
+        self.width = width
+
+
+class PowerUpState:
+    """
+    A powerup falling from a broken block.
+
+    Attributes:
+        power (str): The name of the powerup.
+        x (int): The left side of the powerup.
+        y (float): The top side of the powerup.
+        width (int): The width of the powerup. Defaults to settings.POWERUP_WIDTH.
+        height (int): The height of the powerup. Defaults to settings.POWERUP_HEIGHT.
+        speed (float): Speed of the fall. Defaults to settings.DEFAULT_POWERUP_SPEED.
+
+    Args:
+        power (str): The name of the powerup.
+        center (tuple): The center of the powerup. Must be a tuple of (x, y).
+
+    version: 1
+    """
+    def __init__(self, power: str, center: tuple):
+        self.power: str = power
+        self.width: int = settings.POWERUP_WIDTH
+        self.height: int = settings.POWERUP_HEIGHT
+        self.x: int = center[0] - self.width // 2
+        self.y: float = center[1] - self.height // 2
+        self.speed: float = settings.DEFAULT_POWERUP_SPEED
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """
+        The rectangle of the powerup on the screen.
+
+        Returns:
+            pygame.Rect: The rectangle.
+        """
+        return pygame.Rect(self.x, round(self.y), self.width, self.height)
+
+    def fall(self, delta_time: (int, float)):
+        """
+        Move the powerup down.
+
+        Args:
+            delta_time (int, float): Time passed since last step.
+        """
+        self.y += self.speed * delta_time
@@ -0,0 +1,349 @@
+"""
+Module describing the game core: the rules of the game over plain numeric state, without any rendering.
+"""
+import math
+import random
+import struct
+import zlib
+
+from breakout_game.config import settings
+from breakout_game.core.ball import BallState
+from breakout_game.core.ball_swarm import BallSwarm
+from breakout_game.core.block_field import BlockField
+from breakout_game.core.entities import PaddleState, PowerUpState
+from breakout_game.core.powerup_manager import PowerUpManager
+
+# Inputs of a step. Combined with |.
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_LAUNCH = 4
+
+
+def restore_states(objects: list, states: list[dict], state_class: type) -> list:
+    """
+    Restore objects of the game from their attributes in a snapshot. The objects present are reused, so their
+    views are kept, and the missing objects are created without running their constructor.
+
+    Args:
+        objects (list): The objects present, such as the balls.
+        states (list[dict]): The attributes of each object in the snapshot.
+        state_class (type): The class of the objects, such as BallState.
+
+    Returns:
+        list: The objects restored.
+    """
+    restored = objects[:len(states)]
+    restored += [state_class.__new__(state_class) for _ in range(len(states) - len(restored))]
+    for restored_object, state in zip(restored, states):
+        vars(restored_object).update(state)
+    return restored
+
+
+class GameCore:
+    """
+    The simulation of the game. Holds the paddle, balls, blocks, powerups, timers and the score as plain
+    data and steps them by the inputs of the player.
+
+    The core knows nothing about images, sounds or the display. Views read its state after each step and
+    play the sounds of the events it records, so the core alone can be stepped as fast as the CPU allows.
+
+    Attributes:
+        time (float): The time of the game in seconds. Only advanced by steps, so pauses do not count.
+            Defaults to 0.
+        level (int): The level played. Defaults to 0.
+        level_difficulty (int): The difficulty of the game. Defaults to 0.
+        score (int): The score of the player. Defaults to 0.
+        health (int): The health of the player. Defaults to settings.MAX_PLAYER_HEALTH.
+        lives_lost (int): The number of times the player lost health. Defaults to 0.
+        powerups_taken (dict[str, int]): The number of powerups caught by the player by their name.
+            Defaults to an empty dict.
+        paddle (None, PaddleState): The paddle. Defaults to None. Created with the first level.
+        balls (list[BallState]): The single balls in the game. Defaults to an empty list.
+        powerups (list[PowerUpState]): The powerups falling. Defaults to an empty list.
+        block_field (BlockField): The blocks of the level.
+        ball_swarm (BallSwarm): The extra balls of the multiply-balls powerup kept in arrays.
+        powerup_manager (PowerUpManager): Activates the powerups and handles their timers.
+        sounds (list[str]): The names of the sounds of the events in the last step. Defaults to an empty list.
+        rng (random.Random): The random generator of every random decision of the game.
+
+    Args:
+        rng (None, random.Random): The random generator of the game. Defaults to None.
+            If None, a generator seeded by the operating system is used.
+
+    version: 1
+    """
+    def __init__(self, rng: [None, random.Random] = None):
+        self.time: float = 0.0
+        self.level: int = 0
+        self.level_difficulty: int = 0
+        self.score: int = 0
+        self.health: int = settings.MAX_PLAYER_HEALTH
+        self.lives_lost: int = 0
+        self.powerups_taken: dict[str, int] = {}
+
+        self.paddle: [None, PaddleState] = None
+        self.balls: list[BallState] = []
+        self.powerups: list[PowerUpState] = []
+        self.block_field: BlockField = BlockField()
+        self.ball_swarm: BallSwarm = BallSwarm(self)
+        self.powerup_manager: PowerUpManager = PowerUpManager(self)
+
+        self.sounds: list[str] = []
+        self.rng: random.Random = rng if rng is not None else random.Random()
+
+    @property
+    def level_finished(self) -> bool:
+        """
+        Whether all blocks of the level are destroyed.
+
+        Returns:
+            bool: True if no blocks are left.
+        """
+        # The field is empty when no row holds blocks, which is known without counting the blocks
+        return self.block_field.first_row > self.block_field.last_row
+
+    def get_state_hash(self) -> int:
+        """
+        Get a checksum of the state of the game, to tell whether two runs of the game are still the same.
+        Sounds, views and the random generator are not included. A game without a level yet has no paddle,
+        which is hashed as a paddle at x = -1 with no width.
+
+        Returns:
+            int: The CRC-32 checksum of the state.
+        """
+        state = [self.time, self.level, self.level_difficulty, self.score, self.health]
+        state += [self.paddle.x, self.paddle.width] if self.paddle is not None else [-1, 0]
+        for ball in self.balls:
+            state += [ball.x, ball.y, ball.direction_x, ball.direction_y, ball.speed, ball.strength, ball.width,
+                      ball.active]
+        for powerup in self.powerups:
+            state += [powerup.x, powerup.y]
+        checksum = zlib.crc32(struct.pack(f'<{len(state)}d', *state))
+        checksum = zlib.crc32(' '.join(powerup.power for powerup in self.powerups).encode(), checksum)
+        checksum = zlib.crc32(self.block_field.health.tobytes(), checksum)
+        checksum = zlib.crc32(self.ball_swarm.positions.tobytes(), checksum)
+        return zlib.crc32(self.ball_swarm.directions.tobytes(), checksum)
+
+    def get_snapshot(self) -> dict:
+        """
+        Get a copy of the whole state of the game as plain data: numbers, strings, lists, dicts and NumPy
+        arrays. A snapshot can be restored any number of times and pickled to suspend the game to disk.
+
+        Returns:
+            dict: The state of the game.
+        """
+        return {
+            'time': self.time,
+            'level': self.level,
+            'level_difficulty': self.level_difficulty,
+            'score': self.score,
+            'health': self.health,
+            'lives_lost': self.lives_lost,
+            'powerups_taken': dict(self.powerups_taken),
+            'rng': self.rng.getstate(),
+            'paddle': dict(vars(self.paddle)) if self.paddle is not None else None,
+            'balls': [dict(vars(ball)) for ball in self.balls],
+            'powerups': [dict(vars(powerup)) for powerup in self.powerups],
+            'block_field': self.block_field.get_snapshot(),
+            'ball_swarm': self.ball_swarm.get_snapshot(),
+            'powerup_manager': self.powerup_manager.get_snapshot()
+        }
+
+    def restore_snapshot(self, snapshot: dict):
+        """
+        Restore the state of the game from a snapshot. The objects of the game are restored in place as far as
+        they are present, the missing ones are created again.
+
+        Args:
+            snapshot (dict): The state of the game from get_snapshot.
+        """
+        self.time = snapshot['time']
+        self.level = snapshot['level']
+        self.level_difficulty = snapshot['level_difficulty']
+        self.score = snapshot['score']
+        self.health = snapshot['health']
+        self.lives_lost = snapshot['lives_lost']
+        self.powerups_taken = dict(snapshot['powerups_taken'])
+        self.rng.setstate(snapshot['rng'])
+        if snapshot['paddle'] is None:
+            self.paddle = None
+        else:
+            paddles = [self.paddle] if self.paddle is not None else []
+            self.paddle = restore_states(paddles, [snapshot['paddle']], PaddleState)[0]
+        self.balls = restore_states(self.balls, snapshot['balls'], BallState)
+        self.powerups = restore_states(self.powerups, snapshot['powerups'], PowerUpState)
+        self.block_field.restore_snapshot(snapshot['block_field'])
+        self.ball_swarm.restore_snapshot(snapshot['ball_swarm'])
+        self.powerup_manager.restore_snapshot(snapshot['powerup_manager'])
+        self.sounds.clear()
+
+    def init_level(self, level_number: int = 0, level_difficulty: int = 0):
+        """
+        Initialize the level. The paddle, score and health are kept from the previous level.
+
+        Args:
+            level_number (int): Level number scaling the health of the blocks. Defaults to 0.
+            level_difficulty (int): Level difficulty. Defaults to 0.
+        """
+        self.level = level_number
+        self.level_difficulty = level_difficulty
+        self.block_field.load(settings.BLOCK_MAP, level_number)
+        if self.paddle is None:
+            self.paddle = PaddleState(
+                width=int(settings.PADDLE_WIDTH // (level_difficulty + 1)),
+                height=settings.PADDLE_HEIGHT,
+                midbottom=(settings.GAME_WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT - 20)
+            )
+        self.create_ball(speed=int(settings.DEFAULT_BALL_SPEED + level_difficulty * settings.DEFAULT_BALL_SPEED / 2))
+
+    def clear_level(self):
+        """
+        Remove the balls and the powerups at the end of a level.
+        """
+        self.balls.clear()
+        self.ball_swarm.clear()
+        self.powerups.clear()
+
+    def create_ball(
+            self,
+            midbottom: [None, tuple] = None,
+            angle_radians: (int, float) = math.pi / 2,
+            speed: (int, float) = settings.DEFAULT_BALL_SPEED,
+            **attributes
+    ) -> BallState:
+        """
+        Add a ball to the game. Used when a level starts and by the multiply-balls powerup.
+
+        Args:
+            midbottom (None, tuple): the midbottom position of the ball. Must be a tuple of (x, y).
+                Defaults to None. If None, the middle top of the paddle is used.
+            angle_radians (int, float): The angle in radians to set the direction.
+                Defaults to math.pi / 2 (90 degrees).
+            speed (int, float): The speed of the ball. Defaults to default speed provided in settings
+            **attributes: other attributes of the ball, such as its strength or size factor.
+
+        Returns:
+            BallState: The ball created.
+        """
+        if midbottom is None:
+            midbottom = self.paddle.rect.midtop
+        ball = BallState(midbottom=midbottom, speed=speed, angle_radians=angle_radians)
+        for name, value in attributes.items():
+            setattr(ball, name, value)
+        if ball.size_factor != 1:
+            ball.change_size_factor(ball.size_factor)
+        self.balls.append(ball)
+        return ball
+
+    def play_sound(self, name: str):
+        """
+        Record the sound of an event for the view to play.
+
+        Args:
+            name (str): The name of the sound. Available names are listed in settings.
+        """
+        self.sounds.append(name)
+
+    def lose_health(self):
+        """
+        Make player loose health.
+        """
+        if self.health >= 1:
+            self.health -= 1
+            self.lives_lost += 1
+            self.score -= 200
+            self.play_sound('lost-hp')
+
+    def add_health(self):
+        """
+        Add health to the player.
+        """
+        if self.health < settings.MAX_PLAYER_HEALTH:
+            self.health += 1
+
+    def damage_blocks(self, rows, columns, amounts):
+        """
+        Damage the blocks in the cells in one batch. Every point of damage scores, breaking a block scores more.
+        One sound is played for all blocks hit and the blocks broken drop powerups.
+
+        Args:
+            rows: The rows of the cells hit, shape (n,).
+            columns: The columns of the cells hit, shape (n,).
+            amounts: The damage dealt to each cell, shape (n,).
+        """
+        cells, dealt, broken = self.block_field.damage(rows, columns, amounts)
+        if len(cells) == 0:
+            return
+        broken_count = int(broken.sum())
+        self.score += (10 * (int(dealt.sum()) - broken_count) + 30 * broken_count) * (self.level_difficulty + 1)
+        self.play_sound('break-blocks' if broken_count > 0 else 'hit-blocks')
+        columns_count = self.block_field.health.shape[1]
+        for cell in cells[broken].tolist():
+            self.drop_powerup(self.block_field.get_rect(*divmod(cell, columns_count)).center)
+
+    def drop_powerup(self, center: tuple):
+        """
+        Drop the powerup from a block broken.
+
+        Args:
+            center (tuple): The center of the block. Must be a tuple of (x, y).
+        """
+        random_number = self.rng.random()
+        potential_powers = []
+        for power in settings.POWERS.keys():
+            if random_number <= settings.POWERS[power]['probability']:
+                potential_powers.append(power)
+        if len(potential_powers) > 0:
+            self.powerups.append(PowerUpState(self.rng.choice(potential_powers), center))
+
+    def update_powerups(self, delta_time: (int, float)):
+        """
+        Move the falling powerups. Powerups caught by the paddle are activated, powerups below the game window
+        are removed.
+
+        Args:
+            delta_time (int, float): Time passed since last step.
+        """
+        paddle_rect = self.paddle.rect
+        for powerup in list(self.powerups):
+            rect = powerup.rect
+            if rect.top > settings.GAME_WINDOW_HEIGHT:
+                self.powerups.remove(powerup)
+            elif rect.colliderect(paddle_rect):
+                self.powerup_manager.activate_powerup(powerup.power)
+                self.powerups_taken[powerup.power] = self.powerups_taken.get(powerup.power, 0) + 1
+                self.score += 100 * (self.level_difficulty + 1)
+                self.play_sound('get-powerup')
+                self.powerups.remove(powerup)
+            else:
+                powerup.fall(delta_time)
+
+    def step(self, delta_time: (int, float), inputs: int = 0):
+        """
+        Advance the game by one step.
+
+        Args:
+            delta_time (int, float): The time of the step in seconds.
+            inputs (int): The inputs of the player combined from INPUT_LEFT, INPUT_RIGHT and INPUT_LAUNCH.
+                Defaults to no input. Right wins if both directions are given.
+        """
+        self.sounds.clear()
+        self.block_field.changes.clear()
+        self.time += delta_time
+
+        self.powerup_manager.update()
+        if inputs & INPUT_RIGHT:
+            direction = 1
+        elif inputs & INPUT_LEFT:
+            direction = -1
+        else:
+            direction = 0
+        self.paddle.move(direction, delta_time)
+
+        launch = bool(inputs & INPUT_LAUNCH)
+        for ball in list(self.balls):
+            ball.update(self, delta_time, launch)
+        if self.ball_swarm.positions.shape[0] > 0:
+            self.ball_swarm.update(delta_time)
+        if self.powerups:
+            self.update_powerups(delta_time)
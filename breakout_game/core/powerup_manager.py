@@ -3,20 +3,21 @@ Module describing Powerup Manager and Timer.
 """
 from __future__ import annotations
 
-import time
 import math
 import logging
 
 from typing import TYPE_CHECKING
 
-import pygame
 from breakout_game.config import settings
 
 if TYPE_CHECKING:
-    from breakout_game.sprites.sprite_manager import SpriteManager
+    from breakout_game.core.game_core import GameCore
 
 game_logger = logging.getLogger('')
 
+# The timers of the powerups lasting for a while
+TIMER_NAMES = ('ball_size_timer', 'ball_speed_timer', 'ball_strength_timer', 'paddle_size_timer')
+
 
 class PowerUpTimer:
     """
@@ -27,6 +28,7 @@ class PowerUpTimer:
         current_time (None, float, int): The current time of the timer. Defaults to None.
         duration (None, float, int): Duration of timer set. Defaults to None.
         active (bool): If the timer is active. Defaults to False.
+        power (None, str): The name of the powerup the timer was started for. Defaults to None.
 
     version: 1
     """
@@ -37,46 +39,48 @@ class PowerUpTimer:
 
         self.duration: [None, float, int] = None
         self.active: bool = False
+        self.power: [None, str] = None
 
-    def start(self, duration: int):
+    def start(self, duration: int, current_time: float, power: [None, str] = None):
         """
         Start the timer
 
         Args:
             duration (int): The amount of seconds for a powerup to be active.
+            current_time (float): The time of the game.
+            power (None, str): The name of the powerup. Defaults to None.
         """
-        current_time = time.time()
-
         self.start_time, self.current_time = current_time, current_time
         self.duration = duration
         self.active = True
+        self.power = power
 
-    def update(self, time_in_pause: float = 0):
+    def update(self, current_time: float):
         """
         Update timer with time passed since the activation.
 
         Args:
-            time_in_pause (float): The amount of time during which the program was on pause. Default is 0.
+            current_time (float): The time of the game.
         """
         if self.active:
-            self.start_time += time_in_pause
-            self.current_time = time.time()
+            self.current_time = current_time
 
             if self.current_time - self.start_time > self.duration:
                 self.active = False
-                self.duration, self.start_time, self.current_time = (None, None, None)
+                self.duration, self.start_time, self.current_time, self.power = (None, None, None, None)
 
 
 class PowerUpManager:
     """
     Handles the powerups. Stores active powerups, activates and deactivates
-    them, handles powerup timers.
+    them, handles powerup timers. Timers count the time of the game, so they stand still while the game
+    is paused.
 
     Args:
-        sprite_manager
+        core (GameCore): The game the powerups act on.
     """
-    def __init__(self, sprite_manager: SpriteManager):
-        self.sprite_manager = sprite_manager
+    def __init__(self, core: GameCore):
+        self.core = core
 
         self.trigger_methods = {
             'add-life': self.activate_add_life,
@@ -97,6 +101,30 @@ class PowerUpManager:
         self.ball_strength_timer = PowerUpTimer()
         self.paddle_size_timer = PowerUpTimer()
 
+    def get_snapshot(self) -> dict:
+        """
+        Get a copy of the active powerups and the timers, to restore them later.
+
+        Returns:
+            dict: The names of the active powerups and the state of each timer.
+        """
+        return {
+            'active_powerups': list(self.active_powerups),
+            'timers': {name: dict(vars(getattr(self, name))) for name in TIMER_NAMES}
+        }
+
+    def restore_snapshot(self, snapshot: dict):
+        """
+        Restore the active powerups and the timers from a snapshot. The timers are restored in place, so the
+        views of the timers stay attached to them.
+
+        Args:
+            snapshot (dict): The state of the powerups from get_snapshot.
+        """
+        self.active_powerups = list(snapshot['active_powerups'])
+        for name, timer in snapshot['timers'].items():
+            vars(getattr(self, name)).update(timer)
+
     def activate_powerup(self, power: str):
         """
         Activate powerup attached to the power name provided in input.
@@ -117,49 +145,43 @@ class PowerUpManager:
         Add life to the player
         """
         game_logger.info('Activating add-life powerup')
-        self.sprite_manager.player_sprites_group.sprites()[0].add_health()
+        self.core.add_health()
 
     def activate_big_ball(self, start_timer: bool = True):
         """
         Increase the size of all balls in game by a factor of 1.5 to the original size
 
+        Note:
+            The tint of the balls is kept.
+
         Args:
             start_timer (bool): if true, start timer. Defaults to True.
         """
         game_logger.info('Activating big-ball powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-
-            new_width = round(ball.original_width * 1.5)
-            new_height = round(ball.original_width * 1.5)
-            ball.change_size(new_width, new_height)
-
-            # To restore the original look.
-            if 'super-ball' in self.active_powerups:
-                self.activate_super_ball(start_timer=False)
+        for ball in self.core.balls:
+            ball.change_size_factor(1.5)
+        self.core.ball_swarm.change_size_factor(1.5)
 
         if start_timer:
-            self.ball_size_timer.start(settings.BALL_SIZE_DURATION)
+            self.ball_size_timer.start(settings.BALL_SIZE_DURATION, self.core.time, 'big-ball')
 
     def activate_small_ball(self, start_timer: bool = True):
         """
         Decrease the size of all balls in game by a factor of 0.5 to the original size
 
+        Note:
+            The tint of the balls is kept.
+
         Args:
             start_timer (bool): if true, start timer. Defaults to True.
         """
         game_logger.info('Activating small-ball powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-
-            new_width = round(ball.original_width * 0.5)
-            new_height = round(ball.original_height * 0.5)
-            ball.change_size(new_width, new_height)
-
-            # To restore the original look.
-            if 'super-ball' in self.active_powerups:
-                self.activate_super_ball(start_timer=False)
+        for ball in self.core.balls:
+            ball.change_size_factor(0.5)
+        self.core.ball_swarm.change_size_factor(0.5)
 
         if start_timer:
-            self.ball_size_timer.start(settings.BALL_SIZE_DURATION)
+            self.ball_size_timer.start(settings.BALL_SIZE_DURATION, self.core.time, 'small-ball')
 
     def activate_fast_ball(self, start_timer: bool = True):
         """
@@ -169,11 +191,12 @@ class PowerUpManager:
             start_timer (bool): if true, start timer. Defaults to True.
         """
         game_logger.info('Activating fast-ball powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-            ball.change_speed(int(ball.original_speed * 2))
+        for ball in self.core.balls:
+            ball.speed = int(ball.original_speed * 2)
+        self.core.ball_swarm.change_speed_factor(2)
 
         if start_timer:
-            self.ball_speed_timer.start(settings.BALL_SPEED_DURATION)
+            self.ball_speed_timer.start(settings.BALL_SPEED_DURATION, self.core.time, 'fast-ball')
 
     def activate_slow_ball(self, start_timer=True):
         """
@@ -183,11 +206,12 @@ class PowerUpManager:
             start_timer (bool): if true, start timer. Defaults to True.
         """
         game_logger.info('Activating slow-ball powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-            ball.change_speed(int(ball.original_speed * 0.5))
+        for ball in self.core.balls:
+            ball.speed = int(ball.original_speed * 0.5)
+        self.core.ball_swarm.change_speed_factor(0.5)
 
         if start_timer:
-            self.ball_speed_timer.start(settings.BALL_SPEED_DURATION)
+            self.ball_speed_timer.start(settings.BALL_SPEED_DURATION, self.core.time, 'slow-ball')
 
     def activate_multiple_balls(self):
         """
@@ -196,12 +220,18 @@ class PowerUpManager:
         The first ball created has a direction of -135 degrees to the x-axis
         The second ball created has a direction of -45 degrees to the x-axis
 
-        All necessary attributes of the original ball are passed to new ones.
+        All necessary attributes of the original ball, its size and tint included, are passed to new ones.
+
+        Note:
+            If the ball swarm is enabled, the new balls are added to the swarm, up to settings.MAX_SWARM_BALLS.
+            Otherwise single balls are created while there are no more than 20 balls.
         """
         game_logger.info('Activating multiply-balls powerup')
-        balls_in_game = self.sprite_manager.ball_sprites_group.sprites()
+        balls_in_game = list(self.core.balls)
 
-        if len(balls_in_game) <= 20:
+        if self.core.ball_swarm.enabled:
+            self.core.ball_swarm.multiply(balls_in_game, [math.radians(-135), math.radians(-45)])
+        elif len(balls_in_game) <= 20:
             for ball in balls_in_game:
 
                 left_angle = math.radians(-135)
@@ -210,47 +240,38 @@ class PowerUpManager:
                 ball_kwargs = {
                     'speed': ball.speed,
                     'original_speed': ball.original_speed,
-                    'original_width': ball.original_width,
-                    'original_height': ball.original_height,
                     'strength': ball.strength,
                     'original_strength': ball.original_strength,
                     'active': True,
-                    'big_ball': False,
-                    'small_ball': False,
-                    'fast_ball': False,
-                    'slow_ball': False,
-                    'super_ball': False,
+                    'size_factor': ball.size_factor,
+                    'tint': ball.tint,
                 }
                 for angle in [left_angle, right_angle]:
-                    self.sprite_manager.create_ball(
-                        ball_image=ball.image,
-                        midbottom=ball.original_rect.midbottom,
+                    self.core.create_ball(
+                        midbottom=ball.origin,
                         angle_radians=angle,
                         **ball_kwargs
                     )
 
-                # Change sizes of balls if powerups are active.
-                if 'big-ball' in self.active_powerups:
-                    self.activate_big_ball(start_timer=False)
-                if 'small-ball' in self.active_powerups:
-                    self.activate_small_ball(start_timer=False)
-
     def activate_super_ball(self, start_timer=True):
         """
         Increase the strength of all balls in game by a factor of 2 to the original strength
 
         Note:
-            All affected balls are + 125 red.
+            All affected balls are + 125 red. The size of the balls is kept.
 
         Args:
             start_timer (bool): if true, start timer. Defaults to True.
         """
         game_logger.info('Activating super-ball powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-            ball.change_strength(int(ball.original_strength * 2))
-            ball.image.fill((125, 0, 0), special_flags=pygame.BLEND_RGB_ADD)  # pylint: disable=E1101
-            if start_timer:
-                self.ball_strength_timer.start(settings.BALL_STRENGTH_DURATION)
+        for ball in self.core.balls:
+            ball.strength = int(ball.original_strength * 2)
+            ball.tint = (125, 0, 0)
+        self.core.ball_swarm.change_strength_factor(2)
+        self.core.ball_swarm.change_tint((125, 0, 0))
+
+        if start_timer:
+            self.ball_strength_timer.start(settings.BALL_STRENGTH_DURATION, self.core.time, 'super-ball')
 
     def activate_big_paddle(self, start_timer=True):
         """
@@ -260,15 +281,11 @@ class PowerUpManager:
             start_timer (bool): if true, start timer. Defaults to True.
         """
         game_logger.info('Activating big-paddle powerup')
-        for player in self.sprite_manager.player_sprites_group.sprites():
-            original_width = player.original_width
-            original_height = player.original_height
-            new_paddle_width = int(original_width * 2)
-
-            player.change_size(new_paddle_width, original_height)
+        paddle = self.core.paddle
+        paddle.resize(int(paddle.original_width * 2))
 
         if start_timer:
-            self.paddle_size_timer.start(settings.PADDLE_SIZE_DURATION)
+            self.paddle_size_timer.start(settings.PADDLE_SIZE_DURATION, self.core.time, 'big-paddle')
 
     def activate_small_paddle(self, start_timer=True):
         """
@@ -278,22 +295,18 @@ class PowerUpManager:
             start_timer (bool): if true, start timer. Defaults to True.
         """
         game_logger.info('Activating small paddle')
-        for player in self.sprite_manager.player_sprites_group.sprites():
-            original_width = player.original_width
-            original_height = player.original_height
-            new_paddle_width = int(original_width * 0.5)
-            player.change_size(new_paddle_width, original_height)
+        paddle = self.core.paddle
+        paddle.resize(int(paddle.original_width * 0.5))
 
         if start_timer:
-            self.paddle_size_timer.start(settings.PADDLE_SIZE_DURATION)
+            self.paddle_size_timer.start(settings.PADDLE_SIZE_DURATION, self.core.time, 'small-paddle')
 
     def deactivate_paddle_size(self):
         """
         Deactivate powerups related to the size of the paddle and restores its size.
         """
         game_logger.info('Deactivating paddle size powerup')
-        for player in self.sprite_manager.player_sprites_group.sprites():
-            player.restore_size()
+        self.core.paddle.resize(self.core.paddle.original_width)
         for power in ['big-paddle', 'small-paddle']:
             if power in self.active_powerups:
                 self.active_powerups.remove(power)
@@ -303,8 +316,9 @@ class PowerUpManager:
         Deactivate powerups related to the size of balls in the game and restores their size.
         """
         game_logger.info('Deactivating ball size powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-            ball.restore_size()
+        for ball in self.core.balls:
+            ball.change_size_factor(1)
+        self.core.ball_swarm.change_size_factor(1)
         for power in ['big-ball', 'small-ball']:
             if power in self.active_powerups:
                 self.active_powerups.remove(power)
@@ -314,8 +328,9 @@ class PowerUpManager:
         Deactivate powerups related to the speed of balls in the game and restores their speed.
         """
         game_logger.info('Deactivating ball speed powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-            ball.restore_speed()
+        for ball in self.core.balls:
+            ball.speed = ball.original_speed
+        self.core.ball_swarm.change_speed_factor(1)
         for power in ['fast-ball', 'slow-ball']:
             if power in self.active_powerups:
                 self.active_powerups.remove(power)
@@ -328,39 +343,35 @@ class PowerUpManager:
             All affected balls are restored in color.
         """
         game_logger.info('Deactivating ball strength powerup')
-        for ball in self.sprite_manager.ball_sprites_group.sprites():
-            ball.restore_strength()
-            ball.restore_image()
-            if 'big-ball' in self.active_powerups:
-                self.activate_big_ball(start_timer=False)
-            if 'small-ball' in self.active_powerups:
-                self.activate_small_ball(start_timer=False)
+        for ball in self.core.balls:
+            ball.strength = ball.original_strength
+            ball.tint = None
+        self.core.ball_swarm.change_strength_factor(1)
+        self.core.ball_swarm.change_tint(None)
         if 'super-ball' in self.active_powerups:
             self.active_powerups.remove('super-ball')
 
-    def update(self, time_in_pause: float = 0):
+    def update(self):
         """
         Update timers according to the duration of powerups, deactivate powerups if needed.
-
-        Args:
-            time_in_pause (float): time spent in pause to correct timers. Defaults to 0.
         """
+        current_time = self.core.time
         if self.paddle_size_timer.active:
-            self.paddle_size_timer.update(time_in_pause)
+            self.paddle_size_timer.update(current_time)
             if not self.paddle_size_timer.active:
                 self.deactivate_paddle_size()
 
         if self.ball_size_timer.active:
-            self.ball_size_timer.update(time_in_pause)
+            self.ball_size_timer.update(current_time)
             if not self.ball_size_timer.active:
                 self.deactivate_ball_size()
 
         if self.ball_speed_timer.active:
-            self.ball_speed_timer.update(time_in_pause)
+            self.ball_speed_timer.update(current_time)
             if not self.ball_speed_timer.active:
                 self.deactivate_ball_speed()
 
         if self.ball_strength_timer.active:
-            self.ball_strength_timer.update(time_in_pause)
+            self.ball_strength_timer.update(current_time)
             if not self.ball_strength_timer.active:
                 self.deactivate_ball_strength()
@@ -0,0 +1,100 @@
+"""
+Module describing the uniform grid: the spatial index mapping areas of the game window to cells.
+"""
+import math
+
+import numpy as np
+import pygame
+
+
+class UniformGrid:
+    """
+    A grid of cells of the same size over the game window. The cells covered by an area are found from its
+    corners alone, so a lookup costs the same no matter how many cells hold something.
+
+    Attributes:
+        cell_width (int, float): The width of a cell.
+        cell_height (int, float): The height of a cell.
+        left (int, float): The left side of the first column.
+        top (int, float): The top side of the first row.
+
+    Args:
+        cell_size (tuple): The width and height of a cell.
+        topleft (tuple): The top left corner of the first cell. Defaults to (0, 0).
+
+    version: 1
+    """
+    def __init__(self, cell_size: tuple, topleft: tuple = (0, 0)):
+        self.cell_width, self.cell_height = cell_size
+        self.left, self.top = topleft
+
+    def get_row(self, y: (int, float)) -> int:
+        """
+        Get the row holding the height.
+
+        Args:
+            y (int, float): The height.
+
+        Returns:
+            int: The row. Negative above the first row.
+        """
+        return math.floor((y - self.top) / self.cell_height)
+
+    def get_column(self, x: (int, float)) -> int:
+        """
+        Get the column holding the position.
+
+        Args:
+            x (int, float): The position.
+
+        Returns:
+            int: The column. Negative left of the first column.
+        """
+        return math.floor((x - self.left) / self.cell_width)
+
+    def get_cell_range(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        """
+        Get the cells covered by the rectangle.
+
+        Args:
+            rect (pygame.Rect): The area.
+
+        Returns:
+            tuple[int, int, int, int]: The first and the last row and the first and the last column.
+                Not clipped to any number of rows or columns.
+        """
+        return (
+            self.get_row(rect.top), self.get_row(rect.bottom - 1),
+            self.get_column(rect.left), self.get_column(rect.right - 1)
+        )
+
+    def get_cell_ranges(self, lows, highs) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the cells covered by many areas at once.
+
+        Args:
+            lows: The top left corners of the areas, shape (n, 2).
+            highs: The bottom right corners of the areas, shape (n, 2).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The first and the last column and row of each area, shape (n, 2).
+                Not clipped to any number of rows or columns.
+        """
+        cell_size = np.array([self.cell_width, self.cell_height])
+        origin = np.array([self.left, self.top])
+        first = np.floor((np.asarray(lows) - origin) / cell_size).astype(int)
+        last = np.floor((np.asarray(highs) - origin) / cell_size).astype(int)
+        return first, last
+
+    def get_cell_topleft(self, row: int, column: int) -> tuple:
+        """
+        Get the top left corner of the cell.
+
+        Args:
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+
+        Returns:
+            tuple: The corner.
+        """
+        return self.left + column * self.cell_width, self.top + row * self.cell_height
@@ -0,0 +1,275 @@
+"""
+Environments to train paddle agents. The game core is stepped by actions and observed as NumPy arrays,
+without a window, drawing or audio, in the style of reinforcement learning libraries:
+
+    env = BreakoutEnv()
+    observation, info = env.reset(seed=0)
+    observation, reward, terminated, truncated, info = env.step(ACTION_LAUNCH)
+
+VectorEnv steps many environments in one call and returns the observations and rewards of all of them as
+arrays.
+"""
+import random
+
+from typing import Iterable
+
+import numpy as np
+
+from breakout_game.config import settings
+from breakout_game.core import GameCore, INPUT_LEFT, INPUT_RIGHT, INPUT_LAUNCH
+
+# Actions of the agent
+ACTION_NOOP = 0
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+ACTION_LAUNCH = 3
+ACTION_INPUTS = (0, INPUT_LEFT, INPUT_RIGHT, INPUT_LAUNCH)
+
+# Observed features of the paddle, the lowest ball and the player, followed by the blocks
+FEATURES_SIZE = 8
+OBSERVATION_SIZE = FEATURES_SIZE + len(settings.BLOCK_MAP) * len(settings.BLOCK_MAP[0])
+
+
+class BreakoutEnv:
+    """
+    A level of the game played by an agent. The episode ends when the level is finished or the player
+    has lost all health.
+
+    The observation is a float32 vector of OBSERVATION_SIZE:
+
+    - the center and the width of the paddle, divided by the width of the game window,
+    - the center of the lowest ball, divided by the size of the game window, and its direction,
+    - 1 if the lowest ball is launched, otherwise 0,
+    - the health of the player divided by the maximum health,
+    - 1 for every cell of the block field holding a block, otherwise 0, row by row.
+
+    The lowest ball is looked up among the single balls and the balls of the swarm, which are always launched.
+    The reward is the change of the score.
+
+    Attributes:
+        level (int): The level played.
+        level_difficulty (int): The difficulty of the game.
+        frame_skip (int): The number of steps of the game core per action.
+        max_steps (None, int): The maximum number of actions of an episode. If None, no limit.
+        delta_time (float): The time of a step of the game core in seconds.
+        core (None, GameCore): The game played. Defaults to None. Created on reset.
+        rng (random.Random): The random generator of the games played. Seeded by the operating system,
+            unless reset is given a seed.
+        steps (int): The number of actions of the episode. Defaults to 0.
+
+    Args:
+        level (int): The level played. Defaults to 0.
+        level_difficulty (int): The difficulty of the game. Defaults to 0.
+        frame_skip (int): The number of steps of the game core per action. Defaults to 1.
+        max_steps (None, int): The maximum number of actions of an episode. Defaults to None.
+            If None, no limit.
+
+    version: 1
+    """
+    def __init__(
+            self,
+            level: int = 0,
+            level_difficulty: int = 0,
+            frame_skip: int = 1,
+            max_steps: [None, int] = None
+    ):
+        self.level: int = level
+        self.level_difficulty: int = level_difficulty
+        self.frame_skip: int = frame_skip
+        self.max_steps: [None, int] = max_steps
+        self.delta_time: float = 1 / settings.TICK_RATE
+        self.core: [None, GameCore] = None
+        self.rng: random.Random = random.Random()
+        self.steps: int = 0
+
+    @property
+    def terminated(self) -> bool:
+        """
+        Whether the episode is over.
+
+        Returns:
+            bool: True if the level is finished or the player has lost all health.
+        """
+        return self.core.health <= 0 or self.core.level_finished
+
+    @property
+    def truncated(self) -> bool:
+        """
+        Whether the episode has reached the maximum number of actions.
+
+        Returns:
+            bool: True if the episode is cut short.
+        """
+        return self.max_steps is not None and self.steps >= self.max_steps
+
+    def reset(self, seed: [None, int] = None) -> tuple[np.ndarray, dict]:
+        """
+        Start a new episode.
+
+        Args:
+            seed (None, int): The seed of the random generator. Defaults to None.
+                If None, the generator goes on from the last episode.
+
+        Returns:
+            tuple[np.ndarray, dict]: The first observation and the info of the episode.
+        """
+        if seed is not None:
+            self.rng = random.Random(seed)
+        self.core = GameCore(rng=self.rng)
+        self.core.init_level(self.level, self.level_difficulty)
+        self.steps = 0
+        return self.observe(), self.get_info()
+
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, bool, dict]:
+        """
+        Play the action for frame_skip steps of the game core, or until the episode is over.
+
+        Args:
+            action (int): One of ACTION_NOOP, ACTION_LEFT, ACTION_RIGHT and ACTION_LAUNCH.
+
+        Returns:
+            tuple[np.ndarray, float, bool, bool, dict]: The observation, the reward, whether the episode is over,
+                whether it is cut short and the info of the episode.
+        """
+        reward = self.act(action)
+        return self.observe(), reward, self.terminated, self.truncated, self.get_info()
+
+    def act(self, action: int) -> float:
+        """
+        Play the action without observing the game.
+
+        Args:
+            action (int): One of ACTION_NOOP, ACTION_LEFT, ACTION_RIGHT and ACTION_LAUNCH.
+
+        Returns:
+            float: The reward.
+        """
+        core = self.core
+        inputs = ACTION_INPUTS[action]
+        score = core.score
+        for _ in range(self.frame_skip):
+            core.step(self.delta_time, inputs)
+            if self.terminated:
+                break
+        self.steps += 1
+        return float(core.score - score)
+
+    def observe(self, out: [None, np.ndarray] = None) -> np.ndarray:
+        """
+        Get the observation of the game.
+
+        Args:
+            out (None, np.ndarray): The array to write the observation to, shape (OBSERVATION_SIZE,).
+                Defaults to None. If None, a new array is created.
+
+        Returns:
+            np.ndarray: The observation, shape (OBSERVATION_SIZE,).
+        """
+        if out is None:
+            out = np.empty(OBSERVATION_SIZE, dtype=np.float32)
+        core = self.core
+        paddle = core.paddle
+        paddle_features = [(paddle.x + paddle.width / 2) / settings.GAME_WINDOW_WIDTH,
+                           paddle.width / settings.GAME_WINDOW_WIDTH]
+        # The lowest ball is picked by its bottom among the single balls and the balls of the swarm
+        balls = [(ball.y + ball.height, [ball.x + ball.width / 2, ball.y + ball.height / 2,
+                                         ball.direction_x, ball.direction_y, ball.active]) for ball in core.balls]
+        swarm = core.ball_swarm
+        index = swarm.get_lowest_index()
+        if index is not None:
+            (x, y), (direction_x, direction_y) = swarm.positions[index].tolist(), swarm.directions[index].tolist()
+            width, height = swarm.get_size()
+            balls.append((y + height, [x + width / 2, y + height / 2, direction_x, direction_y, True]))
+        if balls:
+            center_x, center_y, *ball_features = max(balls, key=lambda ball: ball[0])[1]
+            ball_features = [center_x / settings.GAME_WINDOW_WIDTH, center_y / settings.GAME_WINDOW_HEIGHT,
+                             *ball_features]
+        else:
+            ball_features = [0, 0, 0, 0, 0]
+        out[:FEATURES_SIZE] = paddle_features + ball_features + [core.health / settings.MAX_PLAYER_HEALTH]
+        blocks = out[FEATURES_SIZE:].reshape(core.block_field.health.shape)
+        np.greater(core.block_field.health, 0, out=blocks, casting='unsafe')
+        return out
+
+    def get_info(self) -> dict:
+        """
+        Get the info of the episode.
+
+        Returns:
+            dict: The score, health, blocks left and the number of actions.
+        """
+        return {
+            'score': self.core.score,
+            'health': self.core.health,
+            'blocks': len(self.core.block_field),
+            'steps': self.steps
+        }
+
+
+class VectorEnv:
+    """
+    Many environments stepped together in one process. Environments whose episode is over are reset
+    on the same step, the last observation of the finished episode is kept in its info.
+
+    Attributes:
+        envs (list[BreakoutEnv]): The environments.
+        observations (np.ndarray): The last observations, shape (n, OBSERVATION_SIZE).
+
+    Args:
+        num_envs (int): The number of environments.
+        **kwargs: The arguments of each BreakoutEnv.
+
+    version: 1
+    """
+    def __init__(self, num_envs: int, **kwargs):
+        self.envs: list[BreakoutEnv] = [BreakoutEnv(**kwargs) for _ in range(num_envs)]
+        self.observations: np.ndarray = np.zeros((num_envs, OBSERVATION_SIZE), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.envs)
+
+    def reset(self, seed: [None, int] = None) -> tuple[np.ndarray, list[dict]]:
+        """
+        Start a new episode in every environment.
+
+        Args:
+            seed (None, int): The seed of the first environment. The next environments get the next seeds.
+                Defaults to None. If None, the generators go on from the last episodes.
+
+        Returns:
+            tuple[np.ndarray, list[dict]]: The observations, shape (n, OBSERVATION_SIZE), and the infos.
+        """
+        infos = []
+        for index, env in enumerate(self.envs):
+            env.reset(None if seed is None else seed + index)
+            env.observe(self.observations[index])
+            infos.append(env.get_info())
+        return self.observations.copy(), infos
+
+    def step(self, actions: Iterable[int]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+        """
+        Play an action in every environment.
+
+        Args:
+            actions (Iterable[int]): The action of each environment, shape (n,).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[dict]]: The observations, shape
+                (n, OBSERVATION_SIZE), the rewards, whether the episodes are over, whether they are cut short,
+                all shape (n,), and the infos.
+        """
+        count = len(self.envs)
+        rewards = np.zeros(count, dtype=np.float32)
+        terminated = np.zeros(count, dtype=bool)
+        truncated = np.zeros(count, dtype=bool)
+        infos = []
+        for index, (env, action) in enumerate(zip(self.envs, np.asarray(actions).tolist())):
+            rewards[index] = env.act(action)
+            terminated[index], truncated[index] = env.terminated, env.truncated
+            info = env.get_info()
+            if terminated[index] or truncated[index]:
+                info['final_observation'] = env.observe()
+                env.reset()
+            env.observe(self.observations[index])
+            infos.append(info)
+        return self.observations.copy(), rewards, terminated, truncated, infos
@@ -0,0 +1,181 @@
+"""
+Headless simulation of the game. Runs the game logic without a window, drawing or audio.
+"""
+import argparse
+import logging
+import random
+
+from typing import Callable
+
+from breakout_game.config import settings
+from breakout_game.core import GameCore, INPUT_LEFT, INPUT_RIGHT, INPUT_LAUNCH
+
+game_logger = logging.getLogger('')
+
+
+def follow_ball_policy(core: GameCore) -> int:
+    """
+    Simple player. Launches the ball and moves the paddle under the lowest ball, the balls of the swarm
+    included. The ball is caught off the center of the paddle, so it bounces at an angle instead of straight up.
+
+    Args:
+        core (GameCore): The simulated game.
+
+    Returns:
+        int: The inputs combined from INPUT_LEFT, INPUT_RIGHT and INPUT_LAUNCH.
+    """
+    inputs = INPUT_LAUNCH
+    balls = [(ball.y + ball.height, ball.x + ball.width / 2) for ball in core.balls]
+    lowest_swarm_ball = core.ball_swarm.get_lowest()
+    if lowest_swarm_ball is not None:
+        balls.append((lowest_swarm_ball[1], lowest_swarm_ball[0]))
+    if balls:
+        paddle_rect = core.paddle.rect
+        target_x = max(balls)[1] + paddle_rect.width // 4
+        tolerance = paddle_rect.width // 8
+        if paddle_rect.centerx < target_x - tolerance:
+            inputs |= INPUT_RIGHT
+        elif paddle_rect.centerx > target_x + tolerance:
+            inputs |= INPUT_LEFT
+    return inputs
+
+
+class HeadlessGame:
+    """
+    Game stepped as fast as the CPU allows. Levels follow each other without menus, nothing is drawn and
+    no sound is played.
+
+    Note:
+        Only the game core is stepped. Powerup timers and ball delays count the time of the game core, so
+        they expire after the same number of steps at any simulation speed.
+
+    Attributes:
+        core (GameCore): The simulated game.
+        level (int): The level of the game. Defaults to 0.
+        level_difficulty (int): The difficulty of the game. Defaults to 0. Must be a number from 0 to 2.
+        delta_time (float): The time of a simulation step in seconds. Defaults to one physics step at
+            settings.TICK_RATE.
+        policy (Callable): The player. Gets the game core and returns the inputs.
+            Defaults to follow_ball_policy.
+        steps (int): The number of steps simulated. Defaults to 0.
+
+    Args:
+        level_difficulty (int): The difficulty of the game. Defaults to 0.
+        delta_time (None, float): The time of a simulation step in seconds. Defaults to None.
+            If None, one physics step at settings.TICK_RATE.
+        policy (None, Callable): The player. Defaults to None. If None, follow_ball_policy is used.
+        level (int): The level to start the game at. Defaults to 0.
+        seed (None, int): The seed of the random generator of the game. Defaults to None.
+            If None, the generator is seeded by the operating system.
+
+    version: 1
+    """
+    def __init__(
+            self,
+            level_difficulty: int = 0,
+            delta_time: [None, float] = None,
+            policy: [None, Callable[[GameCore], int]] = None,
+            level: int = 0,
+            seed: [None, int] = None
+    ):
+        self.level: int = level
+        self.level_difficulty: int = level_difficulty
+        self.delta_time: float = delta_time if delta_time is not None else 1 / settings.TICK_RATE
+        self.policy: Callable[[GameCore], int] = policy if policy is not None else follow_ball_policy
+        self.steps: int = 0
+
+        self.core: GameCore = GameCore(rng=random.Random(seed))
+        self.core.init_level(self.level, self.level_difficulty)
+
+    @property
+    def finished(self) -> bool:
+        """
+        Whether the player has lost or completed all levels.
+
+        Returns:
+            bool: True if the game is over.
+        """
+        return self.core.health <= 0 or self.level > 6
+
+    def check_level_finish(self):
+        """
+        Start the next level if all blocks are destroyed.
+        """
+        if self.core.level_finished:
+            self.core.clear_level()
+            self.level += 1
+            if self.level <= 6:
+                self.core.init_level(self.level, self.level_difficulty)
+
+    def step(self) -> bool:
+        """
+        Simulate one frame.
+
+        Returns:
+            bool: True if the game goes on after the step.
+        """
+        self.core.step(self.delta_time, self.policy(self.core))
+        self.check_level_finish()
+        self.steps += 1
+        return not self.finished
+
+    def run(self, max_steps: [None, int] = None) -> dict:
+        """
+        Simulate the game until it is over.
+
+        Args:
+            max_steps (None, int): The maximum number of steps. Defaults to None. If None, no limit.
+
+        Returns:
+            dict: The result of the game.
+        """
+        while not self.finished and (max_steps is None or self.steps < max_steps):
+            self.step()
+        return self.get_result()
+
+    def get_result(self) -> dict:
+        """
+        Get the result of the game.
+
+        Returns:
+            dict: The level reached, score, health left, lives lost, powerups caught by their name, steps and
+                simulated seconds.
+        """
+        return {
+            'level': self.level,
+            'score': self.core.score,
+            'health': self.core.health,
+            'lives_lost': self.core.lives_lost,
+            'powerups_taken': dict(self.core.powerups_taken),
+            'steps': self.steps,
+            'time': self.steps * self.delta_time
+        }
+
+
+def main():
+    """
+    Simulate games without a display and print their results.
+    """
+    parser = argparse.ArgumentParser(description='Simulate games without a display.')
+    parser.add_argument('--games', type=int, default=1, help='Number of games to simulate.')
+    parser.add_argument('--difficulty', type=int, choices=[0, 1, 2], default=0, help='Difficulty of the games.')
+    parser.add_argument('--max-steps', type=int, default=None, help='Maximum number of steps of a game.')
+    parser.add_argument('--verbose', action='store_true', help='Log the events of the games.')
+    arguments = parser.parse_args()
+
+    if not arguments.verbose:
+        game_logger.setLevel(logging.WARNING)
+    for game_index in range(arguments.games):
+        result = HeadlessGame(arguments.difficulty).run(arguments.max_steps)
+        print(f'Game {game_index}: {result}')
+
+
+def start_headless():
+    """
+    Start the headless simulation.
+    """
+    main()
+
+
+if __name__ == '__main__':
+    main()
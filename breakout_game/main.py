@@ -1,24 +1,34 @@
 """
 Main module to start the program
 """
+import argparse
 import os
+import random
 import sys
-import time
 
 from pathlib import Path
+from typing import Iterator
 
 import pygame
 
 from breakout_game import log
 from breakout_game.utils import path_utils
+from breakout_game.utils.mixer_wrapper import sound_bank
+from breakout_game.utils.backgrounds import LevelAssetPrefetcher
+from breakout_game.utils.render_stats import RenderStats
+from breakout_game.utils.frame_scheduler import FrameScheduler
+from breakout_game.utils.fixed_timestep import FixedTimestep
+from breakout_game.utils.run_ahead import RunAhead
 from breakout_game.config import settings
 from breakout_game.sprites import SpriteManager
+from breakout_game.sprites.sprite_manager import get_inputs
+from breakout_game.replay import InputRecorder, InputRecording, INPUT_ESCAPE
 from breakout_game.screens import MainMenu, LevelMenu, EndGameMenu, PauseMenu
 
 game_logger = log.game_logger
 
 
-class Game:
+class Game:  # pylint: disable=R0902
     """
     The main game class.
 
@@ -27,31 +37,66 @@ class Game:
     Attributes:
         display_surface (pygame.Surface): Main screen surface on which everything is displayed.
         title (str): The name displayed at the top of the screen. Defaults to "Breakout Game"
-        clock (pygame.time.Clock): Timer to run the game at persistent time rate.
+        frame_scheduler (FrameScheduler): Runs the game at persistent time rate. Sleeps while a menu is shown.
+        fixed_timestep (FixedTimestep): Converts the time of rendered frames into physics steps of fixed length.
         main_menu (MainMenu): Main menu object.
         pause_menu (PauseMenu): Pause menu object.
         level_menu (LevelMenu): Level menu object.
         end_game_menu (EndGameMenu): End game menu object.
         background (pygame.Surface): The background of the game.
+        level_assets (LevelAssetPrefetcher): Prepares backgrounds and music of the next level in the background.
         sprite_manager (SpriteManager):
             The sprite manager object handling the behaviour of all sprites in the game.
         game_active (bool): Whether the game is active or not. Defaults to False.
-        start_pause_time (int, float): The time when the game was set on pause. Defaults to 0.
-        time_in_pause (int, float): The amount of time spent in pause. Defaults to 0.
         level (int):
             The level of the game. Defaults to 0. Must be a number from 0 to 6.
         level_difficulty (int): The difficulty of the game. Defaults to 0. Must be a number from 0 to 2.
         keys_pressed (pygame.key.ScancodeWrapper): The keys pressed during the game.
+        render_stats (RenderStats): Statistics of the screen area pushed to the display per frame.
+        full_redraw_needed (bool): Whether the next game frame must be pushed to the display as a whole.
+            Only used with dirty rectangle rendering. Defaults to True.
+        last_menu_objects (None, list[list[pygame.Surface, pygame.Rect]]): The menu objects on the display.
+            Defaults to None. None if the last frame was a game frame.
+        fixed_seed (bool): Whether the seed was given or taken from a replay. A fixed seed is kept when the game
+            is restarted, otherwise every game gets a new random seed.
+        input_recorder (InputRecorder): Records the inputs of every physics step with the seed of the game.
+        replay_inputs (None, Iterator[int]): The inputs of the physics steps replayed. Defaults to None.
+            If None, the keys pressed are used. The keys are used again once the replay is over.
+        replay_levels (list[tuple[int, int]]): The levels and difficulties left to start in the replay.
+            They replace the level and the difficulty chosen in the menus. Defaults to an empty list.
+        replay_hashes (dict[int, int]): The state hashes of the replay keyed by the step they follow. A replay
+            diverging from the recording is logged. Defaults to an empty dict.
+        run_ahead (RunAhead): Shows the frames of the game a few physics steps ahead with the keys pressed.
+            Disabled during a replay.
+
+    Args:
+        seed (None, int): The seed of the random generator of the game. Defaults to None. If None, a random
+            seed is chosen for every game, so every game can be replayed. A game restarted with a seed given is
+            seeded again, so the same inputs play the same game.
+        record_path (None, str, Path): The file the inputs of the game are recorded to. Defaults to None.
+            If None, the inputs are not saved.
+        replay (None, InputRecording): The recording to replay. Defaults to None. If given, the seed of the
+            recording is used, its inputs are fed to the game instead of the keys pressed and its levels and
+            difficulties replace the ones chosen in the menus.
+        run_ahead_ticks (None, int): The number of physics steps the frames shown run ahead. Defaults to None.
+            If None, settings.RUN_AHEAD_TICKS is used.
 
     version: 1
     """
 
-    def __init__(self):
+    def __init__(
+            self,
+            seed: [None, int] = None,
+            record_path: [None, str, Path] = None,
+            replay: [None, InputRecording] = None,
+            run_ahead_ticks: [None, int] = None
+    ):
         # General Setup
         pygame.init()  # pylint: disable=E1101
         self.display_surface: pygame.Surface = pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
         self.title: str = 'Breakout Game'
-        self.clock: pygame.time.Clock = pygame.time.Clock()
+        self.frame_scheduler: FrameScheduler = FrameScheduler()
+        self.fixed_timestep: FixedTimestep = FixedTimestep()
 
         # Menu
         self.main_menu: MainMenu = MainMenu()
@@ -65,23 +110,41 @@ class Game:
         pygame.mixer.music.load(menu_music_path)
         pygame.mixer.music.set_volume(0.75)
         pygame.mixer.music.play(-1)
+        sound_bank.preload()
 
         # Background
         self.background: pygame.Surface = self.main_menu.background
+        self.level_assets: LevelAssetPrefetcher = LevelAssetPrefetcher()
 
         # Sprites
-        self.sprite_manager: SpriteManager = SpriteManager()
+        if replay is not None:
+            seed = replay.seed
+        self.fixed_seed: bool = seed is not None
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.sprite_manager: SpriteManager = SpriteManager(rng=random.Random(seed))
+
+        # Inputs
+        self.input_recorder: InputRecorder = InputRecorder(seed, record_path)
+        self.replay_inputs: [None, Iterator[int]] = replay.iter_inputs() if replay is not None else None
+        self.replay_levels: list[tuple[int, int]] = replay.get_levels() if replay is not None else []
+        self.replay_hashes: dict[int, int] = replay.get_hashes() if replay is not None else {}
+        self.run_ahead: RunAhead = RunAhead(run_ahead_ticks if replay is None else 0)
 
         # Pause
         self.game_active: bool = False
-        self.start_pause_time: [int, float] = 0
-        self.time_in_pause: [int, float] = 0
 
         # Game stage
         self.level: int = 0
         self.level_difficulty: int = 0
+        self.level_assets.prefetch(self.level)
 
         self.keys_pressed: pygame.key.ScancodeWrapper = pygame.key.get_pressed()
+
+        # Rendering
+        self.render_stats: RenderStats = RenderStats()
+        self.full_redraw_needed: bool = True
+        self.last_menu_objects: [None, list[list]] = None
         game_logger.debug('Game Initialised')
 
     def restart_game(self):
@@ -103,63 +166,62 @@ class Game:
 
         # Game Stage
         self.game_active = False
-        self.start_pause_time = 0
-        self.time_in_pause = 0
         self.level = 0
         self.level_difficulty = 0
         self.keys_pressed = None
-
-        self.sprite_manager = SpriteManager()
+        self.level_assets.prefetch(self.level)
+
+        seed = self.input_recorder.seed if self.fixed_seed else random.randrange(2 ** 32)
+        self.sprite_manager = SpriteManager(rng=random.Random(seed))
+        self.input_recorder = InputRecorder(seed, self.input_recorder.path)
+        self.replay_inputs = None
+        self.replay_levels = []
+        self.replay_hashes = {}
         game_logger.info('Game restarted')
 
     def set_level_background(self):
         """
         Set the background of the game. RGB(125, 125, 125) color is subtracted from the image to make it darker for
         a better gaming experience.
+
+        Note:
+            The background is taken from the prefetcher. If it was prefetched, no decoding happens here.
         """
-        background_path = path_utils.get_asset_path(f'images/background/level-{self.level}.jpg')
-        self.background = pygame.image.load(background_path).convert()
-        self.background.fill((125, 125, 125), special_flags=pygame.BLEND_RGB_SUB)  # pylint: disable=E1101
-        scale_factor = max([
-            settings.WINDOW_HEIGHT / self.background.get_height(),
-            settings.WINDOW_WIDTH / self.background.get_width()
-        ])
-        scaled_width = self.background.get_width() * scale_factor
-        scaled_height = self.background.get_height() * scale_factor
-        self.background = pygame.transform.scale(self.background, (scaled_width, scaled_height))
-        game_logger.info('Background %(background_path)s of level %(level)s is set',
-                         {"background_path": background_path, "level": self.level})
+        self.background = self.level_assets.get_background(self.level)
+        game_logger.info('Background of level %(level)s is set', {"level": self.level})
 
     def load_level_music(self):
         """
         Load the music into the pygame.mixer and plays it.
         """
         pygame.mixer.music.unload()
-        level_music_path = path_utils.get_asset_path(f'sounds/level-{self.level}.mp3')
-        pygame.mixer.music.load(level_music_path)
+        pygame.mixer.music.load(self.level_assets.get_music(self.level), 'mp3')
         pygame.mixer.music.play(fade_ms=1000)
-        game_logger.debug('Music %s of level %s started', level_music_path, self.level)
+        game_logger.debug('Music of level %s started', self.level)
 
     def check_level_finish(self):
         """
         Checks if payer has finished the level based on the amount of blocks in the game.
         """
-        if len(self.sprite_manager.block_sprites_group.sprites()) == 0:
-            self.sprite_manager.ball_sprites_group.empty()
-            self.sprite_manager.power_up_sprites_group.empty()
+        if self.sprite_manager.core.level_finished:
+            self.sprite_manager.core.clear_level()
+            self.sprite_manager.sync()
 
             self.game_active = False
             self.level_menu.active = True
             self.level += 1
+            if self.level <= 6:
+                self.level_assets.prefetch(self.level)
             game_logger.info('The level %s is finished', self.level)
 
     def check_end_game(self):
         """
         Checks player has finished the game or lost based on health and level number.
         """
-        if self.sprite_manager.player.health <= 0 or self.level > 6:
+        if self.sprite_manager.core.health <= 0 or self.level > 6:
             self.game_active = False
             self.end_game_menu.active = True
+            self.input_recorder.save()
             game_logger.debug('The game has ended')
 
     def check_events(self):
@@ -171,38 +233,51 @@ class Game:
 
             1. The game window is closed -> ends the program.
             2. The [q] key is pressed -> ends the program.
-            3. The [escape] key is pressed -> activates menu and starts timer to prevent powerup timers from counting.
+            3. The [escape] key is pressed -> activates menu. The game core is not stepped, so powerup timers stop.
+            4. The game window is exposed -> the next frame is pushed to the display as a whole.
         """
         for event in pygame.event.get():
             if event.type == pygame.QUIT:  # pylint: disable=E1101
                 game_logger.info('The game window is closed. Exiting...')
+                self.input_recorder.save()
                 pygame.quit()  # pylint: disable=E1101
                 sys.exit()
+            elif event.type == pygame.WINDOWEXPOSED:  # pylint: disable=E1101
+                self.full_redraw_needed = True
+                self.last_menu_objects = None
 
         self.keys_pressed = pygame.key.get_pressed()
         if self.keys_pressed[pygame.K_ESCAPE] and self.game_active:  # pylint: disable=E1101
             self.pause_menu.active = True
-            self.start_pause_time = time.time()
             game_logger.info('Pause activated')
         elif self.keys_pressed[pygame.K_q]:  # pylint: disable=E1101
             game_logger.info('The [q] button is pressed. Exiting...')
+            self.input_recorder.save()
             pygame.quit()  # pylint: disable=E1101
             sys.exit()  # pylint: disable=E1101
 
+    def is_menu_active(self) -> bool:
+        """
+        Check if a menu is shown. Menus are static screens, which only change on input.
+
+        Returns:
+            bool: True if any menu is active.
+        """
+        return (
+            self.main_menu.active or self.level_menu.active or self.end_game_menu.active or self.pause_menu.active
+        )
+
     def get_last_blit_main_menu(self) -> list[list]:
         """
         Update the main menu object and get objects to render.
 
         Returns:
-            list[list[pygame.Surface, pygame.Rect]]: Objects to use to render the main menu
+            list[list[pygame.Surface, pygame.Rect]]: Objects to use to render the main menu.
+                The composed frame of the menu.
         """
         self.main_menu.update(self.keys_pressed)
         self.level_difficulty = self.main_menu.selected_option
-        self.display_surface.blit(self.main_menu.title_surface, self.main_menu.title_rect)
-        objects_to_blit = []
-        for surface, rect in self.main_menu.objects_to_blit:
-            objects_to_blit.append([surface, rect])
-        return objects_to_blit
+        return [[self.main_menu.frame, (0, 0)]]
 
     def get_last_level_menu(self) -> list[list]:
         """
@@ -226,7 +301,7 @@ class Game:
         Returns:
             list[list[pygame.Surface, pygame.Rect]]: Objects to use to render the end game menu
         """
-        self.end_game_menu.update(self.keys_pressed, self.sprite_manager.score.score)
+        self.end_game_menu.update(self.keys_pressed, self.sprite_manager.core.score)
         if self.end_game_menu.restart_needed:
             self.restart_game()
             return [[]]
@@ -246,26 +321,70 @@ class Game:
 
     def init_game_stage(self):
         """
-        Initialize the stage of level and start the game.
+        Initialize the stage of level and start the game. During a replay the level and the difficulty are
+        taken from the recording.
         """
+        if self.replay_levels:
+            self.level, self.level_difficulty = self.replay_levels.pop(0)
         self.set_level_background()
         self.sprite_manager.init_level(self.level, self.level_difficulty)
+        self.input_recorder.start_level(self.level, self.level_difficulty)
+        self.sprite_manager.set_background(self.background)
         self.load_level_music()
+        self.fixed_timestep.reset()
         self.game_active = True
         game_logger.info('Stage of level %s initialized', self.level)
 
+    def get_step_inputs(self) -> int:
+        """
+        Get the inputs of the next physics step: the next inputs of the replay, or the keys pressed once the
+        replay is over.
+
+        Returns:
+            int: The inputs combined from INPUT_LEFT, INPUT_RIGHT, INPUT_LAUNCH and INPUT_ESCAPE.
+        """
+        if self.replay_inputs is not None:
+            inputs = next(self.replay_inputs, None)
+            if inputs is not None:
+                return inputs
+            self.replay_inputs = None
+            game_logger.info('The replay is over')
+        inputs = get_inputs(self.keys_pressed)
+        if self.keys_pressed[pygame.K_ESCAPE]:  # pylint: disable=E1101
+            inputs |= INPUT_ESCAPE
+        return inputs
+
+    def check_replay_hash(self):
+        """
+        Compare the state of the game with the state hash recorded after the same step of the replay. The first
+        divergence is logged, the hashes are not checked after it.
+        """
+        steps = self.input_recorder.steps
+        if steps in self.replay_hashes and self.sprite_manager.core.get_state_hash() != self.replay_hashes[steps]:
+            game_logger.warning('The replay diverged from the recording at step %s', steps)
+            self.replay_hashes = {}
+
     def run_game(self, delta_time: float):
         """
-        Runs the game. Updates all objects.
+        Runs the game. Updates all objects in physics steps of fixed length, as many as fit in the time passed.
+        The time left over is carried to the next frame. No more steps are run once a menu is activated.
+        With run-ahead enabled, the game is then stepped ahead for the frame drawn and rolled back after drawing.
 
         Args:
             delta_time (float): time passed since the last update
         """
-        self.check_level_finish()
-        self.check_end_game()
-        self.sprite_manager.update(delta_time, self.keys_pressed, self.time_in_pause)
-        self.time_in_pause = 0
-        self.start_pause_time = 0
+        for _ in range(self.fixed_timestep.advance(delta_time)):
+            self.sprite_manager.save_positions()
+            self.check_level_finish()
+            self.check_end_game()
+            inputs = self.get_step_inputs()
+            self.sprite_manager.step(self.fixed_timestep.tick_time, inputs)
+            self.input_recorder.record(inputs, self.sprite_manager.core)
+            self.check_replay_hash()
+            if self.is_menu_active():
+                break
+        if not self.is_menu_active():
+            self.run_ahead.run(self.sprite_manager, self.fixed_timestep.tick_time, get_inputs(self.keys_pressed))
 
     def draw_graphics(
             self,
@@ -275,27 +394,63 @@ class Game:
         Draw graphics.
 
         Checks if there are any objects returned from menu. If true, renders them, if false,
-        updates the game objects.
+        updates the game objects. Menu objects already on the display are not rendered again.
+
+        Note:
+            During the game the background is part of the static layer drawn by the sprite manager.
+            Moving sprites are drawn between the last two physics steps by the progress to the next step.
+            With dirty rectangle rendering enabled, game frames only erase and redraw the changed areas and
+            push those areas to the display. The first game frame after a menu is pushed as a whole.
 
         Args:
             menu_objects_to_blit (list[list[pygame.Surface, pygame.Rect]]): Objects passed to blit method.
         """
-        self.display_surface.blit(source=self.background, dest=(0, 0))
-        if len(menu_objects_to_blit) > 0:
-            for menu_object_to_blit in menu_objects_to_blit:
-                if len(menu_object_to_blit) > 0:
-                    self.display_surface.blit(*menu_object_to_blit)
-        else:
-            self.sprite_manager.draw_all(self.display_surface)
+        if len(menu_objects_to_blit) == 0:
+            redraw_all = not settings.DIRTY_RECT_RENDERING or self.full_redraw_needed
+            dirty_rects = self.sprite_manager.draw_all(
+                self.display_surface,
+                redraw_all=redraw_all,
+                alpha=self.fixed_timestep.alpha
+            )
+            self.full_redraw_needed = False
+            self.last_menu_objects = None
+            if redraw_all:
+                pygame.display.update()
+                self.render_stats.record()
+            else:
+                pygame.display.update(dirty_rects)
+                self.render_stats.record(dirty_rects)
+            return
+
+        # Menus keep their surfaces until the text changes, so equal objects mean an unchanged frame
+        if menu_objects_to_blit == self.last_menu_objects:
+            self.render_stats.record([])
+            return
+
+        # A composed menu frame covers the screen and already holds the background
+        first_object = menu_objects_to_blit[0]
+        covers_display = (
+            len(first_object) > 0
+            and first_object[0].get_size() == self.display_surface.get_size()
+            and tuple(first_object[1][:2]) == (0, 0)
+        )
+        if not covers_display:
+            self.display_surface.blit(source=self.background, dest=(0, 0))
+        for menu_object_to_blit in menu_objects_to_blit:
+            if len(menu_object_to_blit) > 0:
+                self.display_surface.blit(*menu_object_to_blit)
+        self.full_redraw_needed = True
+        self.last_menu_objects = menu_objects_to_blit
 
         pygame.display.update()
+        self.render_stats.record()
 
     def run(self):
         """
         The main event loop.
         """
         while True:
-            delta_time = self.clock.tick_busy_loop(settings.FPS) / 1000
+            delta_time = self.frame_scheduler.tick(idle=self.is_menu_active())
 
             self.check_events()
 
@@ -308,7 +463,6 @@ class Game:
             elif self.end_game_menu.active:
                 menu_objects_to_blit = self.get_last_end_game_menu()
             elif self.pause_menu.active:
-                self.time_in_pause = time.time() - self.start_pause_time
                 menu_objects_to_blit = self.get_last_blit_pause_menu()
             else:
                 if not self.game_active:
@@ -319,13 +473,21 @@ class Game:
 
             # Graphics
             self.draw_graphics(menu_objects_to_blit)
+            self.run_ahead.roll_back(self.sprite_manager)
 
 
 def start():
     """
     Start the game
     """
-    game = Game()
+    parser = argparse.ArgumentParser(description='Play the Breakout game.')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the random generator of the game.')
+    parser.add_argument('--record', default=None, help='File to record the inputs of the game to.')
+    parser.add_argument('--replay', default=None, help='Recording of the inputs to replay.')
+    parser.add_argument('--run-ahead', type=int, default=None, help='Physics steps the frames shown run ahead.')
+    arguments, _ = parser.parse_known_args()
+    replay = InputRecording.load(arguments.replay) if arguments.replay is not None else None
+    game = Game(seed=arguments.seed, record_path=arguments.record, replay=replay, run_ahead_ticks=arguments.run_ahead)
     game.run()
 
 
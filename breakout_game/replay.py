@@ -0,0 +1,354 @@
+"""
+Recording and replay of the inputs of games. A recording holds the seed of the game, the inputs of every
+physics step run-length encoded and the state hashes of the game core every settings.REPLAY_HASH_INTERVAL
+steps. Replaying feeds the inputs to a new game core with the same seed as fast as the CPU allows and checks the
+hashes to detect a replay diverging from the recorded game:
+
+    breakout --record game.replay
+    breakout-replay game.replay
+
+Format:
+    The header is the magic b'BKRP', the version (uint8), the tick rate (uint16) and the seed (int64), little
+    endian. Each record starts with a byte holding its kind in the high four bits:
+
+    - a run: the inputs in the low four bits, followed by the number of steps as an unsigned LEB128 number,
+    - a state hash: followed by the CRC-32 checksum of the state (uint32),
+    - the start of a level: followed by the level and the difficulty (uint8 each).
+"""
+import argparse
+import json
+import logging
+import random
+import struct
+
+from pathlib import Path
+from typing import Iterator
+
+from breakout_game.config import settings
+from breakout_game.core import GameCore
+
+game_logger = logging.getLogger('')
+
+# The escape key. Recorded with the inputs of the game core, ignored by the game core.
+INPUT_ESCAPE = 8
+
+MAGIC = b'BKRP'
+VERSION = 1
+HEADER = struct.Struct('<4sBHq')
+HASH = struct.Struct('<I')
+LEVEL = struct.Struct('<BB')
+
+KIND_RUN = 0
+KIND_HASH = 1
+KIND_LEVEL = 2
+
+
+def write_varint(data: bytearray, value: int):
+    """
+    Append an unsigned LEB128 number, seven bits per byte.
+
+    Args:
+        data (bytearray): The data to append to.
+        value (int): The number. Must not be negative.
+    """
+    while value >= 0x80:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """
+    Read an unsigned LEB128 number.
+
+    Args:
+        data (bytes): The data to read from.
+        offset (int): The position of the number.
+
+    Returns:
+        tuple[int, int]: The number and the position after it.
+    """
+    value, shift = 0, 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class InputRecorder:
+    """
+    Records the inputs of a game step by step.
+
+    Attributes:
+        seed (int): The seed of the random generator of the game.
+        path (None, Path): The file the recording is saved to. If None, the recording is kept in memory.
+        tick_rate (int): The number of steps per second.
+        hash_interval (int): The number of steps between the state hashes.
+        steps (int): The number of steps recorded. Defaults to 0.
+        data (bytearray): The records written. The run of the last inputs is held back until the inputs change.
+        inputs (None, int): The inputs of the run being recorded. Defaults to None. None before the first step.
+        count (int): The number of steps of the run being recorded. Defaults to 0.
+
+    Args:
+        seed (int): The seed of the random generator of the game.
+        path (None, str, Path): The file the recording is saved to. Defaults to None.
+            If None, the recording is kept in memory.
+
+    version: 1
+    """
+    def __init__(self, seed: int, path: [None, str, Path] = None):
+        self.seed: int = seed
+        self.path: [None, Path] = Path(path) if path is not None else None
+        self.tick_rate: int = settings.TICK_RATE
+        self.hash_interval: int = settings.REPLAY_HASH_INTERVAL
+        self.steps: int = 0
+        self.data: bytearray = bytearray()
+        self.inputs: [None, int] = None
+        self.count: int = 0
+
+    def _write_run(self, data: bytearray):
+        """
+        Write the run being recorded.
+
+        Args:
+            data (bytearray): The data to write to.
+        """
+        if self.count > 0:
+            data.append(KIND_RUN << 4 | self.inputs)
+            write_varint(data, self.count)
+
+    def _flush(self):
+        """
+        Write the run being recorded and start a new one.
+        """
+        self._write_run(self.data)
+        self.inputs, self.count = None, 0
+
+    def start_level(self, level: int, level_difficulty: int):
+        """
+        Record the start of a level.
+
+        Args:
+            level (int): The level started.
+            level_difficulty (int): The difficulty of the level.
+        """
+        self._flush()
+        self.data.append(KIND_LEVEL << 4)
+        self.data += LEVEL.pack(level, level_difficulty)
+
+    def record(self, inputs: int, core: GameCore):
+        """
+        Record the inputs of a step. Called after the step, so the state hash follows the step.
+
+        Args:
+            inputs (int): The inputs of the step.
+            core (GameCore): The game stepped.
+        """
+        if inputs != self.inputs:
+            self._flush()
+            self.inputs = inputs
+        self.count += 1
+        self.steps += 1
+        if self.steps % self.hash_interval == 0:
+            self._flush()
+            self.data.append(KIND_HASH << 4)
+            self.data += HASH.pack(core.get_state_hash())
+
+    def to_bytes(self) -> bytes:
+        """
+        Get the recording.
+
+        Returns:
+            bytes: The recording in the binary format.
+        """
+        data = bytearray(HEADER.pack(MAGIC, VERSION, self.tick_rate, self.seed))
+        data += self.data
+        self._write_run(data)
+        return bytes(data)
+
+    def save(self):
+        """
+        Save the recording to its file, if it has one.
+        """
+        if self.path is not None:
+            self.path.write_bytes(self.to_bytes())
+            game_logger.info('Recording of %s steps saved to %s', self.steps, self.path)
+
+
+class InputRecording:
+    """
+    A recording read back.
+
+    Attributes:
+        seed (int): The seed of the random generator of the game.
+        tick_rate (int): The number of steps per second.
+        records (list[tuple]): The records in the order of the game: (KIND_RUN, inputs, count),
+            (KIND_HASH, checksum) and (KIND_LEVEL, level, level_difficulty).
+
+    Args:
+        seed (int): The seed of the random generator of the game.
+        tick_rate (int): The number of steps per second.
+        records (list[tuple]): The records in the order of the game.
+
+    version: 1
+    """
+    def __init__(self, seed: int, tick_rate: int, records: list[tuple]):
+        self.seed: int = seed
+        self.tick_rate: int = tick_rate
+        self.records: list[tuple] = records
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'InputRecording':
+        """
+        Read a recording.
+
+        Args:
+            data (bytes): The recording in the binary format.
+
+        Returns:
+            InputRecording: The recording.
+        """
+        magic, version, tick_rate, seed = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'Not an input recording of version {VERSION}.')
+        records = []
+        offset = HEADER.size
+        while offset < len(data):
+            kind, low_bits = data[offset] >> 4, data[offset] & 0x0F
+            offset += 1
+            if kind == KIND_RUN:
+                count, offset = read_varint(data, offset)
+                records.append((KIND_RUN, low_bits, count))
+            elif kind == KIND_HASH:
+                records.append((KIND_HASH, *HASH.unpack_from(data, offset)))
+                offset += HASH.size
+            elif kind == KIND_LEVEL:
+                records.append((KIND_LEVEL, *LEVEL.unpack_from(data, offset)))
+                offset += LEVEL.size
+            else:
+                raise ValueError(f'Unknown record kind {kind} at byte {offset - 1}.')
+        return cls(seed, tick_rate, records)
+
+    @classmethod
+    def load(cls, path: [str, Path]) -> 'InputRecording':
+        """
+        Read a recording from a file.
+
+        Args:
+            path (str, Path): The file.
+
+        Returns:
+            InputRecording: The recording.
+        """
+        return cls.from_bytes(Path(path).read_bytes())
+
+    @property
+    def steps(self) -> int:
+        """
+        The number of steps recorded.
+
+        Returns:
+            int: The number of steps.
+        """
+        return sum(record[2] for record in self.records if record[0] == KIND_RUN)
+
+    def get_levels(self) -> list[tuple[int, int]]:
+        """
+        Get the levels started in the recording.
+
+        Returns:
+            list[tuple[int, int]]: The level and the difficulty of each level started, in the order of the game.
+        """
+        return [(record[1], record[2]) for record in self.records if record[0] == KIND_LEVEL]
+
+    def get_hashes(self) -> dict[int, int]:
+        """
+        Get the state hashes of the recording.
+
+        Returns:
+            dict[int, int]: The CRC-32 checksum of the state keyed by the number of steps run before the hash.
+        """
+        hashes, steps = {}, 0
+        for record in self.records:
+            if record[0] == KIND_RUN:
+                steps += record[2]
+            elif record[0] == KIND_HASH:
+                hashes[steps] = record[1]
+        return hashes
+
+    def iter_inputs(self) -> Iterator[int]:
+        """
+        Iterate over the inputs of every step.
+
+        Yields:
+            int: The inputs of a step.
+        """
+        for record in self.records:
+            if record[0] == KIND_RUN:
+                for _ in range(record[2]):
+                    yield record[1]
+
+
+def replay(recording: InputRecording, stop_on_divergence: bool = True) -> dict:
+    """
+    Replay a recording without a display as fast as the CPU allows. The levels follow each other as
+    recorded, and a finished level is cleared before the next step like in the game.
+
+    Args:
+        recording (InputRecording): The recording.
+        stop_on_divergence (bool): If true, the replay stops at the first state hash differing from the
+            recording. Defaults to True.
+
+    Returns:
+        dict: The steps replayed, the state hashes checked, the step the replay diverged at, None if it did not,
+            and the level, score and health at the end.
+    """
+    core = GameCore(rng=random.Random(recording.seed))
+    delta_time = 1 / recording.tick_rate
+    steps, hashes_checked, diverged_at = 0, 0, None
+    for record in recording.records:
+        if record[0] == KIND_RUN:
+            inputs = record[1]
+            for _ in range(record[2]):
+                if core.level_finished:
+                    core.clear_level()
+                core.step(delta_time, inputs)
+            steps += record[2]
+        elif record[0] == KIND_LEVEL:
+            core.init_level(record[1], record[2])
+        elif record[0] == KIND_HASH:
+            hashes_checked += 1
+            if diverged_at is None and core.get_state_hash() != record[1]:
+                diverged_at = steps
+                game_logger.warning('The replay diverged from the recording at step %s', steps)
+                if stop_on_divergence:
+                    break
+    return {
+        'steps': steps,
+        'hashes_checked': hashes_checked,
+        'diverged_at': diverged_at,
+        'level': core.level,
+        'score': core.score,
+        'health': core.health
+    }
+
+
+def main():
+    """
+    Replay a recording without a display and print the result.
+    """
+    parser = argparse.ArgumentParser(description='Replay a recording of a game without a display.')
+    parser.add_argument('path', help='The recording.')
+    parser.add_argument('--keep-going', action='store_true', help='Go on after the replay diverged.')
+    arguments = parser.parse_args()
+
+    game_logger.setLevel(logging.WARNING)
+    result = replay(InputRecording.load(arguments.path), stop_on_divergence=not arguments.keep_going)
+    print(json.dumps(result))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,8 @@ Module describing all menus present in the game.
 import time
 import pygame
 
-from breakout_game.utils.path_utils import get_asset_path
+from breakout_game.utils.backgrounds import load_background
+from breakout_game.utils.text_renderer import get_font
 from breakout_game.config import settings
 
 
@@ -15,26 +16,31 @@ class MainMenu:
     Note:
         It may be better to create a parent "Screen" class.
 
+    Every option is rendered once in both states and the menu is composed into a cached frame.
+    The frame is composed again only when the selection changes.
+
     Attributes:
         background (pygame.Surface): Background image of the menu.
-        font (pygame.font.Font): Font of the menu.
+        font (GlyphAtlasFont): Font of the menu.
         options (list): Menu options. Defaults to ['EASY', 'NORMAL', 'HARD']
         selected_option (int): Index of the selected menu option. Defaults to 1.
         title_surface (pygame.Surface): Title of the menu.
         title_rect (pygame.Rect): Rectangle of the title of the menu.
+        option_surfaces (list[tuple[pygame.Surface, pygame.Surface]]):
+            The rendered options. Each option as a tuple of (not selected, selected).
+        option_rects (list[pygame.Rect]): Rectangles of the options.
         objects_to_blit (list[pygame.Surface, pygame.Rect]): List of pygame objects to pass later to blit method.
+        frame (pygame.Surface): The composed menu: the background with the objects to blit drawn on it.
+        composed_option (int): Index of the option selected in the composed frame.
         active (bool): If the menu is active. Defaults to True.
         last_pressed (float): When was the last time the options changed. Used for smooth selection.
     """
     def __init__(self):
-        # Load and scale the background image
-        background_image_path = get_asset_path('images/background/menu.png')
-        self.background = pygame.image.load(background_image_path).convert()
-        self.background = pygame.transform.scale(self.background, (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
-        self.background.set_alpha(20)
+        # Load the background image already scaled to the window
+        self.background = load_background('menu')
 
         # Setup font and text rendering
-        self.font = pygame.font.Font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
+        self.font = get_font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
         self.options = ['EASY', 'NORMAL', 'HARD']
         self.selected_option = 1  # Index of the currently selected option
 
@@ -44,7 +50,18 @@ class MainMenu:
             True,
             (255, 255, 255))
         self.title_rect = self.title_surface.get_rect(center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 4))
+        self.option_surfaces = []
+        self.option_rects = []
+        for i, option in enumerate(self.options):
+            position = (settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2 + i * settings.WINDOW_WIDTH // 15)
+            surfaces = (self.font.render(option, True, (255, 255, 255)), self.font.render(option, True, (255, 0, 0)))
+            self.option_surfaces.append(surfaces)
+            self.option_rects.append(surfaces[0].get_rect(center=position))
         self.objects_to_blit = []
+        self.frame = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            self.frame = self.frame.convert()
+        self.composed_option = None
 
         self.active = True
         self.update_objects_to_blit()
@@ -54,17 +71,18 @@ class MainMenu:
 
     def update_objects_to_blit(self):
         """
-        Update the objects to pass later to blit method.
+        Update the objects to pass later to blit method and compose the frame.
+        Does nothing if the selection has not changed since the last composition.
         """
-        for i, option in enumerate(self.options):
-            position = (settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2 + i * settings.WINDOW_WIDTH // 15)
-            if self.selected_option == i:
-                color = (255, 0, 0)
-            else:
-                color = (255, 255, 255)
-            surface_to_blit = self.font.render(option, True, color)
-            rect_to_blit = surface_to_blit.get_rect(center=position)
-            self.objects_to_blit.append([surface_to_blit, rect_to_blit])
+        if self.composed_option == self.selected_option:
+            return
+        self.objects_to_blit = [[self.title_surface, self.title_rect]]
+        for i, surfaces in enumerate(self.option_surfaces):
+            self.objects_to_blit.append([surfaces[self.selected_option == i], self.option_rects[i]])
+
+        self.frame.blit(self.background, (0, 0))
+        self.frame.blits(self.objects_to_blit, doreturn=False)
+        self.composed_option = self.selected_option
 
     def update(self, keys_pressed: pygame.key.ScancodeWrapper):
         """
@@ -94,14 +112,14 @@ class LevelMenu:
         It may be better to create a parent "Screen" class.
 
     Attributes:
-        font (pygame.font.Font): Font of the menu.
+        font (GlyphAtlasFont): Font of the menu.
         text (str): Text to render.
         text_surface (pygame.Surface): Text in form of pygame.Surface.
         text_rect (pygame.Rect): Rectangle of the surface.
         active (bool): If the menu is active. Defaults to True.
     """
     def __init__(self):
-        self.font = pygame.font.Font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
+        self.font = get_font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
         self.text = 'CONGRATULATIONS! PRESS [ENTER] TO CONTINUE.'
 
         self.text_surface = self.font.render(self.text, True, (255, 255, 255))
@@ -129,37 +147,42 @@ class EndGameMenu:
         It may be better to create a parent "Screen" class.
 
     Attributes:
-        font (pygame.font.Font): Font of the menu.
+        font (GlyphAtlasFont): Font of the menu.
         text (str): Text to render.
         text_surface (pygame.Surface): Text in form of pygame.Surface.
         text_rect (pygame.Rect): Rectangle of the surface.
+        score (None, int): The score shown in the text. Defaults to None.
         active (bool): If the menu is active. Defaults to True.
         restart_needed (bool): If the player decided to restart the game.
     """
     def __init__(self):
-        self.font = pygame.font.Font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
+        self.font = get_font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
         self.text = 'END GAME. PRESS [ENTER] TO RESTART'
 
         self.text_surface = self.font.render(self.text, True, (255, 255, 255))
         self.text_rect = self.text_surface.get_rect(
             center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2)
         )
+        self.score = None
         self.active = False
         self.restart_needed = False
 
     def update(self, keys_pressed: pygame.key.ScancodeWrapper, score: int):
         """
         Update the state of the Menu. Checks if the player has pressed the restart game button.
+        The text is rendered again only if the score has changed.
 
         Args:
             keys_pressed (pygame.key.ScancodeWrapper): Keys pressed.
             score (int): Current game score.
         """
-        self.text = f'YOUR FINAL SCORE: {score}. PRESS [ENTER] TO RESTART'
-        self.text_surface = self.font.render(self.text, True, (255, 255, 255))
-        self.text_rect = self.text_surface.get_rect(
-            center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2)
-        )
+        if score != self.score:
+            self.score = score
+            self.text = f'YOUR FINAL SCORE: {score}. PRESS [ENTER] TO RESTART'
+            self.text_surface = self.font.render(self.text, True, (255, 255, 255))
+            self.text_rect = self.text_surface.get_rect(
+                center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2)
+            )
         if self.active:
             if keys_pressed[pygame.K_RETURN]:
                 self.active = False
@@ -174,14 +197,14 @@ class PauseMenu:
         It may be better to create a parent "Screen" class.
 
     Attributes:
-        font (pygame.font.Font): Font of the menu.
+        font (GlyphAtlasFont): Font of the menu.
         text (str): Text to render.
         text_surface (pygame.Surface): Text in form of pygame.Surface.
         text_rect (pygame.Rect): Rectangle of the surface.
         active (bool): If the menu is active. Defaults to True.
     """
     def __init__(self):
-        self.font = pygame.font.Font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
+        self.font = get_font(settings.GAME_FONT, settings.MENU_FONT_SIZE)
         self.text = 'PAUSE. PRESS [SPACE] TO CONTINUE.'
 
         self.text_surface = self.font.render(self.text, True, (255, 255, 255))
@@ -0,0 +1,77 @@
+"""
+Module describing the ball sprite: the look of a ball of the game core.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame
+
+from breakout_game.utils import path_utils
+from breakout_game.utils.asset_cache import asset_cache
+from breakout_game.sprites.sprite import _GameSprite
+
+if TYPE_CHECKING:
+    from sprite_manager import SpriteManager
+    from breakout_game.core.ball import BallState
+
+
+def get_ball_image(size: tuple[int, int], tint: [None, tuple] = None) -> pygame.Surface:
+    """
+    Get the ball image variant of the size and tint. Each variant is created once and shared by all balls.
+
+    Args:
+        size (tuple[int, int]): The size of the ball.
+        tint (None, tuple): The color added to the image. Defaults to None. If None, the image is not tinted.
+
+    Returns:
+        pygame.Surface: The image.
+    """
+    return asset_cache.get_image(path_utils.get_asset_path('images/ball/ball.png'), size=size, tint=tint)
+
+
+class Ball(_GameSprite):
+    """
+    Ball sprite. Shows a ball of the game core with the image variant of its size and tint.
+
+    Attributes:
+        ball (BallState): The ball shown.
+        size_factor (int, float): The size factor of the image shown.
+        tint (None, tuple): The tint of the image shown.
+
+    Args:
+        ball (BallState): The ball shown.
+
+    version: 1
+    """
+    def __init__(
+            self,
+            sprite_manager: SpriteManager,
+            sprite_groups: list[pygame.sprite.AbstractGroup],
+            ball: BallState
+    ):
+        image = get_ball_image((ball.width, ball.height), ball.tint)
+        super().__init__(
+            sprite_manager=sprite_manager,
+            sprite_groups=sprite_groups,
+            image=image,
+            rect=image.get_rect(topleft=(round(ball.x), round(ball.y)))
+        )
+        self.ball: BallState = ball
+        self.size_factor: (int, float) = ball.size_factor
+        self.tint: [None, tuple] = ball.tint
+        self.set_position(ball.x, ball.y, snap=True)
+
+    # pylint: disable=W0221
+    def update(self):
+        """
+        Follow the ball. The image is swapped when powerups change the size or the tint of the ball, and the
+        ball is not interpolated across a change of its size.
+        """
+        resized = self.ball.size_factor != self.size_factor
+        if resized or self.ball.tint != self.tint:
+            self.size_factor, self.tint = self.ball.size_factor, self.ball.tint
+            self.image = get_ball_image((self.ball.width, self.ball.height), self.tint)
+            self.rect = self.image.get_rect()
+        self.set_position(self.ball.x, self.ball.y, snap=resized)
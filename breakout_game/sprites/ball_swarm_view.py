@@ -0,0 +1,75 @@
+"""
+Module describing the view of the ball swarm: all balls of the swarm drawn with one shared image.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pygame
+
+from breakout_game.sprites.ball import get_ball_image
+
+if TYPE_CHECKING:
+    from breakout_game.core.ball_swarm import BallSwarm
+
+
+class BallSwarmView:
+    """
+    Draws the balls of the swarm of the game core without a sprite per ball.
+
+    Attributes:
+        ball_swarm (BallSwarm): The swarm drawn.
+        drawn_rects (list[pygame.Rect]): The areas the balls were drawn at in the last frame.
+
+    Args:
+        ball_swarm (BallSwarm): The swarm drawn.
+
+    version: 1
+    """
+    def __init__(self, ball_swarm: BallSwarm):
+        self.ball_swarm: BallSwarm = ball_swarm
+        self.drawn_rects: list[pygame.Rect] = []
+
+    @property
+    def image(self) -> pygame.Surface:
+        """
+        The shared image variant of the size and tint of the swarm.
+
+        Returns:
+            pygame.Surface: The image.
+        """
+        return get_ball_image(self.ball_swarm.get_size(), self.ball_swarm.tint)
+
+    def clear_drawn(self, surface: pygame.Surface, background: pygame.Surface):
+        """
+        Erase the balls drawn in the last frame.
+
+        Args:
+            surface (pygame.Surface): The surface the balls were drawn on.
+            background (pygame.Surface): The surface to copy the erased areas from.
+        """
+        surface.blits([(background, rect, rect) for rect in self.drawn_rects], doreturn=False)
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> list[pygame.Rect]:
+        """
+        Draw all balls with one Surface.blits call.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            alpha (float): The progress from the previous physics step (0) to the last one (1) to draw the balls
+                at. Defaults to 1.
+
+        Returns:
+            list[pygame.Rect]: The areas changed, the areas of the last frame included.
+        """
+        dirty_rects = self.drawn_rects
+        self.drawn_rects = []
+        swarm = self.ball_swarm
+        if len(swarm) > 0:
+            image = self.image
+            positions = swarm.previous_positions + (swarm.positions - swarm.previous_positions) * alpha
+            self.drawn_rects = surface.blits(
+                [(image, topleft) for topleft in np.rint(positions).astype(int).tolist()]
+            )
+        return dirty_rects + self.drawn_rects
@@ -1,22 +1,25 @@
 """
-Module describing all sprite objects in the game.
+Module describing all sprite objects in the game. Sprites show the state of the game core and hold no rules.
 """
 
 from __future__ import annotations
 
-import math
 import time
 
+from collections import deque
+from decimal import Decimal
+
 from typing import TYPE_CHECKING
 
 import pygame
 
 from breakout_game.config import settings
-from breakout_game.utils import path_utils
-from breakout_game.sprites.powerup_manager import PowerUpManager
+from breakout_game.utils.text_renderer import GlyphAtlasFont
 
 if TYPE_CHECKING:
     from sprite_manager import SpriteManager
+    from breakout_game.core.entities import PaddleState, PowerUpState
+    from breakout_game.core.powerup_manager import PowerUpTimer
 
 
 class _GameSprite(pygame.sprite.Sprite):
@@ -32,17 +35,8 @@ class _GameSprite(pygame.sprite.Sprite):
         rect (pygame.Rect): An instance of the pygame.Rect class
         position (pygame.math.Vector2): Position of sprite on the screen.
             Defaults to pygame.math.Vector2(rect.topleft)
-        direction (pygame.math.Vector2): Direction in which sprites moves along x and y-axis.
-            Defaults to pygame.math.Vector2((0, 0)
-        speed (int, float): Speed of movement. Defaults to 0
-        original_image (pygame.Surface): A copy of the original image provided during construction.
-            Defaults to image.copy(). Used primarily for powerup handling.
-        original_rect (pygame.Rect): A copy of the original rectangle provided during construction.
-            Defaults to rect.copy(). Used primarily for powerup handling.
-        original_width (int): The width of the original rectangle.
-            Defaults to rect.width. Used primarily for powerup handling.
-        original_height (int): The height of the original rectangle.
-            Defaults to rect.width. Used primarily for powerup handling.
+        previous_position (pygame.math.Vector2): Position of sprite before the last physics step.
+            Used to interpolate the rendered position. Defaults to a copy of position.
 
     Args:
         sprite_manager (SpriteManager): Instance of the sprites.SpriteManager class.
@@ -60,22 +54,16 @@ class _GameSprite(pygame.sprite.Sprite):
             rect: pygame.Rect
     ):
         pygame.sprite.Sprite.__init__(self)
-        for group in sprite_groups:
-            self.add(group)
-
         self.sprite_manager = sprite_manager
         self.sprite_groups = sprite_groups
         self.image = image
         self.rect = rect
+        # Groups may index the sprite by its rectangle, so it is set first
+        for group in sprite_groups:
+            self.add(group)
 
         self.position = pygame.math.Vector2(self.rect.topleft)  # pylint: disable=I1101
-        self.direction = pygame.math.Vector2((0, 0))  # pylint: disable=I1101
-        self.speed = 0
-
-        self.original_image = self.image.copy()
-        self.original_rect = self.rect.copy()
-        self.original_width = self.rect.width
-        self.original_height = self.rect.height
+        self.previous_position = self.position.copy()
 
     def update(self, *args, **kwargs):
         """
@@ -83,111 +71,49 @@ class _GameSprite(pygame.sprite.Sprite):
         """
         raise NotImplementedError('Sprite class must implement "update" method')
 
-    def movement(self, delta_time: (int, float)):
+    def set_position(self, x: float, y: float, snap: bool = False):
         """
-        Updates the position of sprite based on current position, speed, delta time and direction.
+        Move the sprite to the position of the object it shows.
 
         Args:
-        delta_time (int, float): Time passed since last frame.
-        """
-        self.position.x += self.direction.x * self.speed * delta_time
-        self.position.y += self.direction.y * self.speed * delta_time
-        self.rect.x = round(self.position.x)
-        self.rect.y = round(self.position.y)
-
-    def update_position_from_rect(self):
-        """
-        Update position attribute for rectangle attribute.
+            x (float): The left side of the object.
+            y (float): The top side of the object.
+            snap (bool): If true, the sprite is not interpolated across the change. Defaults to False.
         """
-        self.position.x = self.rect.x
-        self.position.y = self.rect.y
+        self.position.update(x, y)
+        self.rect.topleft = round(x), round(y)
+        if snap:
+            self.previous_position.update(self.position)
 
-    def change_size(
-            self,
-            new_width: int,
-            new_height: int
-    ):
+    def get_interpolated_topleft(self, alpha: float) -> tuple[int, int]:
         """
-        Change size of the sprite based on the new width and height provided.
-
-        The new image is created from the original one. Does not handle active powerups.
+        Get the position between the previous and the current physics step.
 
         Args:
-            new_width (int): New width.
-            new_height (int): New height.
-        :return:
-        """
-        rect_center = self.rect.center
-        self.image = pygame.transform.scale(self.original_image, (new_width, new_height))
-        self.rect = self.image.get_rect(center=rect_center)
-        self.rect.height = new_height
-        self.update_position_from_rect()
+            alpha (float): The progress from the previous step (0) to the current one (1).
 
-    def change_image(
-            self,
-            new_image: pygame.Surface,
-            new_width: int,
-            new_height: int
-    ):
-        """
-        Change image of the sprite based on the image, new width and height provided.
-
-        The new image is created from the provided one. Does not handle active powerups.
-
-        Args:
-            new_image (pygame.Surface): New image of type pygame.Surface.
-            new_width (int): New width.
-            new_height (int): New height.
-        """
-        rect_center = self.rect.center
-        self.image = pygame.transform.scale(new_image, (new_width, new_height))
-        self.rect = self.image.get_rect(center=rect_center)
-        self.update_position_from_rect()
-
-    def restore_size(self):
-        """
-        Restore size of the sprite based on the original width and original height. Scales the current image.
-        """
-        rect_center = self.rect.center
-        self.image = pygame.transform.scale(self.image, (self.original_width, self.original_height))
-        self.rect = self.image.get_rect(center=rect_center)
-        self.update_position_from_rect()
-
-    def restore_image(self):
-        """
-        Restore image of the sprite based on the original one.
+        Returns:
+            tuple[int, int]: The top left corner to render the sprite at.
         """
-        rect_center = self.rect.center
-        self.image = self.original_image.copy()
-        self.rect = self.image.get_rect(center=rect_center)
-        self.update_position_from_rect()
+        position = self.previous_position.lerp(self.position, alpha)
+        return round(position.x), round(position.y)
 
 
-class Heart(_GameSprite):
+class _TextSprite(_GameSprite):
     """
-    Sprite representing the hearts - player's health points.
-    """
-    def __init__(
-            self,
-            sprite_manager: SpriteManager,
-            sprite_groups: list[pygame.sprite.AbstractGroup],
-            image: pygame.Surface,
-            rect: pygame.Rect
-    ):
-        super().__init__(sprite_manager=sprite_manager, sprite_groups=sprite_groups, image=image, rect=rect)
-
-    # pylint: disable=W0221
-    def update(self, *args, **kwargs):
-        pass
+    Base class for sprites showing a text. The text is rendered again only when it changes.
 
+    Attributes:
+        font (GlyphAtlasFont): The font to use for the text.
+        color (pygame.Color): The color to use for the text.
+        text (None, str): The text rendered last. Defaults to None.
+        render_times (deque): The times of the renders during the last second.
 
-class Player(_GameSprite):
-    """
-    Player sprite representing the paddle and the player.
+    Args:
+        font (GlyphAtlasFont): The font to use for the text.
+        color (pygame.Color): The color to use for the text.
 
-    Attributes:
-        health (int): The health of the player.
-        lost_hp_sound (pygame.mixer.Sound): The sound of the player loosing a health point.
+    version: 1
     """
     def __init__(
             self,
@@ -195,146 +121,78 @@ class Player(_GameSprite):
             sprite_groups: list[pygame.sprite.AbstractGroup],
             image: pygame.Surface,
             rect: pygame.Rect,
+            font: GlyphAtlasFont,
+            color: pygame.Color
     ):
         super().__init__(sprite_manager=sprite_manager, sprite_groups=sprite_groups, image=image, rect=rect)
-        self.health: int = settings.MAX_PLAYER_HEALTH
-        self.speed = settings.DEFAULT_PADDLE_SPEED
+        self.font: GlyphAtlasFont = font
+        self.color: pygame.Color = color
+        self.text: [None, str] = None
+        self.render_times: deque = deque()
 
-        lost_hp_sound_path = path_utils.get_asset_path('sounds/lost_hp.mp3')
-        self.lost_hp_sound: pygame.mixer.Sound = pygame.mixer.Sound(lost_hp_sound_path)
+    def update(self, *args, **kwargs):
+        raise NotImplementedError('Text sprite class must implement "update" method')
 
-    def check_screen_constraint(self):
-        """
-        Check if the paddle hits the screen boundaries and adjust position accordingly.
+    def set_text(self, text: str):
         """
-        if self.rect.right > settings.GAME_WINDOW_WIDTH:
-            self.rect.right = settings.GAME_WINDOW_WIDTH
-            self.position.x = self.rect.x
+        Render the text if it differs from the text rendered last and realign the image.
 
-        if self.rect.left < 0:
-            self.rect.left = 0
-            self.position.x = self.rect.x
-
-    def loose_health(self):
-        """
-        Make player loose health.
-        """
-        if self.health >= 1:
-            self.health -= 1
-            heart_sprites = self.sprite_manager.heart_sprites_group.sprites()
-            heart_sprites[-1].kill()
-            self.sprite_manager.score_sprites_group.sprites()[0].subtract_score(200)
-            self.lost_hp_sound.stop()
-            self.lost_hp_sound.play()
-
-    def add_health(self):
-        """
-        Add health to the player.
+        Args:
+            text (str): The text to show.
         """
-        if self.health < settings.MAX_PLAYER_HEALTH:
-            self.health += 1
-            heart_horizontal_gap = settings.SCOREBOARD_WIDTH // (settings.MAX_PLAYER_HEALTH + 1)
+        if text == self.text:
+            return
+        old_rect_center = self.rect.center
+        self.image = self.font.render(text, True, self.color)
+        self.rect = self.image.get_rect(center=old_rect_center)
+        self.text = text
 
-            heart_midtop = (
-                settings.GAME_WINDOW_WIDTH + self.health * heart_horizontal_gap,
-                settings.GAME_WINDOW_HEIGHT // 7
-            )
-            self.sprite_manager.create_heart(midtop=heart_midtop)
+        current_time = time.perf_counter()
+        self.render_times.append(current_time)
+        while current_time - self.render_times[0] > 1:
+            self.render_times.popleft()
 
-    # pylint: disable=W0221
-    def update(self, delta_time: (int, float), keys_pressed: pygame.key.ScancodeWrapper):
+    @property
+    def renders_per_second(self) -> int:
         """
-        Checks which keys are pressed and updates the paddle position.
+        The number of times the text was rendered during the last second.
 
-        Args:
-            delta_time (int, float): The time passed since last frame.
-            keys_pressed (pygame.key.ScancodeWrapper): Keys pressed.
+        Returns:
+            int: The number of renders.
         """
-        if keys_pressed[pygame.K_RIGHT]:  # pylint: disable=E1101
-            self.direction.x = 1
-        elif keys_pressed[pygame.K_LEFT]:  # pylint: disable=E1101
-            self.direction.x = -1
-        else:
-            self.direction.x = 0
+        current_time = time.perf_counter()
+        while self.render_times and current_time - self.render_times[0] > 1:
+            self.render_times.popleft()
+        return len(self.render_times)
 
-        self.movement(delta_time)
-        self.check_screen_constraint()
-        self.rect.x = round(self.position.x)
 
-
-class Score(_GameSprite):
+class Heart(_GameSprite):
     """
-    Sprite representing a score on the scoreboard.
-
-    Attributes:
-        score (int): The score to draw on the scoreboard.
-        font (pygame.font.Font): The font to use for the score.
-        color (pygame.Color): The color to use for the score.
-
-    Args:
-        font (pygame.font.Font): The font to use for the score.
-        color (pygame.Color): The color to use for the score.
-
-    version: 1
+    Sprite representing the hearts - player's health points.
     """
     def __init__(
             self,
             sprite_manager: SpriteManager,
             sprite_groups: list[pygame.sprite.AbstractGroup],
             image: pygame.Surface,
-            rect: pygame.Rect,
-            font: pygame.font.Font,
-            color: pygame.Color
+            rect: pygame.Rect
     ):
         super().__init__(sprite_manager=sprite_manager, sprite_groups=sprite_groups, image=image, rect=rect)
-        self.score: int = 0
-        self.font: pygame.font.Font = font
-        self.color: pygame.Color = color
-
-    def add_score(self, points: int):
-        """
-        Add score to the object.
-
-        Args:
-            points (int): Points to add.
-        """
-        self.score += points
-
-    def subtract_score(self, points: int):
-        """
-        Subtract score from the object.
-
-        Args:
-            points (int): Points to subtract.
-
-        Returns:
-
-        """
-        self.score -= points
 
+    # pylint: disable=W0221
     def update(self, *args, **kwargs):
-        """
-        Update the score based on the new score and realign the text.
-        Returns:
-
-        """
-        old_rect_center = self.rect.center
-        self.image = self.font.render(f'Score: {self.score}', True, self.color)
-        self.rect = self.image.get_rect(center=old_rect_center)
+        pass
 
 
-class PowerUp(_GameSprite):
+class Player(_GameSprite):
     """
-    Sprite representing a powerup icon in the game.
+    Player sprite showing the paddle.
 
     Attributes:
-        power (str): The name of the powerup.
-        powerup_manager (PowerUpManager): The PowerUpManager instance which handles the behaviour of powerups.
-        powerup_sound (pygame.mixer.Sound): The sound to play when player catches the powerup.
+        paddle (PaddleState): The paddle shown.
 
     Args:
-        power (str): The name of the powerup.
-        powerup_manager (PowerUpManager): The PowerUpManager instance which handles the behaviour of powerups.
+        paddle (PaddleState): The paddle shown.
 
     version: 1
     """
@@ -344,70 +202,33 @@ class PowerUp(_GameSprite):
             sprite_groups: list[pygame.sprite.AbstractGroup],
             image: pygame.Surface,
             rect: pygame.Rect,
-            powerup_manager: PowerUpManager,
-            power: str = ''
+            paddle: PaddleState
     ):
         super().__init__(sprite_manager=sprite_manager, sprite_groups=sprite_groups, image=image, rect=rect)
+        self.paddle: PaddleState = paddle
 
-        self.direction = pygame.math.Vector2((0, 1))  # pylint: disable=I1101
-        self.speed = settings.DEFAULT_POWERUP_SPEED
-        self.power: str = power
-        self.powerup_manager: PowerUpManager = powerup_manager
-
-        powerup_sound_path = path_utils.get_asset_path('sounds/get powerup.mp3')
-        self.powerup_sound: pygame.mixer.Sound = pygame.mixer.Sound(powerup_sound_path)
-        self.powerup_sound.set_volume(0.3)
-
-    def activate(self):
-        """
-        Activate the powerup. Checks for timers on the scoreboard and conflicting powers. Plays the sound.
-        """
-        self.powerup_manager.activate_powerup(self.power)
-        if settings.POWERS[self.power]['time'] != -1:
-            powerup_timers_in_game = self.sprite_manager.power_up_timer_info_group.sprites()
-            for powerup_timer in powerup_timers_in_game:
-
-                powerup_timer_power_name = powerup_timer.power_name
-                conflicting_power = settings.POWERS[powerup_timer_power_name]['conflicting-power']
-
-                if powerup_timer_power_name == self.power:
-                    powerup_timer.kill()
-                elif conflicting_power is not None:
-                    if conflicting_power == self.power:
-                        powerup_timer.kill()
-            self.sprite_manager.create_powerup_timer_info(self.power, settings.POWERS[self.power]['time'])
-        self.powerup_sound.stop()
-        self.powerup_sound.play()
-
-    def update(self, delta_time: (int, float)):  # pylint: disable=W0221
+    # pylint: disable=W0221
+    def update(self):
         """
-        Update the position of the sprite and check if it hit the paddle.
-
-        Args:
-            delta_time (int, float): Time passed since the last frame.
+        Follow the paddle. The image is created again when the paddle changes its width.
         """
-        if self.rect.top > settings.GAME_WINDOW_HEIGHT:
-            self.kill()
-        if pygame.sprite.collide_rect(self, self.sprite_manager.player_sprites_group.sprites()[0]):
-            self.activate()
-            self.sprite_manager.score_sprites_group.sprites()[0].add_score(
-                100 * (self.sprite_manager.level_difficulty + 1)
-            )
-            self.kill()
-        self.movement(delta_time)
+        resized = self.paddle.width != self.rect.width
+        if resized:
+            self.image = pygame.Surface(size=(self.paddle.width, self.paddle.height))
+            self.image.fill('white')
+            self.rect = self.image.get_rect()
+        self.set_position(self.paddle.x, self.paddle.y, snap=resized)
 
 
-class Block(_GameSprite):
+class Score(_TextSprite):
     """
-    Block sprite.
-
-    Attributes:
-        health (int): Health of the block.
-        hit_sound (pygame.mixer.Sound): Sound played when block is hit.
-        break_sound (pygame.mixer.Sound): Sound played when block is broken.
+    Sprite representing a score on the scoreboard.
 
     Args:
-        health (int): Health of the block.
+        font (GlyphAtlasFont): The font to use for the score.
+        color (pygame.Color): The color to use for the score.
+
+    version: 1
     """
     def __init__(
             self,
@@ -415,75 +236,37 @@ class Block(_GameSprite):
             sprite_groups: list[pygame.sprite.AbstractGroup],
             image: pygame.Surface,
             rect: pygame.Rect,
-            health: int,
+            font: GlyphAtlasFont,
+            color: pygame.Color
     ):
-        super().__init__(sprite_manager=sprite_manager, sprite_groups=sprite_groups, image=image, rect=rect)
-        self.health = health
-        self.update_image()
-
-        hit_sound_path = path_utils.get_asset_path('sounds/hit blocks.mp3')
-        self.hit_sound = pygame.mixer.Sound(hit_sound_path)
-        self.hit_sound.set_volume(0.25)
-
-        break_sound_path = path_utils.get_asset_path('sounds/break blocks.mp3')
-        self.break_sound = pygame.mixer.Sound(break_sound_path)
-        self.break_sound.set_volume(0.75)
-
-    def get_damage(self, amount: int):
-        """
-        Get damage based on the amount of damage specified
-
-        Args:
-            amount (int): The amount of damage.
-        """
-        self.health -= amount
-        if self.health <= 0:
-            self.sprite_manager.score_sprites_group.sprites()[0].add_score(
-                30 * (self.sprite_manager.level_difficulty + 1)
-            )
-            self.break_sound.stop()
-            self.break_sound.play()
-            self.kill()
-            self.sprite_manager.drop_powerup(self)
-        else:
-            self.sprite_manager.score_sprites_group.sprites()[0].add_score(
-                10 * (self.sprite_manager.level_difficulty + 1)
-            )
-            self.hit_sound.stop()
-            self.hit_sound.play()
-
-    def update_image(self):
-        """
-        Update the image of the block based on health.
-        """
-        if self.health in settings.COLOR_LEGEND:
-            new_image = pygame.image.load(settings.COLOR_LEGEND[self.health])
-            self.change_image(new_image, settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT)
+        super().__init__(
+            sprite_manager=sprite_manager,
+            sprite_groups=sprite_groups,
+            image=image,
+            rect=rect,
+            font=font,
+            color=color
+        )
 
     def update(self, *args, **kwargs):
         """
-        Update the sprite.
+        Update the score based on the score of the game and realign the text. The text is rendered only if
+        the score has changed.
         """
-        self.update_image()
+        self.set_text(f'Score: {self.sprite_manager.core.score}')
 
 
-class Ball(_GameSprite):
+class PowerUp(_GameSprite):
     """
-    Ball sprite. Handles collision detection and bouncing.
+    Sprite representing a powerup icon in the game.
 
     Attributes:
-        speed (int): Speed of the ball.
-        original_speed (int): Original speed of the ball. Used for powerups.
-        strength (int): Strength of the ball. Used to detect how much damage is dealt to blocks.
-            Defaults to 1
-        original_strength (int): Original strength of the ball. Used for powerups.
-        time_delay_counter (int, float): Time to delay when ball is lost before activating it again.
-        hit_paddle_sound (pygame.mixer.Sound): Sound to play when ball hits the paddle.
-        active (bool): Whether the ball is active or not.
-            Defaults to False
+        powerup (PowerUpState): The falling powerup shown.
 
     Args:
-        speed (int): Speed of the ball.
+        powerup (PowerUpState): The falling powerup shown.
+
+    version: 1
     """
     def __init__(
             self,
@@ -491,304 +274,17 @@ class Ball(_GameSprite):
             sprite_groups: list[pygame.sprite.AbstractGroup],
             image: pygame.Surface,
             rect: pygame.Rect,
-            speed: int
+            powerup: PowerUpState
     ):
         super().__init__(sprite_manager=sprite_manager, sprite_groups=sprite_groups, image=image, rect=rect)
-
-        self.direction = pygame.math.Vector2((0, -1))  # pylint: disable=I1101
-
-        self.speed = speed
-        self.original_speed = speed
-
-        self.strength = 1
-        self.original_strength = 1
-
-        self.time_delay_counter = 0
-
-        hit_paddle_sound_path = path_utils.get_asset_path('sounds/hit paddle.mp3')
-        self.hit_paddle_sound = pygame.mixer.Sound(hit_paddle_sound_path)
-        self.active = False
-
-    def get_angle_of_direction(self):
-        """
-        Get the angle of direction in radians
-        """
-        return math.atan2(self.direction[1], self.direction[0])
-
-    def set_direction_from_angle(self, angle: (int, float)):
-        """
-        Set direction from the angle presented in radians.
-
-        Args:
-            angle (int, float): Angle in radians
-        """
-        self.direction = pygame.math.Vector2((math.cos(angle), math.sin(angle)))  # pylint: disable=I1101
-
-    def change_speed(self, new_speed: int):
-        """
-        Change the speed of the ball. Used in powerups.
-
-        Args:
-            new_speed (int): New speed of the ball.
-        """
-        self.speed = new_speed
-
-    def restore_speed(self):
-        """
-        Restore the original speed of the ball. Used in powerups.
-        """
-        self.speed = self.original_speed
-
-    def change_strength(self, new_strength: int):
-        """
-        Change the strength of the ball. Used in powerups.
-
-        Args:
-            new_strength (int): New strength of the ball.
-        """
-        self.strength = new_strength
-
-    def restore_strength(self):
-        """
-        Restore the original strength of the ball. Used in powerups.
-        """
-        self.strength = self.original_strength
-
-    def loose_ball(self):
-        """
-        Loose the ball, make it inactive and make player loose health.
-        """
-        self.time_delay_counter = time.time()
-        if len(self.sprite_manager.ball_sprites_group.sprites()) == 1:
-            self.sprite_manager.player_sprites_group.sprites()[0].loose_health()
-            self.active = False
-        else:
-            self.kill()
-
-    def frame_collision(self):
-        """
-        Check if the ball collides with the game window, change its direction and position.
-        """
-        # Hit the left side of the game window
-        if self.rect.left < 0:
-            self.rect.left = 0
-            self.position.x = 0
-            self.direction.x *= -1
-
-        # Hit the right side of the game window
-        elif self.rect.right > settings.GAME_WINDOW_WIDTH:
-            self.rect.right = settings.GAME_WINDOW_WIDTH
-            self.position.x = self.rect.topleft[0]
-            self.direction.x *= -1
-
-        # Hit the top of the game window
-        if self.rect.top < 0:
-            self.rect.top = 0
-            self.position.y = 0
-            self.direction.y *= -1
-
-        # Hit the bottom of the game window
-        elif self.rect.top > settings.GAME_WINDOW_HEIGHT:
-            self.loose_ball()
-
-    def get_overlapping_rect(self, colliding_sprites: list) -> pygame.rect.Rect:
-        """
-        Get overlapping rectangle from the colliding sprites.
-        The rectangle is calculated as the biggest rectangle which encapsulates all the overlap rectangles.
-
-        Args:
-            colliding_sprites (list): List of colliding sprites.
-
-        Returns:
-            pygame.rect.Rect: The overlapping rectangle.
-        """
-        total_overlap_left = settings.GAME_WINDOW_WIDTH
-        total_overlap_right = 0
-        total_overlap_top = settings.GAME_WINDOW_HEIGHT
-        total_overlap_bottom = 0
-
-        # Calculate the overall area of overlapping
-        for sprite in colliding_sprites:
-            overlap = self.rect.clip(sprite.rect)
-            total_overlap_left = min(total_overlap_left, overlap.left)
-            total_overlap_right = max(total_overlap_right, overlap.right)
-            total_overlap_top = min(total_overlap_top, overlap.top)
-            total_overlap_bottom = max(total_overlap_bottom, overlap.bottom)
-
-        # Keyword arguments do not work here
-        overlap_rect = pygame.rect.Rect(  # pylint: disable=I1101
-            total_overlap_left,  # left
-            total_overlap_top,  # top
-            abs(total_overlap_right - total_overlap_left),  # width
-            abs(total_overlap_bottom - total_overlap_top)  # height
-        )
-        return overlap_rect
-
-    def handle_vertical_collision(self, overlapping_rect: pygame.Rect):
-        """
-        Handle the collision in vertical direction. Adjust the position and direction.
-
-        Args:
-            overlapping_rect (pygame.Rect): Overlapping rectangle obtained from get_overlapping_rect
-        """
-        if self.direction.y < 0:
-            self.rect.top = overlapping_rect.bottom
-        else:
-            self.rect.bottom = overlapping_rect.top
-        self.direction.y *= -1
-
-    def handle_horizontal_collision(self, overlapping_rect: pygame.Rect):
-        """
-        Handle the collision in horizontal direction. Adjust the position and direction.
-
-        Args:
-            overlapping_rect (pygame.Rect): Overlapping rectangle obtained from get_overlapping_rect
-        """
-        if self.direction.x < 0:
-            self.rect.left = overlapping_rect.right
-        else:
-            self.rect.right = overlapping_rect.left
-        self.direction.x *= -1
-
-    def handle_diagonal_collision(self, overlapping_rect: pygame.Rect):
-        """
-        Handle the collision in diagonal direction. Adjust the position and direction.
-
-        Args:
-            overlapping_rect (pygame.Rect): Overlapping rectangle obtained from get_overlapping_rect
-        """
-        if self.direction.x < 0:
-            self.rect.left = overlapping_rect.right
-        else:
-            self.rect.right = overlapping_rect.left
-        self.direction.x *= -1
-        if self.direction.y < 0:
-            self.rect.top = overlapping_rect.bottom
-        else:
-            self.rect.bottom = overlapping_rect.top
-        self.direction.y *= -1
-
-    def handle_hor_hit_by_player(self, colliding_players: list[Player]):
-        """
-        Handle hit by player colliding with the ball in horizontal direction
-
-        Note:
-            It is a special case to prevent the ball from clipping inside the paddle.
-
-        Args:
-            colliding_players (list[Player]): List of player sprites
-        """
-        player_direction_x = colliding_players[0].direction.x
-        paddle_path_per_frame = abs(round(player_direction_x * colliding_players[0].speed / settings.FPS))
-        if player_direction_x > 0:
-            self.rect.x += paddle_path_per_frame * 3
-        else:
-            self.rect.x -= paddle_path_per_frame * 3
-
-        self.direction.x = player_direction_x
-
-    def paddle_adjust_angle(self, overlapping_rect: pygame.Rect):
-        """
-        Adjust the angle of the ball according to the position of the hit point.
-
-        Args:
-            overlapping_rect (pygame.Rect): Overlapping rectangle obtained from get_overlapping_rect.
-        """
-        hit_point_x = overlapping_rect.centerx
-        paddle_middle = self.sprite_manager.player_sprites_group.sprites()[0].rect.centerx
-        paddle_width = self.sprite_manager.player_sprites_group.sprites()[0].rect.width
-
-        dist_from_paddle_center = hit_point_x - paddle_middle
-        angle_ratio = abs(dist_from_paddle_center) / (paddle_width / 2)
-        if angle_ratio != 0:
-            resulting_angle = math.pi / 2 - angle_ratio * (math.pi / 2 - math.pi / 6)
-            resulting_cotangent = 1 / math.tan(resulting_angle)
-
-            if dist_from_paddle_center > 0:
-                self.direction.x = resulting_cotangent * abs(self.direction.y)
-            else:
-                self.direction.x = -1 * resulting_cotangent * abs(self.direction.y)
-        else:
-            self.direction.x = 0
-
-    def handle_bounce(self, overlapping_rect: pygame.rect.Rect, colliding_players: list[Player]):
-        """
-        General method to handle bounce movement.
-
-        Args:
-            overlapping_rect (pygame.rect.Rect): Overlapping rectangle obtained from get_overlapping_rect.
-            colliding_players (list[Player]): List of paddles that collide with the ball.
-        """
-        if len(colliding_players) > 0:
-            if overlapping_rect.height > overlapping_rect.width:
-                self.handle_hor_hit_by_player(colliding_players)
-            elif overlapping_rect.width > overlapping_rect.height:
-                self.handle_vertical_collision(overlapping_rect)
-                self.paddle_adjust_angle(overlapping_rect)
-            else:
-                self.handle_diagonal_collision(overlapping_rect)
-        else:
-            # Vertical
-            if overlapping_rect.width > overlapping_rect.height:
-                self.handle_vertical_collision(overlapping_rect)
-            # Horizontal
-            if overlapping_rect.height > overlapping_rect.width:
-                self.handle_horizontal_collision(overlapping_rect)
-            # Diagonal
-            if overlapping_rect.height == overlapping_rect.width:
-                self.handle_diagonal_collision(overlapping_rect)
-
-    def handle_collisions(self):
-        """
-        General method to handle collisions between blocks and paddles.
-        """
-        colliding_blocks = pygame.sprite.spritecollide(self, self.sprite_manager.block_sprites_group, False)
-        colliding_players = pygame.sprite.spritecollide(self, self.sprite_manager.player_sprites_group, False)
-        colliding_sprites = colliding_blocks + colliding_players
-        if len(colliding_sprites) > 0:
-            overlap_rect = self.get_overlapping_rect(colliding_sprites=colliding_sprites)
-            self.handle_bounce(overlapping_rect=overlap_rect, colliding_players=colliding_players)
-
-            if len(colliding_players) == 0:
-
-                for sprite in colliding_sprites:
-                    if getattr(sprite, 'health', None):
-                        for _ in range(self.strength):
-                            sprite.get_damage(1)
-            else:
-                self.hit_paddle_sound.stop()
-                self.hit_paddle_sound.play()
-            self.position.x = self.rect.x
-            self.position.y = self.rect.y
+        self.powerup: PowerUpState = powerup
 
     # pylint: disable=W0221
-    def update(self, delta_time: (int, float), keys_pressed: pygame.key.ScancodeWrapper):
+    def update(self):
         """
-        Update the status of the ball. Handle movement, collisions and activation.
-
-        Args:
-            delta_time (int, float):
-            keys_pressed (pygame.key.ScancodeWrapper):
+        Follow the powerup.
         """
-        if self.active:
-
-            if self.direction.magnitude() != 0:
-                self.direction = self.direction.normalize()
-
-            self.movement(delta_time)
-            self.frame_collision()
-            self.handle_collisions()
-
-        else:
-            if time.time() - self.time_delay_counter > 0.5:
-                self.rect.midbottom = self.sprite_manager.player_sprites_group.sprites()[0].rect.midtop
-                self.position = pygame.math.Vector2(self.rect.topleft)  # pylint: disable=I1101
-
-                if keys_pressed[pygame.K_SPACE]:  # pylint: disable=E1101
-                    self.active = True
-                    self.direction = pygame.math.Vector2((0, -1))  # pylint: disable=I1101
-            else:
-                pass
+        self.set_position(self.powerup.x, self.powerup.y)
 
 
 class Scoreboard(_GameSprite):
@@ -808,21 +304,26 @@ class Scoreboard(_GameSprite):
         pass
 
 
-class PowerUpTimerInfo(_GameSprite):
+class PowerUpTimerInfo(_TextSprite):
     """
     Powerup timer info sprite.
     Creates a text on the scoreboard saying how much time is left for the powerup to be active.
 
+    Note:
+        The time left is shown with the granularity of settings.HUD_TIMER_GRANULARITY, so the text is rendered
+        only when the shown value changes.
+
     Attributes:
-        font (pygame.font.Font): The font to use for the text.
-        color (pygame.Color): The color to use for the text.
         power_name (str): The name of the powerup.
-        powerup_time (int, float): The time in seconds for the powerup to be active.
+        timer (PowerUpTimer): The timer of the powerup in the game core.
+        start_time (float): The time of the game the timer was started at.
+        granularity (float): The step of the time shown in seconds.
+        decimals (int): The number of decimals needed to show the granularity.
     Args:
-        font (pygame.font.Font): The font to use for the text.
+        font (GlyphAtlasFont): The font to use for the text.
         color (pygame.Color): The color to use for the text.
         power_name (str): The name of the powerup.
-        powerup_time (int, float): The time in seconds for the powerup to be active.
+        timer (PowerUpTimer): The timer of the powerup in the game core.
     """
     def __init__(
             self,
@@ -830,33 +331,44 @@ class PowerUpTimerInfo(_GameSprite):
             sprite_groups: list[pygame.sprite.AbstractGroup],
             image: pygame.Surface,
             rect: pygame.Rect,
-            font: pygame.font.Font,
+            font: GlyphAtlasFont,
             color: pygame.Color,
             power_name: str,
-            powerup_time: (int, float)
+            timer: PowerUpTimer
     ):
-        super().__init__(sprite_manager=sprite_manager, sprite_groups=sprite_groups, image=image, rect=rect)
+        super().__init__(
+            sprite_manager=sprite_manager,
+            sprite_groups=sprite_groups,
+            image=image,
+            rect=rect,
+            font=font,
+            color=color
+        )
 
-        self.font = font
-        self.color = color
-        self.powerup_time = powerup_time
-        self.start_time = time.time()
+        self.timer = timer
+        self.start_time = timer.start_time
         self.power_name = power_name
+        self.granularity: float = settings.HUD_TIMER_GRANULARITY
+        self.decimals: int = max(0, -Decimal(str(self.granularity)).normalize().as_tuple().exponent)
+
+    @property
+    def outdated(self) -> bool:
+        """
+        Whether the timer has stopped or was started again since the sprite was created.
+
+        Returns:
+            bool: True if the sprite must be replaced.
+        """
+        return not self.timer.active or self.timer.start_time != self.start_time or self.timer.power != self.power_name
 
     # pylint: disable=W0221
-    def update(self, time_in_pause: (int, float) = 0):
+    def update(self):
         """
         Update the text.
-
-        Args:
-            time_in_pause (int, float): Time spent in pause. Defaults to 0.
         """
-        self.start_time += time_in_pause
-        time_left = self.powerup_time - (time.time() - self.start_time)
-        old_rect_center = self.rect.center
+        time_left = self.timer.duration - (self.sprite_manager.core.time - self.start_time) if self.timer.active else 0
         if time_left > 0:
-            self.image = self.font.render(
-                f'{self.power_name.upper()} Time Left: {time_left:.2f}', True, self.color)
-            self.rect = self.image.get_rect(center=old_rect_center)
+            shown_time_left = round(time_left / self.granularity) * self.granularity
+            self.set_text(f'{self.power_name.upper()} Time Left: {shown_time_left:.{self.decimals}f}')
         else:
             self.kill()
@@ -5,62 +5,90 @@ Sprite manager module
 from __future__ import annotations
 
 import random
-import math
 
 from typing import TYPE_CHECKING
 
 import pygame
 
 from breakout_game.config import settings
+from breakout_game.core import GameCore, INPUT_LEFT, INPUT_RIGHT, INPUT_LAUNCH
+from breakout_game.core.powerup_manager import PowerUpTimer
 from breakout_game.utils import path_utils
-from breakout_game.sprites.powerup_manager import PowerUpManager
+from breakout_game.utils.asset_cache import asset_cache
+from breakout_game.utils.mixer_wrapper import sound_bank
+from breakout_game.utils.text_renderer import get_font
+from breakout_game.sprites.static_layer import StaticLayer
+from breakout_game.sprites.ball_swarm_view import BallSwarmView
+
+if TYPE_CHECKING:
+    from breakout_game.core.ball import BallState
+    from breakout_game.core.entities import PowerUpState
 
 if not TYPE_CHECKING:
-    from breakout_game.sprites.sprite import Player, Score, Heart, PowerUp, Ball, Block, Scoreboard, PowerUpTimerInfo
+    from breakout_game.sprites.sprite import Player, Score, Heart, PowerUp, Scoreboard, PowerUpTimerInfo
+    from breakout_game.sprites.ball import Ball
+
+
+def get_inputs(keys_pressed: pygame.key.ScancodeWrapper) -> int:
+    """
+    Convert the keys pressed into the inputs of the game core.
+
+    Args:
+        keys_pressed (pygame.key.ScancodeWrapper): Keys pressed.
+
+    Returns:
+        int: The inputs combined from INPUT_LEFT, INPUT_RIGHT and INPUT_LAUNCH.
+    """
+    inputs = 0
+    if keys_pressed[pygame.K_LEFT]:  # pylint: disable=E1101
+        inputs |= INPUT_LEFT
+    if keys_pressed[pygame.K_RIGHT]:  # pylint: disable=E1101
+        inputs |= INPUT_RIGHT
+    if keys_pressed[pygame.K_SPACE]:  # pylint: disable=E1101
+        inputs |= INPUT_LAUNCH
+    return inputs
 
 
-class SpriteManager:
+class SpriteManager:  # pylint: disable=R0902
     """
-        Sprite manager class.
-        Handles creation of sprites, updates them and draws on the provided surface.
-        Provides interface to access another sprites using the composition pattern.
+        Sprite manager class. The view of the game core.
+        Steps the game core, keeps a sprite for every object of the game in sync with it and draws the sprites
+        on the provided surface. The sprites hold no rules of the game.
         To initialize all game objects init_level method must be called.
 
         Attributes:
-            all_sprites_group (pygame.sprite.Group): Group containing all sprites objects.
-            block_sprites_group (pygame.sprite.Group): Group containing all block sprites.
-            player_sprites_group (pygame.sprite.Group): Group containing all player sprites.
-            ball_sprites_group (pygame.sprite.Group): Group containing all ball sprites.
-            scoreboard_sprites_group (pygame.sprite.Group): Group containing all scoreboard sprites.
-            heart_sprites_group (pygame.sprite.Group): Group containing all heart sprites.
-            power_up_sprites_group (pygame.sprite.Group): Group containing all power up sprites.
-            score_sprites_group (pygame.sprite.Group): Group containing all score sprites.
-            power_up_timer_info_group (pygame.sprite.Group): Group containing all power up timer sprites.
+            all_sprites_group (pygame.sprite.RenderUpdates): Group containing all sprites objects.
+            player_sprites_group (pygame.sprite.RenderUpdates): Group containing all player sprites.
+            ball_sprites_group (pygame.sprite.RenderUpdates): Group containing all ball sprites.
+            scoreboard_sprites_group (pygame.sprite.RenderUpdates): Group containing all scoreboard sprites.
+            heart_sprites_group (pygame.sprite.RenderUpdates): Group containing all heart sprites.
+            power_up_sprites_group (pygame.sprite.RenderUpdates): Group containing all power up sprites.
+            score_sprites_group (pygame.sprite.RenderUpdates): Group containing all score sprites.
+            power_up_timer_info_group (pygame.sprite.RenderUpdates): Group containing all power up timer sprites.
             scoreboard (None, Scoreboard): Scoreboard object.
                 Defaults to None.
             score (None, Score): Scoreboard object.
                 Defaults to None.
-            hearts (list, list[Heart]): List of Heart objects in the game.
-                Defaults to an empty list.
-            blocks (list, list[Block]): List of all block objects in the game.
-                Defaults to an empty list.
             player (None, Player): Player object.
                 Defaults to None.
-            balls (list, list[Ball]): List of all balls in the game.
-                Defaults to an empty list.
-            power_ups (list, list[PowerUp]): List of all power ups in the game.
-                Defaults to an empty list.
-            power_up_infos (list, list[PowerUpTimerInfo]): List of all power up timers in the game.
-                Defaults to an empty list
-            powerup_manager (PowerUpManager): PowerUpManager object, provides status of powerups.
-            level_difficulty (None, int): difficulty of the game.
-                Defaults to None.
+            ball_views (dict): The sprite of each ball of the game core. Defaults to an empty dict.
+            power_up_views (dict): The sprite of each falling powerup of the game core.
+                Defaults to an empty dict.
+            power_up_infos (dict): The timer info sprite of each running powerup timer of the game core.
+                Defaults to an empty dict.
+            core (GameCore): The game shown. Defaults to a new game.
+            static_layer (StaticLayer): The background with blocks and the scoreboard composited on it.
+            ball_swarm_view (BallSwarmView): Draws the extra balls of the multiply-balls powerup.
+
+        Args:
+            core (None, GameCore): The game shown. Defaults to None. If None, a new game is created.
+            rng (None, random.Random): The random generator of the new game. Defaults to None.
+                If None, a generator seeded by the operating system is used. Not used if a game is given.
         """
-    def __init__(self):
+    def __init__(self, core: [None, GameCore] = None, rng: [None, random.Random] = None):
         # Sprites groups
         (
             self.all_sprites_group,
-            self.block_sprites_group,
             self.player_sprites_group,
             self.ball_sprites_group,
             self.scoreboard_sprites_group,
@@ -68,32 +96,32 @@ class SpriteManager:
             self.power_up_sprites_group,
             self.score_sprites_group,
             self.power_up_timer_info_group
-        ) = (pygame.sprite.Group() for _ in range(9))
+        ) = (pygame.sprite.RenderUpdates() for _ in range(8))
 
         self.scoreboard: (None, Scoreboard) = None
         self.score: (None, Score) = None
-        self.hearts: (list, list[Heart]) = []
-        self.blocks: (list, list[Block]) = []
         self.player: (None, Player) = None
-        self.balls: (list, list[Ball]) = []
-        self.power_ups: (list, list[PowerUp]) = []
-        self.power_up_infos: (list, list[PowerUpTimerInfo]) = []
+        self.ball_views: dict = {}
+        self.power_up_views: dict = {}
+        self.power_up_infos: dict = {}
 
-        self.powerup_manager: PowerUpManager = PowerUpManager(self)
-        self.level_difficulty: (None, int) = None
+        self.core: GameCore = core if core is not None else GameCore(rng=rng)
+        self.static_layer: StaticLayer = StaticLayer()
+        self.ball_swarm_view: BallSwarmView = BallSwarmView(self.core.ball_swarm)
 
     def create_scoreboard(self):
         """
         Initialize the scoreboard object.
         """
         scoreboard_image_path = path_utils.get_asset_path('images/background/scoreboard.png')
-        scoreboard_image = pygame.image.load(scoreboard_image_path).convert_alpha()
-        scoreboard_image = pygame.transform.scale(
-            surface=scoreboard_image,
+        scoreboard_image = asset_cache.get_image(
+            scoreboard_image_path,
             size=(settings.SCOREBOARD_WIDTH, settings.WINDOW_HEIGHT)
         )
         scoreboard_rect = scoreboard_image.get_rect(topright=(settings.WINDOW_WIDTH, 0))
 
+        if self.scoreboard is not None:
+            self.scoreboard.kill()
         self.scoreboard = Scoreboard(
             self,
             sprite_groups=[self.all_sprites_group, self.scoreboard_sprites_group],
@@ -106,7 +134,7 @@ class SpriteManager:
         Initialize the score object.
         """
         score_color = pygame.Color('white')
-        score_font = pygame.font.Font(settings.GAME_FONT, size=settings.SCORE_FONT_SIZE)
+        score_font = get_font(settings.GAME_FONT, settings.SCORE_FONT_SIZE)
         score_image = score_font.render('Score: 0', True, score_color)
         score_rect = score_image.get_rect(
             center=(settings.WINDOW_WIDTH - settings.SCOREBOARD_WIDTH // 2, settings.WINDOW_HEIGHT // 4))
@@ -127,185 +155,90 @@ class SpriteManager:
             midtop (tuple): The middle top position of a heart sprite on the screen. Must be a tuple of (x, y)
         """
         heart_image_path = path_utils.get_asset_path('images/hearts/heart_s.png')
-        heart_image = pygame.image.load(heart_image_path).convert_alpha()
-        heart_image = pygame.transform.scale(
-            surface=heart_image,
-            size=(settings.HEART_WIDTH, settings.HEART_HEIGHT)
-        )
+        heart_image = asset_cache.get_image(heart_image_path, size=(settings.HEART_WIDTH, settings.HEART_HEIGHT))
         heart_rect = heart_image.get_rect(midtop=midtop)
-        heart = Heart(
+        Heart(
             self,
             sprite_groups=[self.all_sprites_group, self.heart_sprites_group],
             image=heart_image,
             rect=heart_rect
         )
-        self.hearts.append(heart)
-
-    def create_block(self, health: int, x: int, y: int):
-        """
-        Initialize a block.
-
-        Args:
-            health (int): The health of the block.
-            x (int): The x position of the block.
-            y (int): The y position of the block.
-        """
-        block_image = pygame.image.load(settings.COLOR_LEGEND[health])
-        block_image = pygame.transform.scale(
-            surface=block_image,
-            size=(settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT)
-        )
-        block_rect = block_image.get_rect(topleft=(x, y))
-        block = Block(
-            self,
-            sprite_groups=[self.all_sprites_group, self.block_sprites_group],
-            image=block_image,
-            rect=block_rect,
-            health=health,
-        )
-        self.blocks.append(block)
 
     def create_player(self):
         """
-        Initialize the player.
+        Initialize the player sprite showing the paddle of the game core.
         """
-        player_image = pygame.Surface(
-            size=(settings.PADDLE_WIDTH // (self.level_difficulty + 1), settings.PADDLE_HEIGHT)
-        )
+        paddle = self.core.paddle
+        player_image = pygame.Surface(size=(paddle.width, paddle.height))
         player_image.fill('white')
-        player_rect = player_image.get_rect(midbottom=(settings.GAME_WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT - 20))
         self.player = Player(
             self,
             sprite_groups=[self.all_sprites_group, self.player_sprites_group],
             image=player_image,
-            rect=player_rect,
-        )
-
-    def create_ball(
-            self,
-            ball_image: [None, pygame.Surface] = None,
-            midbottom: [None, tuple] = None,
-            angle_radians: [None, float, int] = math.pi / 2,
-            speed: int = settings.DEFAULT_BALL_SPEED,
-            **kwargs_to_ball
-    ):
-        """
-        Initialize the ball object. Can be used outside in case powerup multiply-balls is activated.
-
-        Args:
-            ball_image (None, pygame.Surface): image of a ball created.
-                Defaults to None. If None, default image is loaded.
-            midbottom (None, tuple): the midbottom position of the ball. Must be a tuple of (x, y).
-                Defaults to None. If None player.rect.midtop is used.
-            angle_radians (None, float, int): The angle in radians to set the direction.
-                Defaults to math.pi / 2 (90 degrees).
-            speed (int): The speed of the ball. Defaults to default speed provided in settings
-            **kwargs_to_ball: other kwargs passed to the Ball sprite.
-        """
-        if not ball_image:
-            ball_image_path = path_utils.get_asset_path('images/ball/ball.png')
-            ball_image = pygame.image.load(ball_image_path).convert_alpha()
-            ball_image = pygame.transform.scale(
-                ball_image,
-                (settings.WINDOW_WIDTH / 40, settings.WINDOW_WIDTH / 40)
-            )
-        if midbottom is None:
-            midbottom = self.player.rect.midtop
-        new_ball = Ball(
-            sprite_manager=self,
-            sprite_groups=[self.all_sprites_group, self.ball_sprites_group],
-            image=ball_image,
-            rect=ball_image.get_rect(midbottom=midbottom),
-            speed=speed
+            rect=paddle.rect,
+            paddle=paddle
         )
-        new_ball.set_direction_from_angle(angle_radians)
-
-        for kwarg in kwargs_to_ball.items():
-            setattr(new_ball, kwarg[0], kwarg[1])
-
-        self.balls.append(new_ball)
 
     def init_level(self, level_number: int = 0, level_difficulty: int = 0):
         """
         Initialize the level.
 
         Args:
-            level_number (int): Level number to initialize the level. The block sprites and background regarding this
+            level_number (int): Level number to initialize the level. The block map and background regarding this
                 level must be present in assets. Defaults to 0.
             level_difficulty (int): Level difficulty. Defaults to 0.
         """
-        self.level_difficulty = level_difficulty
+        self.core.init_level(level_number, level_difficulty)
+        self.invalidate_static_area()
 
         self.create_scoreboard()
         if self.score is None:
             self.create_score()
-
-        heart_horizontal_gap = settings.SCOREBOARD_WIDTH // (settings.MAX_PLAYER_HEALTH + 1)
-        if len(self.hearts) == 0:
-            for i in range(settings.MAX_PLAYER_HEALTH):
-                heart_midtop = (
-                    settings.GAME_WINDOW_WIDTH + (i + 1) * heart_horizontal_gap,
-                    settings.GAME_WINDOW_HEIGHT // 7
-                )
-                self.create_heart(midtop=heart_midtop)
-
-        for row_index, row in enumerate(settings.BLOCK_MAP):
-            for col_index, health in enumerate(row):
-                if health != ' ':
-                    health = int(health) * level_number + 1
-                    x = settings.GAP_SIZE / 2 + col_index * (settings.BLOCK_WIDTH + settings.GAP_SIZE)
-                    y = settings.GAP_SIZE / 2 + row_index * (settings.BLOCK_HEIGHT + settings.GAP_SIZE)
-                    self.create_block(health, x, y)
-
         if self.player is None:
             self.create_player()
+        self.sync()
 
-        self.create_ball(speed=int(settings.DEFAULT_BALL_SPEED + level_difficulty * settings.DEFAULT_BALL_SPEED / 2))
-
-    def create_powerup(self, center: tuple, power: str):
+    def create_powerup(self, powerup: PowerUpState):
         """
-        Create a powerup object.
+        Create a sprite showing a falling powerup.
 
         Args:
-            center (tuple): The center of the object. Must be a tuple of (x, y).
-            power (str): The name of the powerup.
+            powerup (PowerUpState): The powerup of the game core.
         """
-        power_up_image = pygame.image.load(settings.POWERS[power]['path'])
-        power_up = PowerUp(
+        power_up_image = asset_cache.get_image(
+            settings.POWERS[powerup.power]['path'],
+            size=(powerup.width, powerup.height)
+        )
+        self.power_up_views[powerup] = PowerUp(
             sprite_manager=self,
             sprite_groups=[self.all_sprites_group, self.power_up_sprites_group],
             image=power_up_image,
-            rect=power_up_image.get_rect(center=center),
-            powerup_manager=self.powerup_manager,
-            power=power
+            rect=powerup.rect,
+            powerup=powerup
         )
-        self.power_ups.append(power_up)
 
-    def create_powerup_timer_info(self, power_name: str, powerup_time: (int, float)):
+    def create_powerup_timer_info(self, power_name: str, timer: PowerUpTimer):
         """
         Create powerup timer info object.
 
         Args:
             power_name (str): The name of the powerup.
-            powerup_time (int, float): The lifespan of the powerup.
+            timer (PowerUpTimer): The timer of the powerup in the game core.
         """
         last_y = settings.WINDOW_HEIGHT // 3
-        existing_power_names = []
-        powerup_info_sprites = self.power_up_timer_info_group.sprites()
-        for powerup_info_sprite in powerup_info_sprites:
-            existing_power_names.append(powerup_info_sprite.power_name)
+        for powerup_info_sprite in self.power_up_timer_info_group.sprites():
             last_y = max(last_y, powerup_info_sprite.rect.y)
 
         color = pygame.Color('white')
-        font = pygame.font.Font(settings.GAME_FONT, size=settings.POWERUP_FONT_SIZE)
-        image = font.render(f'Time Left: {powerup_time}', True, color)
+        font = get_font(settings.GAME_FONT, settings.POWERUP_FONT_SIZE)
+        image = font.render(f'Time Left: {timer.duration}', True, color)
         rect = image.get_rect(
             center=(
                 settings.GAME_WINDOW_WIDTH + settings.SCOREBOARD_WIDTH // 2,
                 last_y + settings.GAME_WINDOW_HEIGHT // 20
             )
         )
-        powerup_info = PowerUpTimerInfo(
+        self.power_up_infos[timer] = PowerUpTimerInfo(
             sprite_manager=self,
             sprite_groups=[self.all_sprites_group, self.power_up_timer_info_group],
             image=image,
@@ -313,61 +246,233 @@ class SpriteManager:
             font=font,
             color=color,
             power_name=power_name,
-            powerup_time=powerup_time
+            timer=timer
         )
-        self.power_up_infos.append(powerup_info)
 
-    def drop_powerup(self, block: Block):
+    @staticmethod
+    def _sync_views(views: dict, states: list, create_view):
         """
-        Drop the powerup from the provided block.
+        Create a sprite for every new state and remove the sprites of the states gone.
 
         Args:
-            block (Block): The block to drop powerup from.
-        """
-        random_number = random.random()
-        potential_powers = []
-        for power in settings.POWERS.keys():
-            if random_number <= settings.POWERS[power]['probability']:
-                potential_powers.append(power)
-        if len(potential_powers) > 0:
-            chosen_power = random.choice(potential_powers)
-            self.create_powerup(block.rect.center, chosen_power)
-
-    def update(
-            self,
-            delta_time: float,
-            keys_pressed: pygame.key.ScancodeWrapper,
-            time_in_pause: float = 0
-    ):
+            views (dict): The sprite of each state, updated in place.
+            states (list): The states in the game core.
+            create_view (Callable): Creates the sprite of a state.
+        """
+        if len(views) != len(states) or any(state not in views for state in states):
+            current = set(states)
+            for state in [state for state in views if state not in current]:
+                views.pop(state).kill()
+            for state in states:
+                if state not in views:
+                    create_view(state)
+
+    def _sync_hearts(self):
+        """
+        Show a heart for every health point of the player.
+        """
+        hearts = self.heart_sprites_group.sprites()
+        for heart in hearts[self.core.health:]:
+            heart.kill()
+        heart_horizontal_gap = settings.SCOREBOARD_WIDTH // (settings.MAX_PLAYER_HEALTH + 1)
+        for i in range(len(hearts), self.core.health):
+            self.create_heart(midtop=(settings.GAME_WINDOW_WIDTH + (i + 1) * heart_horizontal_gap,
+                                      settings.GAME_WINDOW_HEIGHT // 7))
+
+    def _sync_timer_infos(self):
+        """
+        Show a timer info for every running powerup timer. A timer started again gets a new info.
+        """
+        for timer, info in list(self.power_up_infos.items()):
+            if info.outdated:
+                info.kill()
+                del self.power_up_infos[timer]
+        powerup_manager = self.core.powerup_manager
+        for timer in (
+                powerup_manager.paddle_size_timer,
+                powerup_manager.ball_size_timer,
+                powerup_manager.ball_speed_timer,
+                powerup_manager.ball_strength_timer
+        ):
+            if timer.active and timer.power is not None and timer not in self.power_up_infos:
+                self.create_powerup_timer_info(timer.power, timer)
+
+    def sync(self):
         """
-        Update all objects during the game.
+        Bring the sprites in line with the game core: play the sounds of the last step, render the blocks
+        changed again and create, update or remove the sprites of the objects of the game.
+        """
+        for sound in self.core.sounds:
+            sound_bank.play(sound)
+        self.core.sounds.clear()
+        self.static_layer.invalidate_blocks(self.core.block_field)
+        self.core.block_field.changes.clear()
+
+        self._sync_views(self.ball_views, self.core.balls, self.create_ball)
+        self._sync_views(self.power_up_views, self.core.powerups, self.create_powerup)
+        self._sync_hearts()
+        self._sync_timer_infos()
+
+        self.player.update()
+        self.ball_sprites_group.update()
+        self.power_up_sprites_group.update()
+        self.score_sprites_group.update()
+        self.power_up_timer_info_group.update()
+
+    def get_snapshot(self) -> dict:
+        """
+        Get the state of the game as plain data. The sprites are not included, they are rebuilt from the
+        state on restore.
+
+        Returns:
+            dict: The state of the game core. See GameCore.get_snapshot.
+        """
+        return self.core.get_snapshot()
+
+    def restore_snapshot(self, snapshot: dict):
+        """
+        Restore the state of the game and rebuild the sprites showing it. The sprites are not interpolated
+        across the restore.
+
+        Args:
+            snapshot (dict): The state of the game core from get_snapshot.
+        """
+        self.core.restore_snapshot(snapshot)
+        self.sync()
+        self.save_positions()
+
+    def create_ball(self, ball: BallState):
+        """
+        Create a sprite showing a ball.
+
+        Args:
+            ball (BallState): The ball of the game core.
+        """
+        self.ball_views[ball] = Ball(
+            sprite_manager=self,
+            sprite_groups=[self.all_sprites_group, self.ball_sprites_group],
+            ball=ball
+        )
+
+    def step(self, delta_time: float, inputs: int):
+        """
+        Step the game core by the inputs and update all sprites.
+
+        Args:
+            delta_time (float): Time passed since the last frame.
+            inputs (int): The inputs combined from INPUT_LEFT, INPUT_RIGHT and INPUT_LAUNCH.
+        """
+        self.core.step(delta_time, inputs)
+        self.sync()
+
+    def update(self, delta_time: float, keys_pressed: pygame.key.ScancodeWrapper):
+        """
+        Step the game core by the keys pressed and update all sprites.
 
         Args:
             delta_time (float): Time passed since the last frame.
             keys_pressed (pygame.key.ScancodeWrapper): Keys pressed.
-            time_in_pause (float): Time passed in pause mode.
-        """
-        self.powerup_manager.update(time_in_pause)
-        self.player.update(delta_time, keys_pressed)
-        self.block_sprites_group.update()
-        self.ball_sprites_group.update(delta_time, keys_pressed)
-        self.heart_sprites_group.update()
-        self.power_up_sprites_group.update(delta_time)
-        self.score_sprites_group.update()
-        self.power_up_timer_info_group.update(time_in_pause)
+        """
+        self.step(delta_time, get_inputs(keys_pressed))
 
-    def draw_all(self, display_surface: pygame.Surface):
+    def set_background(self, background: pygame.Surface):
         """
-        Draw all objects on the display
+        Set the background the static layer is composited on.
+
+        Args:
+            background (pygame.Surface): The background of the level.
+        """
+        self.static_layer.set_background(background)
+
+    def invalidate_static_area(self, rect: (None, pygame.Rect) = None):
+        """
+        Mark the area of the static layer to be rendered again before the next draw.
+        Must be called whenever a block or the scoreboard changes its look or disappears.
+
+        Args:
+            rect (None, pygame.Rect): The area to render again. Defaults to None. If None, the whole layer.
+        """
+        self.static_layer.invalidate(rect)
+
+    def get_dynamic_groups(self) -> list[pygame.sprite.RenderUpdates]:
+        """
+        Get the sprite groups drawn over the static layer every frame in the order of drawing.
+
+        Returns:
+            list[pygame.sprite.RenderUpdates]: The groups.
+        """
+        return [
+            self.player_sprites_group,
+            self.ball_sprites_group,
+            self.heart_sprites_group,
+            self.power_up_sprites_group,
+            self.score_sprites_group,
+            self.power_up_timer_info_group
+        ]
+
+    def get_moving_sprites(self) -> list[pygame.sprite.Sprite]:
+        """
+        Get the sprites moved by physics steps.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The player, balls and powerups.
+        """
+        return (
+            self.player_sprites_group.sprites()
+            + self.ball_sprites_group.sprites()
+            + self.power_up_sprites_group.sprites()
+        )
+
+    def save_positions(self):
+        """
+        Remember the positions of the moving sprites before a physics step.
+        """
+        for sprite in self.get_moving_sprites():
+            sprite.previous_position.update(sprite.position)
+        self.core.ball_swarm.save_positions()
+
+    def draw_all(
+            self,
+            display_surface: pygame.Surface,
+            redraw_all: bool = True,
+            alpha: float = 1.0
+    ) -> list[pygame.Rect]:
+        """
+        Draw all objects on the display.
+
+        The background, blocks and the scoreboard are drawn with one blit of the static layer.
+        The rest of the objects are drawn over it. Moving sprites are drawn between their positions before and
+        after the last physics step. Their rectangles are restored after drawing.
 
         Args:
             display_surface (pygame.Surface): The surface to draw objects.
+            redraw_all (bool): If true, the whole static layer is drawn. If false, only the areas changed since
+                the last frame are drawn. Defaults to True.
+            alpha (float): The progress from the previous physics step (0) to the last one (1) to draw the moving
+                sprites at. Defaults to 1.
+
+        Returns:
+            list[pygame.Rect]: The areas changed since the last frame. Includes the areas of removed objects.
         """
-        self.player_sprites_group.draw(surface=display_surface)
-        self.ball_sprites_group.draw(surface=display_surface)
-        self.block_sprites_group.draw(surface=display_surface)
-        self.scoreboard_sprites_group.draw(surface=display_surface)
-        self.heart_sprites_group.draw(surface=display_surface)
-        self.power_up_sprites_group.draw(surface=display_surface)
-        self.score_sprites_group.draw(surface=display_surface)
-        self.power_up_timer_info_group.draw(surface=display_surface)
+        moving_sprites = self.get_moving_sprites() if alpha < 1 else []
+        rect_topleft_list = [sprite.rect.topleft for sprite in moving_sprites]
+        for sprite in moving_sprites:
+            sprite.rect.topleft = sprite.get_interpolated_topleft(alpha)
+
+        dirty_rects = self.static_layer.refresh(self.scoreboard_sprites_group.sprites(), self.core.block_field)
+        if redraw_all:
+            display_surface.blit(self.static_layer.surface, (0, 0))
+        else:
+            for group in self.get_dynamic_groups():
+                group.clear(display_surface, self.static_layer.surface)
+            self.ball_swarm_view.clear_drawn(display_surface, self.static_layer.surface)
+            for rect in dirty_rects:
+                display_surface.blit(self.static_layer.surface, rect, rect)
+
+        for group in self.get_dynamic_groups():
+            dirty_rects.extend(group.draw(surface=display_surface))
+        dirty_rects.extend(self.ball_swarm_view.draw(display_surface, alpha))
+
+        for sprite, rect_topleft in zip(moving_sprites, rect_topleft_list):
+            sprite.rect.topleft = rect_topleft
+        return dirty_rects
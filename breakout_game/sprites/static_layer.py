@@ -0,0 +1,135 @@
+"""
+Module describing the static layer: the background with sprites which rarely change composited on it.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.utils.asset_cache import asset_cache
+
+if TYPE_CHECKING:
+    from breakout_game.core.block_field import BlockField
+
+
+class StaticLayer:
+    """
+    Cached surface holding the background with the blocks and the scoreboard composited on it.
+
+    Only the invalidated areas are rendered again, so drawing the layer costs one blit no matter how many
+    sprites it holds.
+
+    Attributes:
+        background (None, pygame.Surface): The background of the level. Defaults to None.
+            If None, the layer is rendered on black.
+        surface (None, pygame.Surface): The composited layer. Defaults to None. Created on the first refresh.
+        dirty_rects (list[pygame.Rect]): The areas to render again on the next refresh.
+            Defaults to an empty list.
+
+    version: 1
+    """
+    def __init__(self):
+        self.background: (None, pygame.Surface) = None
+        self.surface: (None, pygame.Surface) = None
+        self.dirty_rects: list[pygame.Rect] = []
+
+    def set_background(self, background: pygame.Surface):
+        """
+        Set the background the sprites are composited on.
+
+        Args:
+            background (pygame.Surface): The background of the level.
+        """
+        self.background = background
+        self.invalidate()
+
+    def invalidate(self, rect: (None, pygame.Rect) = None):
+        """
+        Mark the area to be rendered again on the next refresh.
+
+        Args:
+            rect (None, pygame.Rect): The area to render again. Defaults to None. If None, the whole layer.
+        """
+        if rect is None:
+            rect = pygame.Rect(0, 0, settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT)
+        self.dirty_rects.append(rect.copy())
+
+    @staticmethod
+    def get_block_image(health: int, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Get the image shared by the blocks with the health. Health above the color legend uses the last color.
+
+        Args:
+            health (int): The health of the block.
+            size (tuple[int, int]): The size of the block.
+
+        Returns:
+            pygame.Surface: The image.
+        """
+        return asset_cache.get_image(settings.COLOR_LEGEND[min(health, max(settings.COLOR_LEGEND))], size=size)
+
+    def draw_blocks(self, block_field: BlockField, rect: pygame.Rect):
+        """
+        Draw the blocks in the area with one Surface.blits call.
+
+        Args:
+            block_field (BlockField): The blocks of the level.
+            rect (pygame.Rect): The area to draw.
+        """
+        size = (block_field.block_width, block_field.block_height)
+        images = {}
+        blits = []
+        for row, column in block_field.query(rect):
+            health = block_field.health_rows[row][column]
+            if health not in images:
+                images[health] = self.get_block_image(health, size)
+            blits.append((images[health], block_field.get_rect(row, column)))
+        self.surface.blits(blits, doreturn=False)
+
+    def invalidate_blocks(self, block_field: BlockField):
+        """
+        Mark the blocks changed in the last step of the game to be rendered again.
+
+        Args:
+            block_field (BlockField): The blocks of the level.
+        """
+        for cell in block_field.changes:
+            self.invalidate(None if cell is None else block_field.get_rect(*cell))
+
+    def refresh(
+            self,
+            sprites: list[pygame.sprite.Sprite],
+            block_field: (None, BlockField) = None
+    ) -> list[pygame.Rect]:
+        """
+        Render the invalidated areas again from the background, the blocks and the sprites provided.
+
+        Args:
+            sprites (list[pygame.sprite.Sprite]): The sprites held by the layer in the order of drawing.
+            block_field (None, BlockField): The blocks drawn under the sprites. Defaults to None.
+
+        Returns:
+            list[pygame.Rect]: The areas rendered again.
+        """
+        if self.surface is None:
+            self.surface = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert()
+            self.invalidate()
+
+        dirty_rects, self.dirty_rects = self.dirty_rects, []
+        for rect in dirty_rects:
+            self.surface.set_clip(rect)
+            if self.background is None:
+                self.surface.fill('black', rect)
+            else:
+                self.surface.blit(self.background, rect, rect)
+            if block_field is not None:
+                self.draw_blocks(block_field, rect)
+            for sprite in sprites:
+                if sprite.rect.colliderect(rect):
+                    self.surface.blit(sprite.image, sprite.rect)
+        self.surface.set_clip(None)
+        return dirty_rects
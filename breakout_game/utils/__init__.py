@@ -1,4 +1,5 @@
 """
 Utils package.
 """
-from breakout_game.utils import path_utils, mixer_wrapper
+from breakout_game.utils import path_utils, mixer_wrapper, atlas, asset_cache, backgrounds, text_renderer, \
+    collision, run_ahead
@@ -0,0 +1,147 @@
+"""
+Process-wide cache of image surfaces loaded from the assets folder.
+"""
+from pathlib import Path
+
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.utils.atlas import TextureAtlas
+
+
+class AssetCache:
+    """
+    Caches loaded images. Each image is decoded from disk once, converted to the display format and scaled
+    to the requested size once. Every following request with the same parameters returns the same surface.
+
+    Tinted variants of an image are cached the same way, so sprites sharing a look share one surface.
+
+    Images present in the texture atlas of the selected resolution are served as subsurfaces of the atlas
+    instead of being loaded one by one.
+
+    Note:
+        Surfaces returned by the cache are shared between all callers and must not be modified in place.
+        Copy the surface before drawing on it or filling it.
+
+    Attributes:
+        surfaces (dict): Cached surfaces. Keyed by (path, size, alpha, tint).
+        atlas (None, TextureAtlas): The texture atlas of the selected resolution.
+            Defaults to None. Loaded on the first miss. None if the atlas is not built.
+        hits (int): The number of requests served from the cache. Defaults to 0.
+        misses (int): The number of requests which required loading from disk. Defaults to 0.
+
+    version: 1
+    """
+    def __init__(self):
+        self.surfaces: dict[tuple, pygame.Surface] = {}
+        self.atlas: [None, TextureAtlas] = None
+        self._atlas_loaded: bool = False
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_image(
+            self,
+            path: (str, Path),
+            size: [None, tuple] = None,
+            alpha: bool = True,
+            tint: [None, tuple] = None
+    ) -> pygame.Surface:
+        """
+        Get the image from the cache. Loads, converts, scales and tints the image if it is not cached yet.
+
+        Args:
+            path (str, Path): The absolute path of the image.
+            size (None, tuple): The size of the image. Must be a tuple of (width, height).
+                Defaults to None. If None, the original size of the image is kept.
+            alpha (bool): If true, the image is converted with per-pixel alpha. Defaults to True.
+            tint (None, tuple): The color added to the image. Must be a tuple of (r, g, b).
+                Defaults to None. If None, the image is not tinted.
+
+        Returns:
+            pygame.Surface: The cached image.
+        """
+        if size is not None:
+            size = (round(size[0]), round(size[1]))
+        key = (str(path), size, alpha, tint)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if tint is not None:
+            surface = self.get_image(path, size, alpha).copy()
+            surface.fill(tint, special_flags=pygame.BLEND_RGB_ADD)  # pylint: disable=E1101
+        else:
+            surface = self._get_atlas_image(path, size) if alpha else None
+            if surface is None:
+                surface = self._load(path, alpha)
+                if size is not None and surface.get_size() != size:
+                    surface = pygame.transform.scale(surface, size)
+        self.surfaces[key] = surface
+        return surface
+
+    def _get_atlas_image(self, path: (str, Path), size: [None, tuple]) -> [None, pygame.Surface]:
+        """
+        Get the image from the texture atlas of the selected resolution. Loads the atlas on the first call.
+
+        Args:
+            path (str, Path): The absolute path of the image.
+            size (None, tuple): The size of the image. Must be a tuple of (width, height).
+
+        Returns:
+            None, pygame.Surface: The subsurface of the atlas. None if the image is not in the atlas.
+        """
+        if not self._atlas_loaded:
+            self.atlas = TextureAtlas.load(settings.SELECTED_RESOLUTION_NAME)
+            self._atlas_loaded = True
+        if self.atlas is None:
+            return None
+        return self.atlas.get_image(path, size)
+
+    @staticmethod
+    def _load(path: (str, Path), alpha: bool) -> pygame.Surface:
+        """
+        Load the image from disk and convert it to the display format if the display is set.
+
+        Args:
+            path (str, Path): The absolute path of the image.
+            alpha (bool): If true, the image is converted with per-pixel alpha.
+
+        Returns:
+            pygame.Surface: The loaded image.
+        """
+        surface = pygame.image.load(path)
+        if pygame.display.get_surface() is None:
+            return surface
+        if alpha:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def get_statistics(self) -> dict:
+        """
+        Get the statistics of the cache usage.
+
+        Returns:
+            dict: The number of hits, misses, cached surfaces and the hit ratio.
+        """
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'surfaces': len(self.surfaces),
+            'hit-ratio': self.hits / requests if requests > 0 else 0.0
+        }
+
+    def clear(self):
+        """
+        Remove all surfaces from the cache and reset the statistics.
+        """
+        self.surfaces.clear()
+        self.atlas = None
+        self._atlas_loaded = False
+        self.hits = 0
+        self.misses = 0
+
+
+asset_cache = AssetCache()
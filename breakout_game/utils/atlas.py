@@ -0,0 +1,193 @@
+"""
+Texture atlas of block and powerup images.
+
+The atlas is built once per resolution listed in settings.RESOLUTIONS with:
+
+    python -m breakout_game.utils.atlas
+
+Every atlas consists of one image and an index of sub-rectangles stored next to each other in assets/atlas.
+Images found in the atlas of the selected resolution are served by the asset cache as subsurfaces of one atlas
+surface. Without a built atlas, images are loaded one by one.
+"""
+import argparse
+import json
+import logging
+
+from pathlib import Path
+
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.utils.path_utils import base_path
+
+game_logger = logging.getLogger('')
+
+ASSETS_PATH = base_path.joinpath('assets')
+ATLAS_PATH = ASSETS_PATH.joinpath('atlas')
+ATLAS_IMAGE_DIRECTORIES = ['images/blocks', 'images/powerups']
+ATLAS_MAX_WIDTH = 1024
+ATLAS_PADDING = 1
+
+
+def get_relative_asset_path(path: (str, Path)) -> str:
+    """
+    Get the path of an asset relative to the assets folder.
+
+    Args:
+        path (str, Path): The absolute path of an asset.
+
+    Returns:
+        str: The path relative to the assets folder, for example "images/blocks/1.png".
+    """
+    return Path(path).resolve().relative_to(ASSETS_PATH).as_posix()
+
+
+def pack_rects(sizes: dict[str, tuple[int, int]], max_width: int = ATLAS_MAX_WIDTH) -> tuple[dict, tuple[int, int]]:
+    """
+    Pack rectangles into shelves. Rectangles are sorted by height and placed left to right,
+    a new shelf is started when the current one is full.
+
+    Args:
+        sizes (dict[str, tuple[int, int]]): The sizes of the rectangles. Keyed by name.
+        max_width (int): The maximum width of the atlas. Defaults to ATLAS_MAX_WIDTH.
+
+    Returns:
+        tuple[dict, tuple[int, int]]: The rectangles as (x, y, width, height) keyed by name and the size of the atlas.
+    """
+    rects = {}
+    shelf_x, shelf_y, shelf_height, atlas_width = 0, 0, 0, 0
+    for name, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if shelf_x > 0 and shelf_x + width > max_width:
+            shelf_y += shelf_height + ATLAS_PADDING
+            shelf_x, shelf_height = 0, 0
+        rects[name] = (shelf_x, shelf_y, width, height)
+        shelf_x += width + ATLAS_PADDING
+        shelf_height = max(shelf_height, height)
+        atlas_width = max(atlas_width, shelf_x - ATLAS_PADDING)
+    return rects, (atlas_width, shelf_y + shelf_height)
+
+
+def build_atlas(resolution_name: str, output_path: Path = ATLAS_PATH) -> Path:
+    """
+    Build the atlas of the resolution provided and save the image and the index.
+
+    Note:
+        Blocks are scaled to the block size of the resolution. Powerups keep their original size.
+
+    Args:
+        resolution_name (str): The key of the resolution in settings.RESOLUTIONS.
+        output_path (Path): The folder to save the atlas in. Defaults to ATLAS_PATH.
+
+    Returns:
+        Path: The path of the atlas image.
+    """
+    block_size = settings.get_block_size(settings.RESOLUTIONS[resolution_name])
+    images = {}
+    for directory in ATLAS_IMAGE_DIRECTORIES:
+        for image_path in sorted(ASSETS_PATH.joinpath(directory).glob('*.png')):
+            image = pygame.image.load(image_path)
+            if directory == 'images/blocks':
+                image = pygame.transform.scale(image, block_size)
+            images[get_relative_asset_path(image_path)] = image
+
+    rects, atlas_size = pack_rects({name: image.get_size() for name, image in images.items()})
+    atlas = pygame.Surface(atlas_size, pygame.SRCALPHA)  # pylint: disable=E1101
+    atlas.fill((0, 0, 0, 0))
+    for name, image in images.items():
+        # The atlas is fully transparent, taking the maximum copies the pixels without blending.
+        atlas.blit(
+            image.convert(atlas),
+            rects[name][:2],
+            special_flags=pygame.BLEND_RGBA_MAX  # pylint: disable=E1101
+        )
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    atlas_image_path = output_path.joinpath(f'{resolution_name}.png')
+    pygame.image.save(atlas, atlas_image_path)
+    with open(output_path.joinpath(f'{resolution_name}.json'), 'w', encoding='utf-8') as file:
+        json.dump({'image': atlas_image_path.name, 'rects': rects}, file, indent=4)
+    game_logger.info('Atlas %s with %s images built', atlas_image_path, len(rects))
+    return atlas_image_path
+
+
+class TextureAtlas:
+    """
+    Loaded texture atlas. Provides subsurfaces of the atlas image.
+
+    Attributes:
+        surface (pygame.Surface): The atlas image.
+        rects (dict[str, pygame.Rect]): Sub-rectangles of the images. Keyed by the path relative to assets folder.
+
+    Args:
+        surface (pygame.Surface): The atlas image.
+        rects (dict[str, pygame.Rect]): Sub-rectangles of the images. Keyed by the path relative to assets folder.
+
+    version: 1
+    """
+    def __init__(self, surface: pygame.Surface, rects: dict[str, pygame.Rect]):
+        self.surface: pygame.Surface = surface
+        self.rects: dict[str, pygame.Rect] = rects
+
+    @classmethod
+    def load(cls, resolution_name: str, atlas_path: Path = ATLAS_PATH) -> ['TextureAtlas', None]:
+        """
+        Load the atlas of the resolution provided.
+
+        Args:
+            resolution_name (str): The key of the resolution in settings.RESOLUTIONS.
+            atlas_path (Path): The folder the atlas is saved in. Defaults to ATLAS_PATH.
+
+        Returns:
+            TextureAtlas, None: The loaded atlas. None if the atlas is not built.
+        """
+        index_path = atlas_path.joinpath(f'{resolution_name}.json')
+        if not index_path.is_file():
+            return None
+        with open(index_path, 'r', encoding='utf-8') as file:
+            index = json.load(file)
+        surface = pygame.image.load(atlas_path.joinpath(index['image']))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        rects = {name: pygame.Rect(rect) for name, rect in index['rects'].items()}
+        game_logger.debug('Atlas %s loaded', index_path)
+        return cls(surface, rects)
+
+    def get_image(self, path: (str, Path), size: [None, tuple] = None) -> [None, pygame.Surface]:
+        """
+        Get the image from the atlas.
+
+        Args:
+            path (str, Path): The absolute path of the original image.
+            size (None, tuple): The size of the image. Must be a tuple of (width, height). Defaults to None.
+                If None, any size stored in the atlas is accepted.
+
+        Returns:
+            None, pygame.Surface: The subsurface of the atlas.
+                None if the image is not in the atlas or is stored with another size.
+        """
+        try:
+            rect = self.rects.get(get_relative_asset_path(path))
+        except ValueError:
+            return None
+        if rect is None or (size is not None and rect.size != tuple(size)):
+            return None
+        return self.surface.subsurface(rect)
+
+
+def main():
+    """
+    Build the atlases of all resolutions listed in settings.
+    """
+    parser = argparse.ArgumentParser(description='Build texture atlases of blocks and powerups.')
+    parser.add_argument('--output', type=Path, default=ATLAS_PATH, help='Folder to save the atlases in.')
+    parser.add_argument('--resolution', choices=list(settings.RESOLUTIONS.keys()), action='append',
+                        help='Resolution to build. Defaults to all resolutions.')
+    arguments = parser.parse_args()
+
+    pygame.init()  # pylint: disable=E1101
+    for resolution_name in arguments.resolution or settings.RESOLUTIONS.keys():
+        build_atlas(resolution_name, arguments.output)
+
+
+if __name__ == '__main__':
+    main()
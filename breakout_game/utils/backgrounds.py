@@ -0,0 +1,529 @@
+"""
+Preparation, caching and prefetching of backgrounds and level music.
+
+Backgrounds are darkened and scaled once per resolution and stored on disk. The store is filled on the first
+use of a background or ahead of time, in parallel, with:
+
+    python -m breakout_game.utils.backgrounds
+"""
+import argparse
+import hashlib
+import io
+import json
+import logging
+import threading
+import zlib
+
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.utils import path_utils
+
+game_logger = logging.getLogger('')
+
+BAKED_BACKGROUNDS_PATH = path_utils.base_path.joinpath('assets', 'baked')
+
+
+def get_level_music_path(level: int) -> Path:
+    """
+    Get the path of the music of the level.
+
+    Args:
+        level (int): The level number.
+
+    Returns:
+        Path: The absolute path of the music file.
+    """
+    return path_utils.get_asset_path(f'sounds/level-{level}.mp3')
+
+
+def get_background_sources() -> dict[str, dict]:
+    """
+    Get the source images of all backgrounds and the way they are prepared.
+
+    Note:
+        Level backgrounds are darkened and scaled to cover the window keeping the aspect ratio.
+        The menu background is stretched to the window.
+
+    Returns:
+        dict[str, dict]: The path, darken and cover flags of each background. Keyed by the name of the background.
+    """
+    sources = {}
+    level_background_paths = path_utils.base_path.joinpath('assets', 'images', 'background').glob('level-*.jpg')
+    for background_path in sorted(level_background_paths):
+        sources[background_path.stem] = {'path': background_path, 'darken': True, 'cover': True}
+    sources['menu'] = {
+        'path': path_utils.get_asset_path('images/background/menu.png'),
+        'darken': False,
+        'cover': False
+    }
+    return sources
+
+
+def get_file_hash(path: (str, Path)) -> str:
+    """
+    Get the hash of the file contents.
+
+    Args:
+        path (str, Path): The path of the file.
+
+    Returns:
+        str: The SHA-1 hex digest of the file.
+    """
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+def transform_background(
+        background: pygame.Surface,
+        window_size: tuple,
+        darken: bool = True,
+        cover: bool = True
+) -> pygame.Surface:
+    """
+    Make the background darker and scale it to the window.
+
+    Note:
+        RGB(125, 125, 125) color is subtracted from the image to make it darker for a better gaming experience.
+
+    Args:
+        background (pygame.Surface): The loaded background image. Modified in place if darken is true.
+        window_size (tuple): The size of the window. Must be a tuple of (width, height).
+        darken (bool): If true, the background is made darker. Defaults to True.
+        cover (bool): If true, the background is scaled to cover the window keeping the aspect ratio.
+            If false, the background is stretched to the window. Defaults to True.
+
+    Returns:
+        pygame.Surface: The transformed background.
+    """
+    if darken:
+        background.fill((125, 125, 125), special_flags=pygame.BLEND_RGB_SUB)  # pylint: disable=E1101
+    if not cover:
+        return pygame.transform.scale(background, window_size)
+    scale_factor = max([
+        window_size[1] / background.get_height(),
+        window_size[0] / background.get_width()
+    ])
+    scaled_width = background.get_width() * scale_factor
+    scaled_height = background.get_height() * scale_factor
+    return pygame.transform.scale(background, (scaled_width, scaled_height))
+
+
+def bake_background(
+        name: str,
+        source: dict,
+        resolution_name: str,
+        output_path: Path = BAKED_BACKGROUNDS_PATH
+) -> tuple[str, str, dict]:
+    """
+    Prepare the background for the resolution and save the pixels compressed on disk.
+    Runs in the worker processes of the build, so it must not rely on the display.
+
+    Args:
+        name (str): The name of the background.
+        source (dict): The path, darken and cover flags of the background. See get_background_sources.
+        resolution_name (str): The key of the resolution in settings.RESOLUTIONS.
+        output_path (Path): The folder of the store. Defaults to BAKED_BACKGROUNDS_PATH.
+
+    Returns:
+        tuple[str, str, dict]: The resolution name, the background name and the index entry of the baked file.
+    """
+    resolution = settings.RESOLUTIONS[resolution_name]
+    window_size = (resolution['window-width'], resolution['window-height'])
+    background = transform_background(
+        pygame.image.load(source['path']),
+        window_size,
+        darken=source['darken'],
+        cover=source['cover']
+    )
+    baked_path = output_path.joinpath(resolution_name, f'{name}.rgb.z')
+    baked_path.parent.mkdir(parents=True, exist_ok=True)
+    baked_path.write_bytes(zlib.compress(pygame.image.tobytes(background, 'RGB'), 1))
+    entry = {
+        'file': baked_path.name,
+        'size': list(background.get_size()),
+        'source-mtime': Path(source['path']).stat().st_mtime,
+        'source-hash': get_file_hash(source['path'])
+    }
+    return resolution_name, name, entry
+
+
+class BakedBackgroundStore:
+    """
+    On-disk store of backgrounds already darkened and scaled for each resolution.
+
+    Each resolution has its own folder with compressed RGB pixels of every background and an index.
+    A baked background is valid while the modification time or the hash of its source image matches the index.
+    If only the modification time changed, the index takes the new time, so the source is not hashed again.
+
+    Attributes:
+        path (Path): The folder of the store.
+
+    Args:
+        path (Path): The folder of the store. Defaults to BAKED_BACKGROUNDS_PATH.
+
+    version: 1
+    """
+    def __init__(self, path: Path = BAKED_BACKGROUNDS_PATH):
+        self.path: Path = path
+        self._lock = threading.Lock()
+
+    def load_index(self, resolution_name: str) -> dict:
+        """
+        Load the index of the resolution.
+
+        Args:
+            resolution_name (str): The key of the resolution in settings.RESOLUTIONS.
+
+        Returns:
+            dict: Index entries keyed by background name. Empty if there is no index.
+        """
+        index_path = self.path.joinpath(resolution_name, 'index.json')
+        if not index_path.is_file():
+            return {}
+        with open(index_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def update_index(self, resolution_name: str, entries: dict):
+        """
+        Add entries to the index of the resolution.
+
+        Args:
+            resolution_name (str): The key of the resolution in settings.RESOLUTIONS.
+            entries (dict): Index entries keyed by background name.
+        """
+        with self._lock:
+            index = self.load_index(resolution_name)
+            index.update(entries)
+            index_path = self.path.joinpath(resolution_name, 'index.json')
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(index_path, 'w', encoding='utf-8') as file:
+                json.dump(index, file, indent=4)
+
+    def is_valid(self, resolution_name: str, name: str, entry: [None, dict], source_path: (str, Path)) -> bool:
+        """
+        Check if the baked background was made from the current source image. A source touched without a change
+        of its content gets its new modification time written to the index.
+
+        Args:
+            resolution_name (str): The key of the resolution in settings.RESOLUTIONS.
+            name (str): The name of the background.
+            entry (None, dict): The index entry of the baked background.
+            source_path (str, Path): The path of the source image.
+
+        Returns:
+            bool: True if the modification time or, failing that, the hash of the source matches.
+        """
+        if entry is None:
+            return False
+        source_mtime = Path(source_path).stat().st_mtime
+        if entry['source-mtime'] == source_mtime:
+            return True
+        if entry['source-hash'] != get_file_hash(source_path):
+            return False
+        self.update_index(resolution_name, {name: {**entry, 'source-mtime': source_mtime}})
+        return True
+
+    def load(self, name: str, source_path: (str, Path), resolution_name: str) -> [None, pygame.Surface]:
+        """
+        Load the baked background.
+
+        Args:
+            name (str): The name of the background.
+            source_path (str, Path): The path of the source image.
+            resolution_name (str): The key of the resolution in settings.RESOLUTIONS.
+
+        Returns:
+            None, pygame.Surface: The baked background. None if it is missing or stale.
+        """
+        entry = self.load_index(resolution_name).get(name)
+        if not self.is_valid(resolution_name, name, entry, source_path):
+            return None
+        baked_path = self.path.joinpath(resolution_name, entry['file'])
+        try:
+            pixels = zlib.decompress(baked_path.read_bytes())
+        except (OSError, zlib.error):
+            return None
+        return pygame.image.frombytes(pixels, tuple(entry['size']), 'RGB')
+
+    def get_jobs(self, resolution_names: list[str], force: bool = False) -> list[tuple]:
+        """
+        Get the arguments of bake_background for every background which needs to be baked.
+
+        Args:
+            resolution_names (list[str]): The keys of the resolutions in settings.RESOLUTIONS.
+            force (bool): If true, valid baked backgrounds are included. Defaults to False.
+
+        Returns:
+            list[tuple]: Arguments of bake_background.
+        """
+        sources = get_background_sources()
+        jobs = []
+        for resolution_name in resolution_names:
+            index = self.load_index(resolution_name)
+            for name, source in sources.items():
+                if force or not self.is_valid(resolution_name, name, index.get(name), source['path']):
+                    jobs.append((name, source, resolution_name, self.path))
+        return jobs
+
+    def build(
+            self,
+            resolution_names: [None, list[str]] = None,
+            max_workers: [None, int] = None,
+            force: bool = False
+    ) -> int:
+        """
+        Bake all backgrounds for the resolutions provided in a process pool. Valid baked backgrounds are skipped.
+
+        Args:
+            resolution_names (None, list[str]): The keys of the resolutions in settings.RESOLUTIONS.
+                Defaults to None. If None, all resolutions are built.
+            max_workers (None, int): The number of worker processes. Defaults to None.
+                If None, the number of processors is used.
+            force (bool): If true, valid baked backgrounds are baked again. Defaults to False.
+
+        Returns:
+            int: The number of backgrounds baked.
+        """
+        if resolution_names is None:
+            resolution_names = list(settings.RESOLUTIONS.keys())
+        jobs = self.get_jobs(resolution_names, force)
+
+        entries = {resolution_name: {} for resolution_name in resolution_names}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(bake_background, *job) for job in jobs]
+            for future in futures:
+                resolution_name, name, entry = future.result()
+                entries[resolution_name][name] = entry
+
+        for resolution_name, resolution_entries in entries.items():
+            if resolution_entries:
+                self.update_index(resolution_name, resolution_entries)
+        game_logger.info('%s backgrounds baked', len(jobs))
+        return len(jobs)
+
+
+baked_backgrounds = BakedBackgroundStore()
+
+
+def load_background(name: str, resolution_name: [None, str] = None) -> pygame.Surface:
+    """
+    Get the background prepared for the resolution. The background is baked and stored on disk on the first use.
+
+    Args:
+        name (str): The name of the background, for example "level-0" or "menu".
+        resolution_name (None, str): The key of the resolution in settings.RESOLUTIONS.
+            Defaults to None. If None, the selected resolution is used.
+
+    Returns:
+        pygame.Surface: The prepared background.
+    """
+    if resolution_name is None:
+        resolution_name = settings.SELECTED_RESOLUTION_NAME
+    source = get_background_sources()[name]
+    background = baked_backgrounds.load(name, source['path'], resolution_name)
+    if background is None:
+        try:
+            _, _, entry = bake_background(name, source, resolution_name, baked_backgrounds.path)
+            baked_backgrounds.update_index(resolution_name, {name: entry})
+            background = baked_backgrounds.load(name, source['path'], resolution_name)
+        except OSError as e:
+            game_logger.warning('Background %s could not be baked: %s', name, e)
+    if background is None:
+        resolution = settings.RESOLUTIONS[resolution_name]
+        background = transform_background(
+            pygame.image.load(source['path']),
+            (resolution['window-width'], resolution['window-height']),
+            darken=source['darken'],
+            cover=source['cover']
+        )
+    if pygame.display.get_surface() is not None:
+        background = background.convert()
+    return background
+
+
+class BackgroundCache:
+    """
+    Least recently used cache of prepared backgrounds limited by the memory the surfaces take.
+
+    Attributes:
+        memory_budget (int): The maximum number of bytes the cached surfaces may take.
+        surfaces (OrderedDict): Cached surfaces ordered from the least to the most recently used.
+        memory_used (int): The number of bytes the cached surfaces take. Defaults to 0.
+
+    Args:
+        memory_budget (None, int): The maximum number of bytes the cached surfaces may take.
+            Defaults to None. If None, settings.BACKGROUND_CACHE_BUDGET is used.
+
+    version: 1
+    """
+    def __init__(self, memory_budget: [None, int] = None):
+        if memory_budget is None:
+            memory_budget = settings.BACKGROUND_CACHE_BUDGET
+        self.memory_budget: int = memory_budget
+        self.surfaces: OrderedDict = OrderedDict()
+        self.memory_used: int = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_surface_size(surface: pygame.Surface) -> int:
+        """
+        Get the number of bytes the pixels of the surface take.
+
+        Args:
+            surface (pygame.Surface): The surface.
+
+        Returns:
+            int: The number of bytes.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def get(self, key) -> [None, pygame.Surface]:
+        """
+        Get the surface from the cache and mark it as the most recently used.
+
+        Args:
+            key: The key of the surface.
+
+        Returns:
+            None, pygame.Surface: The cached surface. None if the surface is not cached.
+        """
+        with self._lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key)
+            return surface
+
+    def put(self, key, surface: pygame.Surface):
+        """
+        Put the surface in the cache. Least recently used surfaces are evicted to stay within the memory budget.
+
+        Args:
+            key: The key of the surface.
+            surface (pygame.Surface): The surface to cache.
+        """
+        surface_size = self.get_surface_size(surface)
+        with self._lock:
+            if key in self.surfaces:
+                self.memory_used -= self.get_surface_size(self.surfaces.pop(key))
+            self.surfaces[key] = surface
+            self.memory_used += surface_size
+            while self.memory_used > self.memory_budget and len(self.surfaces) > 1:
+                evicted_key, evicted_surface = self.surfaces.popitem(last=False)
+                self.memory_used -= self.get_surface_size(evicted_surface)
+                game_logger.debug('Background %s evicted from the cache', evicted_key)
+
+
+class LevelAssetPrefetcher:
+    """
+    Prepares the background and stages the music of a level in a worker thread.
+
+    The background is loaded from the baked background store in the worker and put in the background cache.
+    The music file is read into memory so that pygame.mixer.music can load it without touching the disk.
+    If the assets of a level are requested before the worker has finished, the request waits for the worker.
+    If the level was never prefetched, the assets are prepared synchronously.
+
+    Attributes:
+        background_cache (BackgroundCache): The cache of prepared backgrounds.
+        staged_music (dict): Contents of the music files. Keyed by the level number.
+        pending (dict): Futures of the prefetch jobs in progress. Keyed by the level number.
+
+    version: 1
+    """
+    def __init__(self):
+        self.background_cache: BackgroundCache = BackgroundCache()
+        self.staged_music: dict[int, bytes] = {}
+        self.pending: dict[int, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='level-prefetch')
+
+    def _prepare_level(self, level: int):
+        """
+        Prepare the background and read the music of the level. Runs in the worker thread.
+
+        Args:
+            level (int): The level number.
+        """
+        if self.background_cache.get(level) is None:
+            self.background_cache.put(level, load_background(f'level-{level}'))
+        if level not in self.staged_music:
+            self.staged_music[level] = get_level_music_path(level).read_bytes()
+
+    def prefetch(self, level: int):
+        """
+        Start preparing the assets of the level in the worker thread.
+
+        Args:
+            level (int): The level number.
+        """
+        if level in self.pending:
+            return
+        self.pending[level] = self._executor.submit(self._prepare_level, level)
+        game_logger.debug('Prefetch of level %s assets started', level)
+
+    def _wait(self, level: int):
+        """
+        Wait for the prefetch job of the level to finish. Errors of the job are logged and ignored,
+        the assets are then prepared synchronously.
+
+        Args:
+            level (int): The level number.
+        """
+        future = self.pending.pop(level, None)
+        if future is None:
+            return
+        try:
+            future.result()
+        except (OSError, pygame.error) as e:  # pylint: disable=E1101
+            game_logger.warning('Prefetch of level %s assets failed: %s', level, e)
+
+    def get_background(self, level: int) -> pygame.Surface:
+        """
+        Get the prepared background of the level.
+
+        Args:
+            level (int): The level number.
+
+        Returns:
+            pygame.Surface: The prepared background.
+        """
+        self._wait(level)
+        background = self.background_cache.get(level)
+        if background is None:
+            background = load_background(f'level-{level}')
+            self.background_cache.put(level, background)
+        return background
+
+    def get_music(self, level: int) -> io.BytesIO:
+        """
+        Get the staged music of the level.
+
+        Args:
+            level (int): The level number.
+
+        Returns:
+            io.BytesIO: The contents of the music file.
+        """
+        self._wait(level)
+        if level not in self.staged_music:
+            self.staged_music[level] = get_level_music_path(level).read_bytes()
+        return io.BytesIO(self.staged_music[level])
+
+
+def main():
+    """
+    Bake the backgrounds of all resolutions listed in settings.
+    """
+    parser = argparse.ArgumentParser(description='Bake darkened and scaled backgrounds for every resolution.')
+    parser.add_argument('--resolution', choices=list(settings.RESOLUTIONS.keys()), action='append',
+                        help='Resolution to bake. Defaults to all resolutions.')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes.')
+    parser.add_argument('--force', action='store_true', help='Bake again even if the baked backgrounds are valid.')
+    arguments = parser.parse_args()
+    baked_backgrounds.build(arguments.resolution, arguments.workers, arguments.force)
+
+
+if __name__ == '__main__':
+    main()
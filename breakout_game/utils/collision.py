@@ -0,0 +1,136 @@
+"""
+Swept collision detection of a moving box against static rectangles.
+
+Boxes are (x, y, width, height) tuples of floats, so positions between pixels are kept. Rectangles are
+anything with left, top, right and bottom attributes, such as pygame.Rect.
+"""
+import math
+
+# Times and overlaps closer than this are treated as touching
+EPSILON = 1e-9
+
+
+def _axis_times(position: float, size: float, displacement: float, low: float, high: float) -> tuple[float, float]:
+    """
+    Get the times a moving interval enters and leaves a static interval along one axis.
+
+    Args:
+        position (float): The start of the moving interval.
+        size (float): The length of the moving interval.
+        displacement (float): The movement of the interval.
+        low (float): The start of the static interval.
+        high (float): The end of the static interval.
+
+    Returns:
+        tuple[float, float]: The entry and exit time as the fraction of the displacement. Infinite if the
+            interval does not move, negative infinity entry if it overlaps the static interval all the time.
+    """
+    if displacement == 0:
+        if low - size < position < high:
+            return -math.inf, math.inf
+        return math.inf, -math.inf
+    entry = (low - size - position) / displacement
+    leave = (high - position) / displacement
+    return min(entry, leave), max(entry, leave)
+
+
+def sweep_box(box: tuple, displacement: tuple, rect) -> [None, tuple[float, tuple[int, int]]]:
+    """
+    Find the time of impact of a box moving along the displacement with a static rectangle.
+
+    Boxes already overlapping the rectangle or only touching it while moving away do not hit it.
+
+    Args:
+        box (tuple): The moving box as (x, y, width, height).
+        displacement (tuple): The movement of the box as (dx, dy).
+        rect: The static rectangle.
+
+    Returns:
+        None, tuple[float, tuple[int, int]]: None if the box does not hit the rectangle. Otherwise the time
+            of impact as the fraction of the displacement from 0 to 1 and the normal of the hit face.
+            A corner hit has both components of the normal set.
+    """
+    x_entry, x_exit = _axis_times(box[0], box[2], displacement[0], rect.left, rect.right)
+    y_entry, y_exit = _axis_times(box[1], box[3], displacement[1], rect.top, rect.bottom)
+    entry = max(x_entry, y_entry)
+    leave = min(x_exit, y_exit)
+    if entry > leave or entry < -EPSILON or entry > 1 or leave <= EPSILON:
+        return None
+
+    normal_x = -int(math.copysign(1, displacement[0])) if x_entry >= y_entry - EPSILON else 0
+    normal_y = -int(math.copysign(1, displacement[1])) if y_entry >= x_entry - EPSILON else 0
+    return max(entry, 0.0), (normal_x, normal_y)
+
+
+def find_first_hit(box: tuple, displacement: tuple, rects: list) -> [None, tuple[float, tuple[int, int], list[int]]]:
+    """
+    Find the rectangles hit first by a box moving along the displacement.
+
+    Rectangles hit at the same time are returned together. If a face of one of them is hit, the corners
+    hit at the same time are ignored, so a box sliding into a row of adjacent rectangles bounces off the
+    row instead of off the corner between two of them.
+
+    Args:
+        box (tuple): The moving box as (x, y, width, height).
+        displacement (tuple): The movement of the box as (dx, dy).
+        rects (list): The static rectangles.
+
+    Returns:
+        None, tuple[float, tuple[int, int], list[int]]: None if no rectangle is hit. Otherwise the time of
+            impact, the combined normal of the hit faces and the indices of the rectangles hit.
+    """
+    first_time = math.inf
+    hits = []
+    for index, rect in enumerate(rects):
+        hit = sweep_box(box, displacement, rect)
+        if hit is None or hit[0] > first_time + EPSILON:
+            continue
+        if hit[0] < first_time - EPSILON:
+            first_time = hit[0]
+            hits = []
+        hits.append((index, hit[1]))
+    if not hits:
+        return None
+
+    face_normals = [normal for _, normal in hits if 0 in normal]
+    normals = face_normals if face_normals else [normal for _, normal in hits]
+    normal_x = next((normal[0] for normal in normals if normal[0] != 0), 0)
+    normal_y = next((normal[1] for normal in normals if normal[1] != 0), 0)
+    return first_time, (normal_x, normal_y), [index for index, _ in hits]
+
+
+def overlaps(box: tuple, rect) -> bool:
+    """
+    Whether the box overlaps the rectangle. Touching edges do not overlap.
+
+    Args:
+        box (tuple): The box as (x, y, width, height).
+        rect: The rectangle.
+
+    Returns:
+        bool: True if the box and the rectangle share an area.
+    """
+    x, y, width, height = box
+    return (
+        x + width > rect.left + EPSILON and x < rect.right - EPSILON
+        and y + height > rect.top + EPSILON and y < rect.bottom - EPSILON
+    )
+
+
+def reflect(direction: tuple, normal: tuple[int, int]) -> tuple:
+    """
+    Reflect the direction off the face with the normal. Only the components moving into the face are reversed.
+
+    Args:
+        direction (tuple): The direction of movement as (x, y).
+        normal (tuple[int, int]): The normal of the face.
+
+    Returns:
+        tuple: The direction after the bounce as (x, y).
+    """
+    direction_x, direction_y = direction
+    if normal[0] * direction_x < 0:
+        direction_x = -direction_x
+    if normal[1] * direction_y < 0:
+        direction_y = -direction_y
+    return direction_x, direction_y
@@ -0,0 +1,61 @@
+"""
+Fixed timestep accumulator decoupling the physics steps from the rendered frames.
+"""
+from breakout_game.config import settings
+
+
+class FixedTimestep:
+    """
+    Accumulates the time of rendered frames and converts it into whole physics steps of a fixed length.
+
+    The time left over after the steps is kept for the next frame. Its ratio to the step length is used to
+    interpolate the rendered positions between the previous and the current step.
+
+    Attributes:
+        tick_time (float): The length of a physics step in seconds.
+        max_frame_time (float): The longest frame time in seconds caught up with steps.
+        accumulator (float): The time in seconds not simulated yet. Defaults to 0.
+
+    Args:
+        tick_rate (None, int): The number of steps per second. Defaults to None. If None, settings.TICK_RATE.
+        max_frame_time (None, float): The longest frame time caught up with steps. Defaults to None.
+            If None, settings.MAX_FRAME_TIME.
+
+    version: 1
+    """
+    def __init__(self, tick_rate: [None, int] = None, max_frame_time: [None, float] = None):
+        self.tick_time: float = 1 / (tick_rate if tick_rate is not None else settings.TICK_RATE)
+        self.max_frame_time: float = max_frame_time if max_frame_time is not None else settings.MAX_FRAME_TIME
+        self.accumulator: float = 0.0
+
+    def advance(self, frame_time: float) -> int:
+        """
+        Add the time of a frame and take the whole steps out of the accumulated time.
+
+        Args:
+            frame_time (float): The time of the frame in seconds.
+
+        Returns:
+            int: The number of steps to simulate.
+        """
+        self.accumulator += min(frame_time, self.max_frame_time)
+        # The small margin keeps frames of exactly n steps from rounding down to n - 1 steps
+        ticks = int(self.accumulator / self.tick_time + 1e-9)
+        self.accumulator = max(self.accumulator - ticks * self.tick_time, 0.0)
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        """
+        The progress between the previous and the next step. Used to interpolate rendered positions.
+
+        Returns:
+            float: The ratio from 0 to 1.
+        """
+        return min(self.accumulator / self.tick_time, 1.0)
+
+    def reset(self):
+        """
+        Drop the accumulated time.
+        """
+        self.accumulator = 0.0
@@ -0,0 +1,188 @@
+"""
+Frame scheduler pacing the main loop.
+"""
+import math
+import time
+import logging
+
+from collections import deque
+from typing import Callable
+
+import pygame
+
+from breakout_game.config import settings
+
+game_logger = logging.getLogger('')
+
+FRAME_STRATEGIES = ('busy', 'sleep-spin', 'event-wait')
+
+
+class FrameScheduler:
+    """
+    Waits for the next frame and measures the time between frames.
+
+    Strategies:
+        busy: spin until the frame is due. The most exact pacing, keeps one core busy.
+        sleep-spin: sleep until shortly before the frame is due, then spin for the rest.
+        event-wait: sleep until an event arrives or the idle timeout passes. Meant for static screens,
+            where nothing changes without input.
+
+    Frames are due at fixed intervals from the previous due time, so the pacing does not drift. If the loop
+    falls behind by more than a frame, the schedule restarts from the current time.
+
+    Attributes:
+        frame_time (float): The time of a frame in seconds.
+        strategy (str): The strategy used during the game.
+        idle_strategy (str): The strategy used on static screens.
+        spin_time (float): The time in seconds spun before a frame by the sleep-spin strategy.
+        idle_timeout (float): The longest time in seconds the event-wait strategy waits.
+        frame_times (deque): The times between the last game frames in seconds.
+        frames (int): The number of game frames scheduled. Defaults to 0.
+        log_interval (int): The number of game frames between log messages. Defaults to 600.
+        clock (Callable[[], float]): Returns the current time in seconds. Defaults to time.perf_counter.
+        sleep (Callable[[float], None]): Sleeps for the time in seconds. Defaults to time.sleep.
+
+    Args:
+        fps (None, int): The frames per second. Defaults to None. If None, settings.FPS.
+        strategy (None, str): The strategy used during the game. Defaults to None.
+            If None, settings.FRAME_STRATEGY.
+        idle_strategy (None, str): The strategy used on static screens. Defaults to None.
+            If None, settings.IDLE_FRAME_STRATEGY.
+        spin_time (None, float): The time spun before a frame. Defaults to None. If None, settings.FRAME_SPIN_TIME.
+        idle_timeout (None, float): The longest wait for an event. Defaults to None.
+            If None, settings.IDLE_TIMEOUT.
+        log_interval (int): The number of game frames between log messages. Defaults to 600.
+        clock (None, Callable[[], float]): Returns the current time in seconds. Defaults to None.
+            If None, time.perf_counter.
+        sleep (None, Callable[[float], None]): Sleeps for the time in seconds. Defaults to None.
+            If None, time.sleep.
+
+    Raises:
+        ValueError: If a strategy is unknown.
+
+    version: 1
+    """
+    def __init__(
+            self,
+            fps: [None, int] = None,
+            strategy: [None, str] = None,
+            idle_strategy: [None, str] = None,
+            spin_time: [None, float] = None,
+            idle_timeout: [None, float] = None,
+            log_interval: int = 600,
+            clock: [None, Callable[[], float]] = None,
+            sleep: [None, Callable[[float], None]] = None
+    ):
+        self.frame_time: float = 1 / (fps if fps is not None else settings.FPS)
+        self.strategy: str = strategy if strategy is not None else settings.FRAME_STRATEGY
+        self.idle_strategy: str = idle_strategy if idle_strategy is not None else settings.IDLE_FRAME_STRATEGY
+        self.spin_time: float = spin_time if spin_time is not None else settings.FRAME_SPIN_TIME
+        self.idle_timeout: float = idle_timeout if idle_timeout is not None else settings.IDLE_TIMEOUT
+        for name in (self.strategy, self.idle_strategy):
+            if name not in FRAME_STRATEGIES:
+                raise ValueError(f'Unknown frame strategy {name}. Available strategies: {FRAME_STRATEGIES}')
+
+        self.frame_times: deque = deque(maxlen=log_interval)
+        self.frames: int = 0
+        self.log_interval: int = log_interval
+        self.clock: Callable[[], float] = clock if clock is not None else time.perf_counter
+        self.sleep: Callable[[float], None] = sleep if sleep is not None else time.sleep
+        self._last_tick: [None, float] = None
+        self._due_time: [None, float] = None
+        self._last_idle: bool = False
+
+    def tick(self, idle: bool = False) -> float:
+        """
+        Wait for the next frame.
+
+        Args:
+            idle (bool): If true, the screen is static and the idle strategy is used. Defaults to False.
+
+        Returns:
+            float: The time passed since the last frame in seconds. The first game frame after static screens
+                gets the time of one frame, so the game does not jump by the time spent waiting.
+        """
+        now = self.clock()
+        if self._last_tick is None:
+            self._last_tick, self._due_time = now, now
+            self._last_idle = idle
+            return self.frame_time
+
+        self._due_time += self.frame_time
+        if self._due_time < now - self.frame_time:
+            self._due_time = now
+        self._wait(self.idle_strategy if idle else self.strategy)
+
+        now = self.clock()
+        delta_time = now - self._last_tick
+        self._last_tick = now
+        was_idle, self._last_idle = self._last_idle, idle
+        if idle or was_idle:
+            # Waiting for events ends at any time, the schedule starts again from the end of the wait
+            self._due_time = now
+            return delta_time if idle else self.frame_time
+
+        self._record(delta_time)
+        return delta_time
+
+    def _wait(self, strategy: str):
+        """
+        Wait until the frame is due with the strategy provided.
+
+        Args:
+            strategy (str): The name of the strategy.
+        """
+        if strategy == 'event-wait':
+            timeout = max(self._last_tick + self.idle_timeout - self.clock(), 0)
+            event = pygame.event.wait(math.ceil(timeout * 1000))
+            if event.type != pygame.NOEVENT:  # pylint: disable=E1101
+                # The event is put back for the main loop to handle
+                pygame.event.post(event)
+            # Input still cannot make frames come faster than the frame rate
+            strategy = 'sleep-spin'
+
+        if strategy == 'sleep-spin':
+            sleep_time = self._due_time - self.spin_time - self.clock()
+            if sleep_time > 0:
+                self.sleep(sleep_time)
+
+        while self.clock() < self._due_time:
+            pass
+
+    def _record(self, frame_time: float):
+        """
+        Record the time of a game frame and log the statistics every log_interval frames.
+
+        Args:
+            frame_time (float): The time between the frames in seconds.
+        """
+        self.frame_times.append(frame_time)
+        self.frames += 1
+        if self.frames % self.log_interval == 0:
+            statistics = self.get_statistics()
+            game_logger.debug(
+                'Frame time: %.2f ms mean, %.2f ms jitter, %.2f ms max deviation',
+                statistics['mean-frame-time'],
+                statistics['jitter'],
+                statistics['max-deviation']
+            )
+
+    def get_statistics(self) -> dict:
+        """
+        Get the statistics of the last game frames. Static screens are not included.
+
+        Returns:
+            dict: The number of frames measured, the mean frame time, the jitter as the standard deviation of
+                the frame time and the largest deviation from the target frame time. Times are in milliseconds.
+        """
+        if len(self.frame_times) == 0:
+            return {'frames': 0, 'mean-frame-time': 0.0, 'jitter': 0.0, 'max-deviation': 0.0}
+        mean = sum(self.frame_times) / len(self.frame_times)
+        variance = sum((frame_time - mean) ** 2 for frame_time in self.frame_times) / len(self.frame_times)
+        max_deviation = max(abs(frame_time - self.frame_time) for frame_time in self.frame_times)
+        return {
+            'frames': len(self.frame_times),
+            'mean-frame-time': mean * 1000,
+            'jitter': math.sqrt(variance) * 1000,
+            'max-deviation': max_deviation * 1000
+        }
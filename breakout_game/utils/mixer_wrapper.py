@@ -0,0 +1,156 @@
+"""
+Sound bank playing the sound effects through a fixed pool of reserved mixer channels.
+"""
+import logging
+
+import pygame
+
+from breakout_game.config import settings
+
+game_logger = logging.getLogger('')
+
+
+class SoundBank:
+    """
+    Loads every sound effect once and shares the pygame.mixer.Sound objects between all sprites.
+
+    Sounds are played through a pool of reserved mixer channels. The number of channels playing the same sound
+    at once is limited. A new request for a sound that already plays on all of its voices is dropped. If all
+    channels are busy, the channel playing another sound that started playing first is reused. A sound never
+    cuts off itself: if only channels playing the same sound are left, the new request is dropped.
+
+    Note:
+        Sounds are looked up by name in settings.SOUNDS. If the mixer is not initialised, nothing is loaded
+        or played.
+
+    Attributes:
+        sounds (dict): Loaded sounds. Keyed by the name of the sound.
+        channel_count (None, int): The number of reserved channels. Defaults to None.
+            If None, settings.SOUND_CHANNELS is used.
+        voice_limit (None, int): The maximum number of channels playing the same sound at once. Defaults to None.
+            If None, settings.SOUND_VOICE_LIMIT is used.
+        channels (list[pygame.mixer.Channel]): The reserved channels. Empty until the first sound is played.
+        channel_sounds (dict): The name of the sound played last on each channel. Keyed by the channel index.
+        channel_order (dict): The play counter value when each channel started playing. Keyed by the channel index.
+        play_counter (int): The number of sounds played. Defaults to 0.
+
+    version: 1
+    """
+    def __init__(self, channel_count: [None, int] = None, voice_limit: [None, int] = None):
+        self.sounds: dict[str, pygame.mixer.Sound] = {}
+        self.channel_count: [None, int] = channel_count
+        self.voice_limit: [None, int] = voice_limit
+
+        self.channels: list[pygame.mixer.Channel] = []
+        self.channel_sounds: dict[int, str] = {}
+        self.channel_order: dict[int, int] = {}
+        self.play_counter: int = 0
+
+    def get_sound(self, name: str) -> [None, pygame.mixer.Sound]:
+        """
+        Get the sound by name. Loads the sound on the first request.
+
+        Args:
+            name (str): The name of the sound. Available names are listed in settings.SOUNDS.
+
+        Returns:
+            None, pygame.mixer.Sound: The shared sound object. None if the mixer is not initialised.
+        """
+        if name not in self.sounds:
+            if not pygame.mixer.get_init():
+                return None
+            sound_settings = settings.SOUNDS[name]
+            sound = pygame.mixer.Sound(sound_settings['path'])
+            sound.set_volume(sound_settings['volume'])
+            self.sounds[name] = sound
+            game_logger.debug('Sound %s loaded', name)
+        return self.sounds[name]
+
+    def preload(self):
+        """
+        Load all sounds listed in settings.
+        """
+        for name in settings.SOUNDS.keys():
+            self.get_sound(name)
+
+    def reserve_channels(self):
+        """
+        Reserve the channels for sound effects so that they are not used by pygame.mixer.find_channel.
+        """
+        channel_count = self.channel_count or settings.SOUND_CHANNELS
+        pygame.mixer.set_num_channels(channel_count)
+        pygame.mixer.set_reserved(channel_count)
+        self.channels = [pygame.mixer.Channel(index) for index in range(channel_count)]
+        self.channel_sounds.clear()
+        self.channel_order.clear()
+
+    def _find_channel(self, name: str) -> [None, int]:
+        """
+        Find the channel to play the sound on.
+
+        Args:
+            name (str): The name of the sound.
+
+        Returns:
+            None, int: The index of the channel. None if the sound already plays on all of its voices, or if
+                all channels are busy playing it.
+        """
+        voice_limit = self.voice_limit or settings.SOUND_VOICE_LIMIT
+        busy_channels = []
+        free_channel = None
+        for index, channel in enumerate(self.channels):
+            if channel.get_busy():
+                busy_channels.append(index)
+            elif free_channel is None:
+                free_channel = index
+
+        voices = [index for index in busy_channels if self.channel_sounds.get(index) == name]
+        if len(voices) >= voice_limit:
+            return None
+        if free_channel is not None:
+            return free_channel
+        other_channels = [index for index in busy_channels if self.channel_sounds.get(index) != name]
+        if not other_channels:
+            return None
+        return min(other_channels, key=lambda index: self.channel_order.get(index, 0))
+
+    def play(self, name: str) -> [None, pygame.mixer.Channel]:
+        """
+        Play the sound on one of the reserved channels.
+
+        Args:
+            name (str): The name of the sound. Available names are listed in settings.SOUNDS.
+
+        Returns:
+            None, pygame.mixer.Channel: The channel the sound is played on. None if the sound is not played.
+        """
+        sound = self.get_sound(name)
+        if sound is None:
+            return None
+        if not self.channels:
+            self.reserve_channels()
+
+        channel_index = self._find_channel(name)
+        if channel_index is None:
+            return None
+
+        channel = self.channels[channel_index]
+        channel.play(sound)
+        self.play_counter += 1
+        self.channel_sounds[channel_index] = name
+        self.channel_order[channel_index] = self.play_counter
+        return channel
+
+    def clear(self):
+        """
+        Stop all channels and forget the loaded sounds.
+        """
+        for channel in self.channels:
+            channel.stop()
+        self.sounds.clear()
+        self.channels = []
+        self.channel_sounds.clear()
+        self.channel_order.clear()
+
+
+sound_bank = SoundBank()
@@ -0,0 +1,81 @@
+"""
+Statistics of the screen area redrawn per frame.
+"""
+import logging
+
+import pygame
+
+from breakout_game.config import settings
+
+game_logger = logging.getLogger('')
+
+
+class RenderStats:
+    """
+    Tracks which part of the screen is pushed to the display every frame.
+
+    Attributes:
+        screen_area (int): The number of pixels of the screen.
+        frames (int): The number of frames recorded. Defaults to 0.
+        redrawn_area (int): The number of pixels pushed to the display in all frames. Defaults to 0.
+        last_redrawn_percentage (float): The percentage of the screen pushed in the last frame. Defaults to 0.
+        log_interval (int): The number of frames between log messages. Defaults to 600.
+
+    Args:
+        screen_size (None, tuple): The size of the screen. Must be a tuple of (width, height).
+            Defaults to None. If None, the size of the window is used.
+        log_interval (int): The number of frames between log messages. Defaults to 600.
+
+    version: 1
+    """
+    def __init__(self, screen_size: [None, tuple] = None, log_interval: int = 600):
+        if screen_size is None:
+            screen_size = (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT)
+        self.screen_rect: pygame.Rect = pygame.Rect((0, 0), screen_size)
+        self.screen_area: int = screen_size[0] * screen_size[1]
+        self.frames: int = 0
+        self.redrawn_area: int = 0
+        self.last_redrawn_percentage: float = 0.0
+        self.log_interval: int = log_interval
+
+    def record(self, dirty_rects: [None, list[pygame.Rect]] = None):
+        """
+        Record the rectangles pushed to the display in a frame.
+
+        Note:
+            Overlapping rectangles are counted as many times as they overlap, the same way they are pushed.
+
+        Args:
+            dirty_rects (None, list[pygame.Rect]): The rectangles pushed to the display.
+                Defaults to None. If None, the whole screen was pushed.
+        """
+        if dirty_rects is None:
+            frame_area = self.screen_area
+        else:
+            frame_area = 0
+            for rect in dirty_rects:
+                clipped_rect = self.screen_rect.clip(rect)
+                frame_area += clipped_rect.width * clipped_rect.height
+            frame_area = min(frame_area, self.screen_area)
+
+        self.frames += 1
+        self.redrawn_area += frame_area
+        self.last_redrawn_percentage = 100 * frame_area / self.screen_area
+        if self.frames % self.log_interval == 0:
+            game_logger.debug(
+                'Screen redrawn per frame: %.1f%% last, %.1f%% average',
+                self.last_redrawn_percentage,
+                self.average_redrawn_percentage
+            )
+
+    @property
+    def average_redrawn_percentage(self) -> float:
+        """
+        The average percentage of the screen pushed to the display per frame.
+
+        Returns:
+            float: The percentage.
+        """
+        if self.frames == 0:
+            return 0.0
+        return 100 * self.redrawn_area / (self.frames * self.screen_area)
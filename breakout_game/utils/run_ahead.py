@@ -0,0 +1,143 @@
+"""
+Run-ahead: frames shown a few physics steps ahead of the game to hide the latency of slow displays.
+"""
+from __future__ import annotations
+
+import logging
+import time
+
+from typing import TYPE_CHECKING
+
+from breakout_game.config import settings
+
+if TYPE_CHECKING:
+    from breakout_game.sprites import SpriteManager
+
+game_logger = logging.getLogger('')
+
+
+def sync_silently(sprite_manager: SpriteManager, changes: list):
+    """
+    Bring the sprites in line with the game core without playing the sounds of the last step.
+
+    Args:
+        sprite_manager (SpriteManager): The game.
+        changes (list): The blocks changed since the last sync. See BlockField.changes.
+    """
+    sprite_manager.core.block_field.changes[:] = changes
+    sprite_manager.core.sounds.clear()
+    sprite_manager.sync()
+
+
+class RunAhead:
+    """
+    Predicts the frame shown. Each frame the game is stepped ahead with the current inputs, drawn,
+    and rolled back to the snapshot taken before the prediction, so the steps run ahead never count.
+    The sounds of the steps run ahead are not played.
+
+    Attributes:
+        ticks (int): The number of physics steps run ahead each frame. If 0, run-ahead is disabled.
+        snapshot (None, dict): The state of the game to roll back to. Defaults to None.
+            None if no frame is predicted.
+        frames (int): The number of frames predicted. Defaults to 0.
+        ahead_time (float): The time spent running ahead in all frames in seconds. Defaults to 0.
+        rollback_time (float): The time spent rolling back in all frames in seconds. Defaults to 0.
+        last_ahead_time (float): The time spent running ahead in the last frame in seconds. Defaults to 0.
+        last_rollback_time (float): The time spent rolling back in the last frame in seconds. Defaults to 0.
+        log_interval (int): The number of frames between log messages. Defaults to 600.
+
+    Args:
+        ticks (None, int): The number of physics steps run ahead each frame. Defaults to None.
+            If None, settings.RUN_AHEAD_TICKS is used.
+        log_interval (int): The number of frames between log messages. Defaults to 600.
+
+    version: 1
+    """
+    def __init__(self, ticks: [None, int] = None, log_interval: int = 600):
+        if ticks is None:
+            ticks = settings.RUN_AHEAD_TICKS
+        if ticks < 0:
+            raise ValueError('The number of steps run ahead must not be negative.')
+        self.ticks: int = ticks
+        self.snapshot: [None, dict] = None
+        self.frames: int = 0
+        self.ahead_time: float = 0.0
+        self.rollback_time: float = 0.0
+        self.last_ahead_time: float = 0.0
+        self.last_rollback_time: float = 0.0
+        self.log_interval: int = log_interval
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether frames are predicted.
+
+        Returns:
+            bool: True if at least one step is run ahead.
+        """
+        return self.ticks > 0
+
+    def run(self, sprite_manager: SpriteManager, tick_time: float, inputs: int):
+        """
+        Take a snapshot of the game and step it ahead. The sprites are moved between the last two steps run
+        ahead, so the frame is drawn with the progress to the next step like any other. The blocks changed
+        by all steps run ahead are rendered again.
+
+        Args:
+            sprite_manager (SpriteManager): The game to predict.
+            tick_time (float): The time of a physics step in seconds.
+            inputs (int): The inputs of the steps run ahead.
+        """
+        if not self.enabled or self.snapshot is not None:
+            return
+        start = time.perf_counter()
+        core = sprite_manager.core
+        self.snapshot = sprite_manager.get_snapshot()
+        changes = []
+        for tick in range(self.ticks):
+            if tick == self.ticks - 1:
+                sync_silently(sprite_manager, changes)
+                sprite_manager.save_positions()
+                changes = []
+            core.step(tick_time, inputs)
+            changes += core.block_field.changes
+        sync_silently(sprite_manager, changes)
+        self.last_ahead_time = time.perf_counter() - start
+        self.ahead_time += self.last_ahead_time
+
+    def roll_back(self, sprite_manager: SpriteManager):
+        """
+        Restore the game to the snapshot taken before the frame was predicted.
+
+        Args:
+            sprite_manager (SpriteManager): The game predicted.
+        """
+        if self.snapshot is None:
+            return
+        start = time.perf_counter()
+        sprite_manager.restore_snapshot(self.snapshot)
+        self.snapshot = None
+        self.last_rollback_time = time.perf_counter() - start
+        self.rollback_time += self.last_rollback_time
+
+        self.frames += 1
+        if self.frames % self.log_interval == 0:
+            game_logger.debug(
+                'Run-ahead of %s steps: %.2f ms ahead, %.2f ms rollback, %.2f ms added per frame on average',
+                self.ticks,
+                1000 * self.ahead_time / self.frames,
+                1000 * self.rollback_time / self.frames,
+                self.average_added_time * 1000
+            )
+
+    @property
+    def average_added_time(self) -> float:
+        """
+        The average CPU time added per frame by running ahead and rolling back.
+
+        Returns:
+            float: The time in seconds.
+        """
+        if self.frames == 0:
+            return 0.0
+        return (self.ahead_time + self.rollback_time) / self.frames
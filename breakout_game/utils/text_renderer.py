@@ -0,0 +1,189 @@
+"""
+Text renderer composing strings from glyphs rasterized once into an atlas.
+"""
+import string
+
+from pathlib import Path
+
+import pygame
+
+GLYPH_PADDING = 1
+
+
+class GlyphAtlasFont:
+    """
+    Font rendering strings from a glyph atlas instead of rasterizing the whole string every time.
+
+    Each glyph is rasterized once per color into one atlas surface. A string is composed with a single
+    Surface.blits call. The render method mirrors pygame.font.Font.render, so the object can be used
+    wherever a font is expected.
+
+    Note:
+        The glyphs are laid out by the offsets measured by the font for each pair of characters, so kerning
+        is kept. For the game font the result is identical to pygame.font.Font.render. Fonts kerning at
+        sub-pixel precision may place a glyph one pixel apart.
+
+    Attributes:
+        font (pygame.font.Font): The font the glyphs are rasterized with.
+        height (int): The height of the rendered text.
+        characters (str): The characters in the atlases. Defaults to printable ASCII characters.
+        offsets (dict[str, int]): The horizontal offset from a character to the next one, kerning included.
+            Keyed by the pair of characters.
+        atlases (dict): The atlas surface and the rectangle of each glyph. Keyed by (color, antialias).
+
+    Args:
+        path (str, Path): The path of the font file.
+        size (int): The size of the font.
+
+    version: 1
+    """
+    def __init__(self, path: (str, Path), size: int):
+        self.font: pygame.font.Font = pygame.font.Font(path, size)
+        self.height: int = self.font.get_height()
+        self.characters: str = ''.join(character for character in string.printable if character.isprintable())
+        self.offsets: dict[str, int] = {}
+        self.atlases: dict[tuple, tuple[pygame.Surface, dict[str, pygame.Rect]]] = {}
+
+    def get_height(self) -> int:
+        """
+        Get the height of the rendered text.
+
+        Returns:
+            int: The height in pixels.
+        """
+        return self.height
+
+    def get_offset(self, pair: str) -> int:
+        """
+        Get the horizontal offset from the first character of the pair to the second one.
+
+        Args:
+            pair (str): The two characters.
+
+        Returns:
+            int: The offset in pixels, kerning included.
+        """
+        offset = self.offsets.get(pair)
+        if offset is None:
+            offset = self.font.size(pair)[0] - self.font.size(pair[1])[0]
+            self.offsets[pair] = offset
+        return offset
+
+    def size(self, text: str) -> tuple[int, int]:
+        """
+        Get the size of the rendered text.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            tuple[int, int]: The width and height in pixels.
+        """
+        return self.font.size(text)
+
+    def _build_atlas(self, color: tuple, antialias: bool) -> tuple[pygame.Surface, dict[str, pygame.Rect]]:
+        """
+        Rasterize all characters into one atlas surface.
+
+        Args:
+            color (tuple): The color of the glyphs.
+            antialias (bool): If true, the glyphs have smooth edges.
+
+        Returns:
+            tuple[pygame.Surface, dict[str, pygame.Rect]]: The atlas and the rectangle of each glyph.
+        """
+        glyphs = {character: self.font.render(character, antialias, color) for character in self.characters}
+        atlas_width = sum(glyph.get_width() + GLYPH_PADDING for glyph in glyphs.values())
+        atlas = pygame.Surface((max(atlas_width, 1), self.get_height()), pygame.SRCALPHA)  # pylint: disable=E1101
+
+        rects = {}
+        x = 0
+        for character, glyph in glyphs.items():
+            rects[character] = pygame.Rect((x, 0), glyph.get_size())
+            # The atlas is fully transparent, taking the maximum copies the pixels without blending.
+            atlas.blit(glyph, rects[character], special_flags=pygame.BLEND_RGBA_MAX)  # pylint: disable=E1101
+            x += glyph.get_width() + GLYPH_PADDING
+        return atlas, rects
+
+    def get_atlas(self, color, antialias: bool = True) -> tuple[pygame.Surface, dict[str, pygame.Rect]]:
+        """
+        Get the atlas of the color. The atlas is built on the first request.
+
+        Args:
+            color: The color of the glyphs. Any value accepted by pygame.Color.
+            antialias (bool): If true, the glyphs have smooth edges. Defaults to True.
+
+        Returns:
+            tuple[pygame.Surface, dict[str, pygame.Rect]]: The atlas and the rectangle of each glyph.
+        """
+        color = tuple(pygame.Color(color))
+        key = (color, antialias)
+        if key not in self.atlases:
+            self.atlases[key] = self._build_atlas(color, antialias)
+        return self.atlases[key]
+
+    def add_characters(self, characters: str):
+        """
+        Add characters to the atlases. Existing atlases are built again on the next request.
+
+        Args:
+            characters (str): The characters to add.
+        """
+        new_characters = ''.join(sorted(set(characters) - set(self.characters)))
+        if new_characters:
+            self.characters += new_characters
+            self.atlases.clear()
+
+    def render(self, text: str, antialias: bool, color, background=None) -> pygame.Surface:
+        """
+        Render the text composed from the glyph atlas.
+
+        Args:
+            text (str): The text to render.
+            antialias (bool): If true, the text has smooth edges.
+            color: The color of the text. Any value accepted by pygame.Color.
+            background: The color of the background. Defaults to None. If None, the background is transparent.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        atlas, rects = self.get_atlas(color, antialias)
+        if not rects.keys() >= set(text):
+            self.add_characters(text)
+            atlas, rects = self.get_atlas(color, antialias)
+
+        blit_sequence = []
+        x = 0
+        for index, character in enumerate(text):
+            if index > 0:
+                x += self.get_offset(text[index - 1:index + 1])
+            blit_sequence.append((atlas, (x, 0), rects[character], pygame.BLEND_RGBA_MAX))  # pylint: disable=E1101
+
+        surface = pygame.Surface(self.font.size(text), pygame.SRCALPHA)  # pylint: disable=E1101
+        surface.blits(blit_sequence, doreturn=False)
+        if background is not None:
+            background_surface = pygame.Surface(surface.get_size())
+            background_surface.fill(background)
+            background_surface.blit(surface, (0, 0))
+            return background_surface
+        return surface
+
+
+_fonts: dict[tuple, GlyphAtlasFont] = {}
+
+
+def get_font(path: (str, Path), size: int) -> GlyphAtlasFont:
+    """
+    Get the shared glyph atlas font of the size provided.
+
+    Args:
+        path (str, Path): The path of the font file.
+        size (int): The size of the font.
+
+    Returns:
+        GlyphAtlasFont: The font.
+    """
+    key = (str(path), size)
+    if key not in _fonts:
+        _fonts[key] = GlyphAtlasFont(path, size)
+    return _fonts[key]
@@ -3,6 +3,7 @@ from setuptools import setup, find_packages
 
 required = [
     'matplotlib==3.8.3',
+    'numpy==1.26.4',
     'pygame==2.5.2',
     'pydantic==2.6.3',
     'pytest==8.0.2',
@@ -20,7 +21,7 @@ setup(
         'breakout_game': [
             'assets/fonts/*',
             'assets/images/background/*', 'assets/images/ball/*', 'assets/images/blocks/*', 'assets/images/hearts/*',
-            'assets/images/powerups/*',
+            'assets/images/powerups/*', 'assets/atlas/*',
             'assets/sounds/*'
         ]
     },
@@ -28,6 +29,11 @@ setup(
     entry_points={
         'console_scripts': [
             'breakout=breakout_game',
+            'breakout-headless=breakout_game.headless:main',
+            'breakout-batch=breakout_game.batch:main',
+            'breakout-replay=breakout_game.replay:main',
+            'breakout-build-atlas=breakout_game.utils.atlas:main',
+            'breakout-bake-backgrounds=breakout_game.utils.backgrounds:main',
         ],
     },
     classifiers=[
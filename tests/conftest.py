@@ -0,0 +1,14 @@
+from unittest.mock import Mock
+
+import pygame
+import pytest
+
+from breakout_game.utils.mixer_wrapper import sound_bank
+
+
+@pytest.fixture
+def disable_sound(mocker):
+    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+    yield
+    # Sounds and channels created by the mocked mixer must not leak into other tests
+    sound_bank.clear()
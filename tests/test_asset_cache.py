@@ -0,0 +1,45 @@
+import pygame
+import pytest
+
+from breakout_game.config import settings
+from breakout_game.utils.asset_cache import AssetCache
+
+
+@pytest.fixture
+def cache():
+    pygame.init()
+    return AssetCache()
+
+
+def test_miss_then_hit(cache):
+    first = cache.get_image(settings.COLOR_LEGEND[1], size=(settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT))
+    second = cache.get_image(settings.COLOR_LEGEND[1], size=(settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT))
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_image_is_scaled(cache):
+    image = cache.get_image(settings.COLOR_LEGEND[2], size=(10.4, 20.6))
+    assert image.get_size() == (10, 21)
+
+
+def test_different_sizes_are_cached_separately(cache):
+    small = cache.get_image(settings.COLOR_LEGEND[3], size=(10, 10))
+    big = cache.get_image(settings.COLOR_LEGEND[3], size=(20, 20))
+    assert small is not big
+    assert cache.get_statistics()['surfaces'] == 2
+
+
+def test_tinted_variant_is_cached_separately(cache):
+    image = cache.get_image(settings.COLOR_LEGEND[1], size=(10, 10))
+    tinted = cache.get_image(settings.COLOR_LEGEND[1], size=(10, 10), tint=(125, 0, 0))
+    assert tinted is not image
+    assert cache.get_image(settings.COLOR_LEGEND[1], size=(10, 10), tint=(125, 0, 0)) is tinted
+    assert tinted.get_at((5, 5)).r == min(255, image.get_at((5, 5)).r + 125)
+
+
+def test_clear(cache):
+    cache.get_image(settings.COLOR_LEGEND[4])
+    cache.clear()
+    assert cache.get_statistics() == {'hits': 0, 'misses': 0, 'surfaces': 0, 'hit-ratio': 0.0}
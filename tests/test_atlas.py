@@ -0,0 +1,38 @@
+import pygame
+import pytest
+
+from breakout_game.config import settings
+from breakout_game.utils.atlas import TextureAtlas, build_atlas, pack_rects
+
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    pygame.init()
+
+
+def test_pack_rects_do_not_overlap():
+    sizes = {f'rect-{i}': (300, 50 + i) for i in range(10)}
+    rects, atlas_size = pack_rects(sizes, max_width=1000)
+    pygame_rects = [pygame.Rect(rect) for rect in rects.values()]
+    for i, rect in enumerate(pygame_rects):
+        assert rect.collidelist(pygame_rects[i + 1:]) == -1
+        assert rect.right <= atlas_size[0] <= 1000
+        assert rect.bottom <= atlas_size[1]
+
+
+def test_block_size_of_selected_resolution():
+    assert settings.get_block_size(settings.SELECTED_RESOLUTION) == (settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT)
+
+
+def test_build_and_load_atlas(tmp_path):
+    build_atlas(settings.SELECTED_RESOLUTION_NAME, tmp_path)
+    atlas = TextureAtlas.load(settings.SELECTED_RESOLUTION_NAME, tmp_path)
+    block = atlas.get_image(settings.COLOR_LEGEND[1], size=(settings.BLOCK_WIDTH, settings.BLOCK_HEIGHT))
+    powerup = atlas.get_image(settings.POWERS['big-ball']['path'])
+    assert block.get_parent() is atlas.surface
+    assert powerup.get_parent() is atlas.surface
+    assert atlas.get_image(settings.COLOR_LEGEND[1], size=(1, 1)) is None
+
+
+def test_missing_atlas(tmp_path):
+    assert TextureAtlas.load(settings.SELECTED_RESOLUTION_NAME, tmp_path) is None
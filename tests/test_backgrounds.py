@@ -0,0 +1,100 @@
+import os
+
+import pygame
+import pytest
+
+from breakout_game.config import settings
+from breakout_game.utils import backgrounds
+from breakout_game.utils.backgrounds import (
+    BackgroundCache, BakedBackgroundStore, LevelAssetPrefetcher, bake_background, get_background_sources
+)
+
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    pygame.init()
+
+
+def test_cache_evicts_least_recently_used():
+    surface_size = 100 * 100 * 4
+    cache = BackgroundCache(memory_budget=surface_size * 2)
+    for key in range(3):
+        cache.put(key, pygame.Surface((100, 100), pygame.SRCALPHA))
+    assert cache.get(0) is None
+    assert cache.get(1) is not None
+    assert cache.memory_used <= cache.memory_budget
+
+
+def test_cache_get_marks_recently_used():
+    surface_size = 100 * 100 * 4
+    cache = BackgroundCache(memory_budget=surface_size * 2)
+    cache.put(0, pygame.Surface((100, 100), pygame.SRCALPHA))
+    cache.put(1, pygame.Surface((100, 100), pygame.SRCALPHA))
+    cache.get(0)
+    cache.put(2, pygame.Surface((100, 100), pygame.SRCALPHA))
+    assert cache.get(0) is not None
+    assert cache.get(1) is None
+
+
+def test_prefetched_background_is_reused():
+    prefetcher = LevelAssetPrefetcher()
+    prefetcher.prefetch(0)
+    background = prefetcher.get_background(0)
+    assert background.get_width() >= settings.WINDOW_WIDTH
+    assert background.get_height() >= settings.WINDOW_HEIGHT
+    assert prefetcher.get_background(0) is background
+
+
+def test_music_is_staged():
+    prefetcher = LevelAssetPrefetcher()
+    prefetcher.prefetch(0)
+    assert len(prefetcher.get_music(0).read()) > 0
+
+
+def test_baked_background_is_stored_and_loaded(tmp_path):
+    source_path = tmp_path.joinpath('level-0.jpg')
+    source_path.write_bytes(get_background_sources()['level-0']['path'].read_bytes())
+    source = {'path': source_path, 'darken': True, 'cover': True}
+    store = BakedBackgroundStore(tmp_path.joinpath('baked'))
+
+    assert store.load('level-0', source_path, '800x600') is None
+    resolution_name, name, entry = bake_background('level-0', source, '800x600', store.path)
+    store.update_index(resolution_name, {name: entry})
+    background = store.load('level-0', source_path, '800x600')
+    assert background.get_width() >= 800
+    assert background.get_height() >= 600
+
+
+def test_baked_background_is_invalidated_by_source_change(tmp_path):
+    source_path = tmp_path.joinpath('menu.png')
+    source_path.write_bytes(get_background_sources()['menu']['path'].read_bytes())
+    source = {'path': source_path, 'darken': False, 'cover': False}
+    store = BakedBackgroundStore(tmp_path.joinpath('baked'))
+    store.update_index('800x600', {'menu': bake_background('menu', source, '800x600', store.path)[2]})
+
+    os.utime(source_path, (0, 0))
+    assert store.load('menu', source_path, '800x600').get_size() == (800, 600)
+    source_path.write_bytes(source_path.read_bytes() + b'changed')
+    assert store.load('menu', source_path, '800x600') is None
+
+
+def test_touched_source_is_hashed_once(tmp_path, mocker):
+    source_path = tmp_path.joinpath('menu.png')
+    source_path.write_bytes(get_background_sources()['menu']['path'].read_bytes())
+    source = {'path': source_path, 'darken': False, 'cover': False}
+    store = BakedBackgroundStore(tmp_path.joinpath('baked'))
+    store.update_index('800x600', {'menu': bake_background('menu', source, '800x600', store.path)[2]})
+
+    os.utime(source_path, (0, 0))
+    get_file_hash = mocker.patch('breakout_game.utils.backgrounds.get_file_hash', wraps=backgrounds.get_file_hash)
+    for _ in range(2):
+        assert store.load('menu', source_path, '800x600') is not None
+    assert get_file_hash.call_count == 1
+    assert store.load_index('800x600')['menu']['source-mtime'] == 0
+
+
+def test_build_in_process_pool(tmp_path):
+    store = BakedBackgroundStore(tmp_path)
+    baked = store.build(['800x600'], max_workers=2)
+    assert baked == len(get_background_sources())
+    assert store.build(['800x600'], max_workers=2) == 0
@@ -0,0 +1,130 @@
+import math
+from collections import defaultdict
+
+import numpy as np
+import pytest
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.core import GameCore
+from breakout_game.sprites import SpriteManager
+
+
+pytestmark = pytest.mark.usefixtures('disable_sound')
+
+
+@pytest.fixture
+def core():
+    game_core = GameCore()
+    game_core.init_level()
+    return game_core
+
+
+@pytest.fixture
+def empty_core(core):
+    core.block_field.clear()
+    return core
+
+
+@pytest.fixture
+def manager():
+    pygame.init()
+    sprite_manager = SpriteManager()
+    sprite_manager.init_level()
+    return sprite_manager
+
+
+def test_multiply_balls_fills_the_swarm(core):
+    core.powerup_manager.activate_multiple_balls()
+    assert len(core.balls) == 1
+    assert len(core.ball_swarm) == 2
+    core.powerup_manager.activate_multiple_balls()
+    assert len(core.ball_swarm) == 8
+
+
+def test_swarm_is_limited(core, monkeypatch):
+    monkeypatch.setattr(settings, 'MAX_SWARM_BALLS', 5)
+    for _ in range(3):
+        core.powerup_manager.activate_multiple_balls()
+    assert len(core.ball_swarm) == 5
+
+
+def test_fast_balls_do_not_pass_through_blocks(empty_core):
+    core = empty_core
+    core.block_field.set_block(4, 1, 1)
+    block_rect = core.block_field.get_rect(4, 1)
+    swarm = core.ball_swarm
+    swarm.add_balls([(block_rect.centerx, block_rect.bottom + 200)], [-math.pi / 2], [400], [1])
+    swarm.update(1)
+    assert core.block_field.health[4, 1] == 0
+    assert swarm.directions[0, 1] > 0
+    assert swarm.positions[0, 1] >= block_rect.bottom
+
+
+def test_destroyed_block_is_hit_once(empty_core):
+    core = empty_core
+    core.block_field.set_block(4, 1, 1)
+    block_rect = core.block_field.get_rect(4, 1)
+    swarm = core.ball_swarm
+    swarm.add_balls([(block_rect.centerx, block_rect.bottom + 100)] * 3, [-math.pi / 2] * 3, [400] * 3, [1] * 3)
+    swarm.update(0.5)
+    assert core.block_field.health[4, 1] == 0
+    assert core.score == 30
+
+
+def test_balls_bounce_off_paddle(empty_core):
+    core = empty_core
+    swarm = core.ball_swarm
+    paddle = core.paddle.rect
+    swarm.add_balls([(paddle.centerx + paddle.width / 4, paddle.top - 50)], [math.pi / 2], [400], [1])
+    swarm.update(0.25)
+    assert swarm.directions[0, 1] < 0
+    assert swarm.directions[0, 0] > 0
+    assert np.linalg.norm(swarm.directions[0]) == pytest.approx(1)
+
+
+def test_last_lost_ball_costs_health(empty_core):
+    core = empty_core
+    swarm = core.ball_swarm
+    core.balls.clear()
+    health = core.health
+    swarm.add_balls([(10, settings.GAME_WINDOW_HEIGHT - 5)], [math.pi / 2], [400], [1])
+    swarm.update(0.5)
+    assert len(swarm) == 0
+    assert core.health == health - 1
+    assert len(core.balls) == 1
+
+
+def test_powerups_change_the_swarm(manager):
+    core = manager.core
+    core.powerup_manager.activate_multiple_balls()
+    swarm = core.ball_swarm
+    centers = swarm.positions + np.array(swarm.get_size()) / 2
+    core.powerup_manager.activate_big_ball()
+    core.powerup_manager.activate_super_ball()
+    manager.sync()
+    ball_view = manager.ball_views[core.balls[0]]
+    assert manager.ball_swarm_view.image is ball_view.image
+    assert swarm.positions + np.array(swarm.get_size()) / 2 == pytest.approx(centers)
+    core.powerup_manager.deactivate_ball_size()
+    core.powerup_manager.deactivate_ball_strength()
+    manager.sync()
+    assert manager.ball_swarm_view.image is ball_view.image
+    assert ball_view.image.get_size() == (settings.BALL_SIZE, settings.BALL_SIZE)
+
+
+def test_many_balls_are_drawn_with_dirty_rects(manager):
+    manager.core.block_field.clear()
+    swarm = manager.core.ball_swarm
+    count = 2000
+    swarm.add_balls(
+        np.column_stack([np.linspace(50, 800, count), np.full(count, 400)]),
+        np.full(count, -math.pi / 4), np.full(count, 400), np.ones(count, dtype=int)
+    )
+    surface = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    manager.draw_all(surface)
+    manager.save_positions()
+    manager.update(1 / settings.TICK_RATE, defaultdict(bool))
+    assert len(swarm) == count
+    dirty_rects = manager.draw_all(surface, redraw_all=False, alpha=0.5)
+    assert len(dirty_rects) >= 2 * count
@@ -0,0 +1,34 @@
+from breakout_game.batch import BatchJob, make_jobs, run_batch, run_job
+
+
+def test_make_jobs():
+    jobs = make_jobs(3, seed=10, level_difficulty=1, level=2, max_steps=100)
+    assert [job.seed for job in jobs] == [10, 11, 12]
+    assert [job.index for job in jobs] == [0, 1, 2]
+    assert all(job.level_difficulty == 1 and job.level == 2 and job.max_steps == 100 for job in jobs)
+    assert all(job.seed is None for job in make_jobs(2))
+
+
+def test_run_job():
+    result = run_job(BatchJob(index=4, seed=1, level_difficulty=2, level=3, max_steps=500))
+    assert result['index'] == 4
+    assert result['start_level'] == 3
+    assert result['level'] == 3
+    assert result['steps'] == 500
+    assert result['lives_lost'] == 0
+    assert isinstance(result['powerups_taken'], dict)
+    assert result['wall_time'] > 0
+
+
+def test_same_seed_same_game():
+    job = BatchJob(index=0, seed=7, max_steps=3000)
+    first, second = run_job(job), run_job(job)
+    assert first['score'] == second['score']
+    assert first['powerups_taken'] == second['powerups_taken']
+
+
+def test_batch_streams_all_results():
+    jobs = make_jobs(4, seed=0, max_steps=200)
+    results = list(run_batch(jobs, max_workers=2))
+    assert sorted(result['index'] for result in results) == [0, 1, 2, 3]
+    assert all(result['steps'] == 200 for result in results)
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+import pygame
+
+from breakout_game.core import GameCore
+from breakout_game.core.block_field import BlockField
+from breakout_game.sprites.static_layer import StaticLayer
+
+
+@pytest.fixture
+def core():
+    game_core = GameCore()
+    game_core.init_level()
+    return game_core
+
+
+@pytest.fixture
+def field(core):
+    block_field = BlockField(cell_size=(10, 10), block_size=(8, 8), topleft=(1, 1))
+    block_field.load(['12 ', ' 3 '], level_number=1)
+    core.block_field = block_field
+    return block_field
+
+
+def test_load(field):
+    assert field.health.tolist() == [[2, 3, 0], [0, 4, 0]]
+    assert len(field) == 3
+    assert field.get_rect(1, 1) == pygame.Rect(11, 11, 8, 8)
+    assert field.get_rects([1], [1]).tolist() == [[11, 11, 8, 8]]
+    assert (field.first_row, field.last_row) == (0, 1)
+    assert field.changes == [None]
+
+
+def test_query(field):
+    assert field.query(pygame.Rect(15, 15, 1, 1)) == [(1, 1)]
+    assert field.query(pygame.Rect(0, 0, 30, 20)) == [(0, 0), (0, 1), (1, 1)]
+    assert field.query(pygame.Rect(21, 0, 10, 20)) == []
+    assert field.query(pygame.Rect(-50, -50, 10, 10)) == []
+    assert field.query(pygame.Rect(5, -50, 10, 10)) == []
+
+
+def test_holds_blocks_between(field):
+    assert field.holds_blocks_between(5, 6)
+    assert not field.holds_blocks_between(25, 40)
+    field.clear()
+    assert not field.holds_blocks_between(5, 6)
+
+
+def test_query_areas(field):
+    areas, rows, columns = field.query_areas(np.array([[15, 15], [0, 0]]), np.array([[16, 16], [12, 5]]))
+    assert sorted(zip(areas.tolist(), rows.tolist(), columns.tolist())) == [(0, 1, 1), (1, 0, 0), (1, 0, 1)]
+
+
+def test_damage_is_batched(core, field):
+    core.damage_blocks([0, 0, 0, 1], [0, 0, 1, 1], [1, 5, 1, 1])
+    assert field.health.tolist() == [[0, 2, 0], [0, 3, 0]]
+    assert field.health_rows == field.health.tolist()
+    # The block on (0, 0) takes no more damage than its health, the last point breaks it
+    assert core.score == 3 * 10 + 30
+    assert core.sounds == ['break-blocks']
+    core.damage_blocks([0], [0], [1])
+    assert core.score == 3 * 10 + 30
+
+
+def test_last_block_of_a_row_updates_the_rows(field):
+    field.damage([1], [1], [4])
+    assert (field.first_row, field.last_row) == (0, 0)
+    assert (1, 1) in field.changes
+
+
+def test_blocks_share_images():
+    size = (8, 8)
+    assert StaticLayer.get_block_image(4, size) is StaticLayer.get_block_image(4, size)
+    assert StaticLayer.get_block_image(100, size) is StaticLayer.get_block_image(max(range(1, 8)), size)
+
+
+def test_draw_only_blocks_in_area(field):
+    static_layer = StaticLayer()
+    static_layer.surface = pygame.Surface((30, 20))
+    static_layer.draw_blocks(field, pygame.Rect(0, 0, 10, 10))
+    assert static_layer.surface.get_at((5, 5)) != static_layer.surface.get_at((15, 5))
@@ -0,0 +1,54 @@
+import pygame
+import pytest
+
+from breakout_game.utils import collision
+
+
+def test_sweep_box_finds_time_of_impact():
+    hit = collision.sweep_box((0, 0, 10, 10), (100, 0), pygame.Rect(50, 0, 5, 10))
+    assert hit[0] == pytest.approx(0.4)
+    assert hit[1] == (-1, 0)
+
+
+def test_thin_rect_is_not_tunnelled():
+    # The box moves past the whole rectangle in one step
+    hit = collision.sweep_box((0, 100, 10, 10), (0, -100), pygame.Rect(0, 40, 40, 2))
+    assert hit[0] == pytest.approx(0.58)
+    assert hit[1] == (0, 1)
+
+
+def test_missed_touching_and_overlapping_rects_are_not_hit():
+    assert collision.sweep_box((0, 0, 10, 10), (100, 0), pygame.Rect(50, 20, 5, 10)) is None
+    assert collision.sweep_box((0, 0, 10, 10), (10, 0), pygame.Rect(50, 0, 5, 10)) is None
+    assert collision.sweep_box((0, 0, 10, 10), (0, 10), pygame.Rect(10, 0, 5, 10)) is None
+    assert collision.sweep_box((0, 0, 10, 10), (-10, 0), pygame.Rect(10, 0, 5, 10)) is None
+    assert collision.sweep_box((0, 0, 10, 10), (10, 0), pygame.Rect(5, 5, 10, 10)) is None
+
+
+def test_corner_hit_has_both_normals():
+    hit = collision.sweep_box((0, 0, 10, 10), (20, 20), pygame.Rect(20, 20, 10, 10))
+    assert hit == (pytest.approx(0.5), (-1, -1))
+
+
+def test_seam_between_rects_is_a_face():
+    # The box lands on the seam between two blocks of a row
+    rects = [pygame.Rect(0, 20, 10, 10), pygame.Rect(10, 20, 10, 10)]
+    hit = collision.find_first_hit((0, 0, 10, 10), (10, 20), rects)
+    assert hit == (pytest.approx(0.5), (0, -1), [0, 1])
+
+
+def test_first_hit_is_nearest():
+    rects = [pygame.Rect(80, 0, 10, 10), pygame.Rect(30, 0, 10, 10)]
+    assert collision.find_first_hit((0, 0, 10, 10), (100, 0), rects)[2] == [1]
+    assert collision.find_first_hit((0, 0, 10, 10), (-100, 0), rects) is None
+
+
+def test_reflect_reverses_only_components_into_the_face():
+    assert collision.reflect((1, -1), (0, 1)) == (1, 1)
+    assert collision.reflect((1, 1), (0, 1)) == (1, 1)
+    assert collision.reflect((0.6, 0.8), (-1, -1)) == (-0.6, -0.8)
+
+
+def test_overlaps_ignores_touching_edges():
+    assert collision.overlaps((0, 0, 10, 10), pygame.Rect(5, 5, 10, 10))
+    assert not collision.overlaps((0, 0, 10, 10), pygame.Rect(10, 0, 10, 10))
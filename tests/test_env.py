@@ -0,0 +1,83 @@
+import numpy as np
+
+from breakout_game.config import settings
+from breakout_game.env import (
+    BreakoutEnv, VectorEnv, OBSERVATION_SIZE, ACTION_LEFT, ACTION_RIGHT, ACTION_LAUNCH
+)
+
+
+def test_reset():
+    env = BreakoutEnv()
+    observation, info = env.reset(seed=0)
+    assert observation.shape == (OBSERVATION_SIZE,)
+    assert observation.dtype == np.float32
+    assert observation[6] == 0
+    assert observation[7] == 1
+    assert observation[8:].sum() == info['blocks']
+
+
+def test_step():
+    env = BreakoutEnv(frame_skip=4, max_steps=2)
+    observation, _ = env.reset(seed=0)
+    paddle_center = observation[0]
+    observation, reward, terminated, truncated, info = env.step(ACTION_LEFT)
+    assert observation[0] < paddle_center
+    assert reward == 0
+    assert not terminated and not truncated
+    observation, _, _, truncated, info = env.step(ACTION_LAUNCH)
+    assert observation[6] == 1
+    assert truncated
+    assert info['steps'] == 2
+
+
+def test_swarm_balls_are_observed():
+    env = BreakoutEnv()
+    env.reset(seed=0)
+    env.step(ACTION_LAUNCH)
+    env.core.powerup_manager.activate_multiple_balls()
+    swarm = env.core.ball_swarm
+    assert len(swarm) > 0
+    # The single ball is lost, only the balls of the swarm are left
+    env.core.balls.clear()
+    observation = env.observe()
+    index = swarm.get_lowest_index()
+    _, height = swarm.get_size()
+    center_x, bottom = swarm.get_lowest()
+    assert observation[2] == np.float32(center_x / settings.GAME_WINDOW_WIDTH)
+    assert observation[3] == np.float32((bottom - height / 2) / settings.GAME_WINDOW_HEIGHT)
+    assert observation[4:6].tolist() == swarm.directions[index].astype(np.float32).tolist()
+    assert observation[6] == 1
+
+
+def test_lost_game_terminates():
+    env = BreakoutEnv(frame_skip=120)
+    env.reset(seed=0)
+    terminated = False
+    # The paddle runs from the ball to the farther side of the game window
+    for _ in range(200):
+        ball = env.core.balls[0]
+        if not ball.active:
+            action = ACTION_LAUNCH
+        else:
+            action = ACTION_LEFT if ball.x > settings.GAME_WINDOW_WIDTH / 2 else ACTION_RIGHT
+        _, _, terminated, _, _ = env.step(action)
+        if terminated:
+            break
+    assert terminated
+    assert env.core.health == 0
+
+
+def test_vector_env():
+    envs = VectorEnv(3, max_steps=5)
+    observations, infos = envs.reset(seed=0)
+    assert observations.shape == (3, OBSERVATION_SIZE)
+    assert len(infos) == 3
+    for _ in range(4):
+        observations, rewards, terminated, truncated, infos = envs.step([ACTION_LAUNCH] * 3)
+    assert rewards.shape == (3,) and rewards.dtype == np.float32
+    assert not truncated.any()
+    observations, rewards, terminated, truncated, infos = envs.step(np.array([ACTION_LAUNCH] * 3))
+    # Episodes cut short are reset at once, the last observation is kept in the info
+    assert truncated.all()
+    assert all(info['final_observation'][6] == 1 for info in infos)
+    assert (observations[:, 6] == 0).all()
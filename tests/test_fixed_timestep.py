@@ -0,0 +1,22 @@
+import pytest
+
+from breakout_game.utils.fixed_timestep import FixedTimestep
+
+
+def test_frame_is_split_into_whole_steps():
+    timestep = FixedTimestep(tick_rate=240)
+    assert [timestep.advance(1 / 60) for _ in range(60)] == [4] * 60
+    assert timestep.alpha == pytest.approx(0, abs=1e-6)
+
+
+def test_left_over_time_is_carried():
+    timestep = FixedTimestep(tick_rate=30)
+    assert timestep.advance(1 / 60) == 0
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(1 / 60) == 1
+    assert timestep.alpha == pytest.approx(0, abs=1e-6)
+
+
+def test_hitch_is_limited():
+    timestep = FixedTimestep(tick_rate=100, max_frame_time=0.25)
+    assert timestep.advance(5) == 25
@@ -0,0 +1,117 @@
+import time
+
+import pygame
+import pytest
+
+from breakout_game.utils.frame_scheduler import FrameScheduler
+
+
+class FakeClock:
+    """
+    A clock moving on by a small step every time it is read, so spinning ends, and by the time slept.
+    """
+    def __init__(self, step: float = 0.0001):
+        self.now = 0.0
+        self.step = step
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_scheduler(clock, **kwargs):
+    return FrameScheduler(fps=100, spin_time=0.002, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+@pytest.mark.parametrize('strategy', ['busy', 'sleep-spin'])
+def test_frames_are_paced(clock, strategy):
+    scheduler = make_scheduler(clock, strategy=strategy)
+    scheduler.tick()
+    for _ in range(10):
+        assert scheduler.tick() == pytest.approx(0.01, abs=0.0005)
+    statistics = scheduler.get_statistics()
+    assert statistics['frames'] == 10
+    assert statistics['mean-frame-time'] == pytest.approx(10, abs=0.5)
+
+
+def test_busy_strategy_does_not_sleep(clock):
+    scheduler = make_scheduler(clock, strategy='busy')
+    scheduler.tick()
+    scheduler.tick()
+    assert not clock.sleeps
+
+
+def test_sleep_spin_sleeps_until_the_spin(clock):
+    scheduler = make_scheduler(clock, strategy='sleep-spin')
+    scheduler.tick()
+    for _ in range(3):
+        scheduler.tick()
+    assert len(clock.sleeps) == 3
+    for sleep_time in clock.sleeps:
+        assert sleep_time == pytest.approx(0.01 - 0.002, abs=0.0005)
+
+
+def test_schedule_restarts_after_falling_behind(clock):
+    scheduler = make_scheduler(clock, strategy='sleep-spin')
+    scheduler.tick()
+    clock.now += 0.05
+    assert scheduler.tick() == pytest.approx(0.05, abs=0.0005)
+    assert scheduler.tick() == pytest.approx(0.01, abs=0.0005)
+
+
+def test_event_wait_returns_on_event(clock, mocker):
+    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN)
+    wait = mocker.patch.object(pygame.event, 'wait', return_value=event)
+    scheduler = make_scheduler(clock, idle_strategy='event-wait', idle_timeout=1)
+    scheduler.tick(idle=True)
+    pygame.event.clear()
+    scheduler.tick(idle=True)
+    assert wait.call_args.args[0] == pytest.approx(1000, abs=1)
+    assert pygame.event.get(pygame.KEYDOWN)
+
+
+def test_event_wait_times_out(clock, mocker):
+    def wait(timeout):
+        clock.now += timeout / 1000
+        return pygame.event.Event(pygame.NOEVENT)
+
+    mocker.patch.object(pygame.event, 'wait', side_effect=wait)
+    scheduler = make_scheduler(clock, idle_strategy='event-wait', idle_timeout=0.05)
+    scheduler.tick(idle=True)
+    assert scheduler.tick(idle=True) == pytest.approx(0.05, abs=0.002)
+
+
+def test_game_resumes_after_idle_with_one_frame(clock, mocker):
+    mocker.patch.object(pygame.event, 'wait', return_value=pygame.event.Event(pygame.NOEVENT))
+    scheduler = make_scheduler(clock, idle_strategy='event-wait', idle_timeout=0.05)
+    scheduler.tick(idle=True)
+    scheduler.tick(idle=True)
+    assert scheduler.tick() == scheduler.frame_time
+    assert scheduler.get_statistics()['frames'] == 0
+
+
+def test_default_clock():
+    scheduler = FrameScheduler()
+    assert scheduler.clock is time.perf_counter
+    assert scheduler.sleep is time.sleep
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        FrameScheduler(strategy='nap')
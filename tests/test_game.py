@@ -1,20 +1,38 @@
+import logging
+import random
+
 import pygame
 import pytest
 
-from unittest.mock import Mock
+from breakout_game.utils import path_utils
 from breakout_game.main import Game
+from breakout_game.core import GameCore, INPUT_LAUNCH, INPUT_LEFT
+from breakout_game.config import settings
+from breakout_game.headless import follow_ball_policy
+from breakout_game.replay import InputRecorder, InputRecording, KIND_HASH
+
+
+pytestmark = pytest.mark.usefixtures('disable_sound')
 
 
 @pytest.fixture(autouse=True)
-def disable_sound(mocker):
-    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+def menu_music(mocker):
+    # The menu music is not shipped with the repository. The mixer is mocked, so any path will do.
+    get_asset_path = path_utils.get_asset_path
+    mocker.patch.object(
+        path_utils,
+        'get_asset_path',
+        side_effect=lambda path: path_utils.base_path / 'assets' / path if path == 'sounds/menu.mp3'
+        else get_asset_path(path)
+    )
 
 
 def test_restart_game():
     game = Game()
     game.restart_game()
     assert game.game_active is False
-    assert game.start_pause_time == 0
+    assert game.level == 0
+    assert game.sprite_manager.core.time == 0
 
 
 def test_set_level_background():
@@ -27,3 +45,95 @@ def test_get_last_blit_main_menu():
     game = Game()
     result = game.get_last_blit_main_menu()
     assert isinstance(result, list)
+
+
+def test_main_menu_frame_is_reused():
+    game = Game()
+    frame = game.get_last_blit_main_menu()
+    assert game.get_last_blit_main_menu() == frame
+    assert len(game.main_menu.objects_to_blit) == len(game.main_menu.options) + 1
+
+
+def test_main_menu_frame_is_drawn_once(mocker):
+    game = Game()
+    blit = mocker.patch.object(game, 'display_surface', wraps=game.display_surface)
+    game.draw_graphics(game.get_last_blit_main_menu())
+    assert blit.blit.call_count == 1
+    blit.blit.assert_called_with(game.main_menu.frame, (0, 0))
+
+
+def test_level_menu_is_drawn_over_the_background(mocker):
+    game = Game()
+    game.main_menu.active = False
+    game.level_menu.active = True
+    blit = mocker.patch.object(game, 'display_surface', wraps=game.display_surface)
+    game.draw_graphics(game.get_last_level_menu())
+    assert blit.blit.call_args_list[0].kwargs == {'source': game.background, 'dest': (0, 0)}
+    assert blit.blit.call_count == 2
+
+
+def test_seed_is_kept_on_restart():
+    game = Game(seed=5)
+    first = game.sprite_manager.core.rng.random()
+    game.restart_game()
+    assert game.sprite_manager.core.rng.random() == first
+
+
+def test_replay_inputs_come_before_keys():
+    recorder = InputRecorder(seed=3)
+    for inputs in (INPUT_LAUNCH, INPUT_LEFT):
+        recorder.record(inputs, GameCore())
+    game = Game(replay=InputRecording.from_bytes(recorder.to_bytes()))
+    assert game.input_recorder.seed == 3
+    assert [game.get_step_inputs() for _ in range(2)] == [INPUT_LAUNCH, INPUT_LEFT]
+    assert game.get_step_inputs() == 0
+    assert game.replay_inputs is None
+
+
+def test_unseeded_restart_changes_the_seed(mocker):
+    mocker.patch.object(random, 'randrange', side_effect=[1, 2])
+    game = Game()
+    assert game.input_recorder.seed == 1
+    game.restart_game()
+    assert game.input_recorder.seed == 2
+    assert game.sprite_manager.core.rng.random() == random.Random(2).random()
+
+
+def play_steps(game: Game, steps: int, inputs=None):
+    for _ in range(steps):
+        step_inputs = game.get_step_inputs() if inputs is None else inputs(game.sprite_manager.core)
+        game.sprite_manager.step(1 / settings.TICK_RATE, step_inputs)
+        game.input_recorder.record(step_inputs, game.sprite_manager.core)
+        game.check_replay_hash()
+
+
+def record_game() -> InputRecording:
+    game = Game(seed=3)
+    game.level, game.level_difficulty = 2, 1
+    game.init_game_stage()
+    play_steps(game, settings.REPLAY_HASH_INTERVAL * 2, follow_ball_policy)
+    return InputRecording.from_bytes(game.input_recorder.to_bytes())
+
+
+def test_replay_takes_the_recorded_level(caplog):
+    recording = record_game()
+    game = Game(replay=recording)
+    game.level_difficulty = 0
+    game.init_game_stage()
+    assert (game.level, game.level_difficulty) == (2, 1)
+    with caplog.at_level(logging.WARNING):
+        play_steps(game, recording.steps)
+    assert 'diverged' not in caplog.text
+    assert game.replay_hashes
+
+
+def test_replay_divergence_is_logged(caplog):
+    recording = record_game()
+    recording.records = [
+        (KIND_HASH, record[1] ^ 1) if record[0] == KIND_HASH else record for record in recording.records
+    ]
+    game = Game(replay=recording)
+    game.init_game_stage()
+    with caplog.at_level(logging.WARNING):
+        play_steps(game, recording.steps)
+    assert caplog.text.count('diverged') == 1
@@ -0,0 +1,193 @@
+import math
+import pickle
+import random
+import time
+
+import pytest
+
+from breakout_game.config import settings
+from breakout_game.core import GameCore, INPUT_LEFT, INPUT_RIGHT, INPUT_LAUNCH
+from breakout_game.core.block_field import BlockField
+from breakout_game.core.entities import PowerUpState
+from breakout_game.headless import follow_ball_policy
+
+
+@pytest.fixture
+def core():
+    game_core = GameCore()
+    game_core.init_level()
+    return game_core
+
+
+def test_init_level(core):
+    assert len(core.balls) == 1
+    assert not core.balls[0].active
+    assert core.paddle.rect.midbottom == (settings.GAME_WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT - 20)
+    assert not core.level_finished
+
+
+def test_set_block(core):
+    core.block_field.clear()
+    core.block_field.set_block(0, 0, 3)
+    core.block_field.set_block(1, 2, 1)
+    assert len(core.block_field) == 2
+    assert core.block_field.health[0, 0] == 3
+
+
+def test_inputs_move_the_paddle_and_launch_the_ball(core):
+    x = core.paddle.x
+    core.step(0.1, INPUT_LEFT)
+    assert core.paddle.x < x
+    assert core.balls[0].rect.centerx == core.paddle.rect.centerx
+    x = core.paddle.x
+    core.step(0.1, INPUT_RIGHT | INPUT_LAUNCH)
+    assert core.paddle.x > x
+    assert core.balls[0].active
+    assert core.time == pytest.approx(0.2)
+
+
+def test_lost_ball_costs_health(core):
+    ball = core.balls[0]
+    ball.active = True
+    ball.direction_x, ball.direction_y = 0, 1
+    ball.x, ball.y = 10, settings.GAME_WINDOW_HEIGHT - 5
+    core.step(0.5)
+    assert core.health == settings.MAX_PLAYER_HEALTH - 1
+    assert core.lives_lost == 1
+    assert core.sounds == ['lost-hp']
+    assert not ball.active
+
+
+def test_caught_powerup_is_activated(core):
+    core.powerups.append(PowerUpState('big-ball', core.paddle.rect.center))
+    core.step(1 / settings.TICK_RATE)
+    assert core.powerups == []
+    assert core.score == 100
+    assert 'get-powerup' in core.sounds
+    assert 'big-ball' in core.powerup_manager.active_powerups
+    assert core.powerups_taken == {'big-ball': 1}
+
+
+def test_fast_ball_does_not_pass_through_blocks(core):
+    core.block_field.clear()
+    core.block_field.set_block(4, 1, 1)
+    block_rect = core.block_field.get_rect(4, 1)
+    ball = core.create_ball(
+        midbottom=(block_rect.centerx, block_rect.bottom + 200), angle_radians=-math.pi / 2, speed=400
+    )
+    ball.active = True
+    ball.update(core, 1, False)
+    assert core.block_field.health[4, 1] == 0
+    assert ball.direction_y > 0
+    assert ball.rect.top >= block_rect.bottom
+
+
+def test_pinched_ball_slides_along_the_gap(core):
+    ball = core.create_ball(midbottom=(300, 500), angle_radians=-math.pi / 4, speed=100)
+    # Rows of blocks as wide as the game window above and below the ball, the gap as high as the ball
+    core.block_field = BlockField(
+        cell_size=(settings.GAME_WINDOW_WIDTH, ball.height),
+        block_size=(settings.GAME_WINDOW_WIDTH, ball.height),
+        topleft=(0, ball.rect.top - ball.height)
+    )
+    core.block_field.load(['6', ' ', '6'], level_number=1)
+    ball.active = True
+    start_x = ball.rect.x
+    ball.update(core, 1 / 60, False)
+    assert ball.rect.x > start_x
+    assert ball.rect.bottom == core.block_field.get_rect(2, 0).top
+
+
+def test_strong_ball_damages_block_once_per_hit(core):
+    core.block_field.clear()
+    core.block_field.set_block(4, 1, 5)
+    block_rect = core.block_field.get_rect(4, 1)
+    ball = core.create_ball(
+        midbottom=(block_rect.centerx, block_rect.bottom + 20), angle_radians=-math.pi / 2, speed=400, strength=3
+    )
+    ball.active = True
+    ball.update(core, 0.1, False)
+    assert core.block_field.health[4, 1] == 2
+    assert core.score == 30
+
+
+def test_core_steps_fast(core):
+    # The core is stepped without a display, far faster than the game is drawn
+    core.balls[0].active = True
+    steps = 20000
+    start = time.perf_counter()
+    for step in range(steps):
+        core.step(1 / settings.TICK_RATE, INPUT_LEFT if step // 200 % 2 else INPUT_RIGHT)
+    assert steps / (time.perf_counter() - start) > 10000
+
+
+def play_recorded_game(seed: int, inputs: list[int]) -> tuple[list, list]:
+    game_core = GameCore(rng=random.Random(seed))
+    game_core.init_level()
+    kills, drops = [], []
+    for step_inputs in inputs:
+        game_core.step(1 / settings.TICK_RATE, step_inputs)
+        kills.append(list(game_core.block_field.changes))
+        drops.append([(powerup.power, powerup.x, powerup.y) for powerup in game_core.powerups])
+    return kills, drops
+
+
+def test_same_seed_and_inputs_play_the_same_game():
+    recorder = GameCore(rng=random.Random(3))
+    recorder.init_level()
+    inputs = []
+    for _ in range(6000):
+        inputs.append(follow_ball_policy(recorder))
+        recorder.step(1 / settings.TICK_RATE, inputs[-1])
+    kills, drops = play_recorded_game(3, inputs)
+    assert any(drops)
+    assert (kills, drops) == play_recorded_game(3, inputs)
+    assert drops != play_recorded_game(4, inputs)[1]
+
+
+def test_state_hash_without_level():
+    state_hash = GameCore().get_state_hash()
+    assert state_hash == GameCore().get_state_hash()
+    core = GameCore()
+    core.init_level()
+    assert core.get_state_hash() != state_hash
+
+
+def test_snapshot_restores_the_same_game(core):
+    core.balls[0].active = True
+    core.powerup_manager.activate_multiple_balls()
+    core.powerup_manager.activate_fast_ball()
+    inputs = [INPUT_LEFT] * 300 + [INPUT_RIGHT] * 300
+    snapshot = pickle.loads(pickle.dumps(core.get_snapshot()))
+    for step_inputs in inputs:
+        core.step(1 / settings.TICK_RATE, step_inputs)
+    state_hash, score = core.get_state_hash(), core.score
+    for _ in range(2):
+        core.restore_snapshot(snapshot)
+        for step_inputs in inputs:
+            core.step(1 / settings.TICK_RATE, step_inputs)
+        assert (core.get_state_hash(), core.score) == (state_hash, score)
+
+
+def test_snapshot_before_the_level_starts(core):
+    snapshot = GameCore().get_snapshot()
+    core.restore_snapshot(snapshot)
+    assert core.paddle is None
+    assert core.balls == []
+    assert len(core.block_field) == 0
+    assert core.get_state_hash() == GameCore().get_state_hash()
+
+    empty_core = GameCore()
+    empty_core.restore_snapshot(snapshot)
+    assert empty_core.get_state_hash() == GameCore().get_state_hash()
+
+
+def test_snapshot_is_a_copy(core):
+    snapshot = core.get_snapshot()
+    row, column = core.block_field.query(core.block_field.get_rect(0, 0).inflate(10000, 10000))[0]
+    core.block_field.damage([row], [column], [100])
+    core.paddle.x = 0
+    core.restore_snapshot(snapshot)
+    assert core.block_field.health[row, column] == snapshot['block_field'][row, column] > 0
+    assert core.paddle.x == snapshot['paddle']['x'] > 0
+    assert core.block_field.changes[-1] == (row, column)
@@ -0,0 +1,30 @@
+import pytest
+
+from breakout_game.config import settings
+from breakout_game.headless import HeadlessGame
+
+
+def test_game_is_stepped_without_display():
+    game = HeadlessGame()
+    result = game.run(max_steps=settings.TICK_RATE * 10)
+    assert result['steps'] == settings.TICK_RATE * 10
+    assert result['time'] == pytest.approx(10)
+    assert game.core.balls[0].active
+
+
+def test_powerup_timer_counts_simulated_time(monkeypatch):
+    game = HeadlessGame()
+    # Powerups caught while the game runs would restart the timer
+    monkeypatch.setattr(game.core, 'drop_powerup', lambda center: None)
+    powerup_manager = game.core.powerup_manager
+    powerup_manager.activate_powerup('big-ball')
+    game.run(max_steps=settings.BALL_SIZE_DURATION * settings.TICK_RATE - 1)
+    assert powerup_manager.ball_size_timer.active
+    game.run(max_steps=settings.BALL_SIZE_DURATION * settings.TICK_RATE + 1)
+    assert not powerup_manager.ball_size_timer.active
+    assert 'big-ball' not in powerup_manager.active_powerups
+
+
+def test_same_seed_same_game():
+    first, second = HeadlessGame(seed=1), HeadlessGame(seed=1)
+    assert first.run(max_steps=5000) == second.run(max_steps=5000)
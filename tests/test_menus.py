@@ -0,0 +1,42 @@
+import pygame
+import pytest
+
+from breakout_game.screens import MainMenu, EndGameMenu
+
+
+class Keys:
+    def __init__(self, *pressed):
+        self.pressed = pressed
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    pygame.init()
+
+
+def test_main_menu_composes_frame_on_selection_change():
+    menu = MainMenu()
+    objects_to_blit = menu.objects_to_blit
+    menu.last_pressed = 0
+    menu.update(Keys())
+    assert menu.objects_to_blit is objects_to_blit
+
+    menu.last_pressed = 0
+    menu.update(Keys(pygame.K_DOWN))
+    assert menu.selected_option == 2
+    assert menu.composed_option == 2
+    assert len(menu.objects_to_blit) == len(menu.options) + 1
+    assert menu.objects_to_blit[3][0] is menu.option_surfaces[2][1]
+
+
+def test_end_game_menu_renders_text_on_score_change():
+    menu = EndGameMenu()
+    menu.update(Keys(), 10)
+    text_surface = menu.text_surface
+    menu.update(Keys(), 10)
+    assert menu.text_surface is text_surface
+    menu.update(Keys(), 20)
+    assert menu.text_surface is not text_surface
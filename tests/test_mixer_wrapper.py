@@ -0,0 +1,74 @@
+import pygame
+import pytest
+
+from unittest.mock import Mock
+from breakout_game.utils.mixer_wrapper import SoundBank
+
+
+@pytest.fixture(autouse=True)
+def mixer(mocker):
+    mixer_mock = Mock()
+    mixer_mock.Channel.side_effect = lambda index: Mock(**{'get_busy.return_value': False})
+    mocker.patch.object(pygame, "mixer", new=mixer_mock)
+    return mixer_mock
+
+
+@pytest.fixture
+def bank():
+    return SoundBank(channel_count=4, voice_limit=2)
+
+
+def test_sound_is_loaded_once(bank, mixer):
+    first = bank.get_sound('hit-blocks')
+    second = bank.get_sound('hit-blocks')
+    assert first is second
+    assert mixer.Sound.call_count == 1
+
+
+def test_channels_are_reserved(bank, mixer):
+    bank.play('hit-blocks')
+    mixer.set_reserved.assert_called_once_with(4)
+    assert len(bank.channels) == 4
+
+
+def test_voice_limit(bank):
+    bank.play('hit-blocks')
+    for channel in bank.channels:
+        channel.get_busy.return_value = True
+    bank.play('hit-blocks')
+    bank.channels[1].get_busy.return_value = False
+    assert bank.play('hit-blocks') is not None
+    bank.channels[1].get_busy.return_value = True
+    bank.channels[2].get_busy.return_value = False
+    assert bank.play('hit-blocks') is None
+
+
+def test_oldest_channel_is_reused(bank):
+    for name in ['hit-blocks', 'break-blocks', 'hit-paddle', 'get-powerup']:
+        bank.play(name).get_busy.return_value = True
+    assert bank.play('lost-hp') is bank.channels[0]
+
+
+def test_same_sound_is_not_cut_off(bank):
+    bank.play('hit-blocks').get_busy.return_value = True
+    for name in ['break-blocks', 'hit-paddle', 'get-powerup']:
+        bank.play(name).get_busy.return_value = True
+    assert bank.play('hit-blocks') is bank.channels[1]
+    assert bank.channel_sounds[0] == 'hit-blocks'
+
+
+def test_full_pool_of_the_same_sound(mixer):
+    bank = SoundBank(channel_count=2, voice_limit=4)
+    first = bank.play('hit-blocks')
+    first.get_busy.return_value = True
+    second = bank.play('hit-blocks')
+    second.get_busy.return_value = True
+    assert second is not first
+    assert bank.play('hit-blocks') is None
+    first.play.assert_called_once()
+    second.play.assert_called_once()
+
+
+def test_no_mixer(bank, mixer):
+    mixer.get_init.return_value = None
+    assert bank.play('lost-hp') is None
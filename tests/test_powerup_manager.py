@@ -1,25 +1,31 @@
 import pytest
 import pygame
 
-from unittest.mock import Mock
-from breakout_game.sprites.powerup_manager import PowerUpManager
+from breakout_game.config import settings
+from breakout_game.core import GameCore
+from breakout_game.core.powerup_manager import PowerUpManager
 from breakout_game.sprites import SpriteManager
 
 
-@pytest.fixture(autouse=True)
-def disable_sound(mocker):
-    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+pytestmark = pytest.mark.usefixtures('disable_sound')
 
 
 @pytest.fixture
 def manager():
-    pygame.init()
-    sprite_manager = SpriteManager()
-    sprite_manager.init_level()
-    powerup_manager = PowerUpManager(sprite_manager)
+    core = GameCore()
+    core.init_level()
+    powerup_manager = PowerUpManager(core)
     return powerup_manager
 
 
+@pytest.fixture
+def sprite_manager():
+    pygame.init()
+    manager = SpriteManager()
+    manager.init_level()
+    return manager
+
+
 def test_init(manager):
     assert isinstance(manager, PowerUpManager)
 
@@ -51,3 +57,55 @@ def test_activate_fast_ball(manager, start_timer):
 def test_activate_slow_ball(manager, start_timer):
     manager.activate_fast_ball(start_timer)
     assert manager.ball_speed_timer.active is start_timer
+
+
+def test_ball_variants_are_shared(sprite_manager):
+    # Balls are multiplied when the swarm is not available
+    core = sprite_manager.core
+    core.ball_swarm.enabled = False
+    core.powerup_manager.activate_multiple_balls()
+    core.powerup_manager.activate_big_ball()
+    core.powerup_manager.activate_super_ball()
+    sprite_manager.sync()
+    balls = sprite_manager.ball_sprites_group.sprites()
+    assert len(balls) == 3
+    assert all(ball.image is balls[0].image for ball in balls)
+    assert balls[0].rect.width == round(balls[0].ball.original_width * 1.5)
+
+    core.powerup_manager.deactivate_ball_size()
+    core.powerup_manager.deactivate_ball_strength()
+    sprite_manager.sync()
+    assert all(ball.image is balls[0].image for ball in balls)
+    assert balls[0].rect.width == balls[0].ball.original_width
+
+
+def test_new_balls_inherit_look(manager):
+    manager.core.ball_swarm.enabled = False
+    manager.activate_small_ball()
+    manager.activate_super_ball()
+    manager.activate_multiple_balls()
+    balls = manager.core.balls
+    assert len(balls) == 3
+    assert all(ball.tint == (125, 0, 0) and ball.size_factor == 0.5 for ball in balls)
+    assert all(ball.width == balls[0].width for ball in balls)
+
+
+def test_timers_count_game_time(manager):
+    manager.activate_fast_ball()
+    manager.core.time += settings.BALL_SPEED_DURATION - 0.1
+    manager.update()
+    assert manager.ball_speed_timer.active
+    manager.core.time += 0.2
+    manager.update()
+    assert not manager.ball_speed_timer.active
+    assert manager.ball_speed_timer.power is None
+
+
+def test_snapshot_restores_timers(manager):
+    snapshot = manager.get_snapshot()
+    timer = manager.ball_speed_timer
+    manager.activate_fast_ball()
+    manager.restore_snapshot(snapshot)
+    assert manager.ball_speed_timer is timer
+    assert not timer.active
+    assert manager.active_powerups == []
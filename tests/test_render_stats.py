@@ -0,0 +1,22 @@
+import pygame
+
+from breakout_game.utils.render_stats import RenderStats
+
+
+def test_full_frame():
+    stats = RenderStats(screen_size=(100, 100))
+    stats.record()
+    assert stats.last_redrawn_percentage == 100
+
+
+def test_dirty_rects_are_clipped_to_screen():
+    stats = RenderStats(screen_size=(100, 100))
+    stats.record([pygame.Rect(0, 0, 10, 10), pygame.Rect(95, 95, 10, 10)])
+    assert stats.last_redrawn_percentage == (100 + 25) / 100
+
+
+def test_average():
+    stats = RenderStats(screen_size=(100, 100))
+    stats.record()
+    stats.record([])
+    assert stats.average_redrawn_percentage == 50
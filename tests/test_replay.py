@@ -0,0 +1,94 @@
+import random
+
+from breakout_game.config import settings
+from breakout_game.core import GameCore
+from breakout_game.headless import follow_ball_policy
+from breakout_game.replay import (
+    InputRecorder, InputRecording, KIND_HASH, KIND_LEVEL, KIND_RUN, read_varint, replay, write_varint
+)
+
+
+def record_game(seed: int, steps: int) -> tuple[InputRecorder, GameCore]:
+    core = GameCore(rng=random.Random(seed))
+    recorder = InputRecorder(seed)
+    level = 0
+    core.init_level(level)
+    recorder.start_level(level, 0)
+    for _ in range(steps):
+        if core.level_finished:
+            core.clear_level()
+            level += 1
+            core.init_level(level)
+            recorder.start_level(level, 0)
+        inputs = follow_ball_policy(core)
+        core.step(1 / settings.TICK_RATE, inputs)
+        recorder.record(inputs, core)
+    return recorder, core
+
+
+def test_varint():
+    data = bytearray()
+    for value in (0, 127, 128, 300, 2 ** 40):
+        write_varint(data, value)
+    offset, values = 0, []
+    while offset < len(data):
+        value, offset = read_varint(data, offset)
+        values.append(value)
+    assert values == [0, 127, 128, 300, 2 ** 40]
+
+
+def test_runs_are_compact(tmp_path):
+    recorder = InputRecorder(seed=9, path=tmp_path / 'game.replay')
+    core = GameCore()
+    core.init_level()
+    for inputs in [1] * 100 + [2] * 5 + [1]:
+        recorder.record(inputs, core)
+    recorder.save()
+    recording = InputRecording.load(tmp_path / 'game.replay')
+    assert recording.seed == 9
+    assert recording.records[:3] == [(KIND_RUN, 1, 100), (KIND_RUN, 2, 5), (KIND_RUN, 1, 1)]
+    assert recording.steps == 106
+    assert list(recording.iter_inputs()) == [1] * 100 + [2] * 5 + [1]
+    assert len(recorder.to_bytes()) < 30
+
+
+def test_hash_before_the_level_starts():
+    recorder = InputRecorder(seed=0)
+    core = GameCore()
+    for _ in range(settings.REPLAY_HASH_INTERVAL):
+        recorder.record(0, core)
+    assert (KIND_HASH, core.get_state_hash()) in InputRecording.from_bytes(recorder.to_bytes()).records
+
+
+def test_replay_matches_recording():
+    recorder, core = record_game(seed=5, steps=8000)
+    recording = InputRecording.from_bytes(recorder.to_bytes())
+    assert any(record[0] == KIND_HASH for record in recording.records)
+    assert recording.records[0] == (KIND_LEVEL, 0, 0)
+    result = replay(recording)
+    assert result['diverged_at'] is None
+    assert result['steps'] == 8000
+    assert result['hashes_checked'] == 8000 // settings.REPLAY_HASH_INTERVAL
+    assert (result['score'], result['health'], result['level']) == (core.score, core.health, core.level)
+
+
+def test_replay_detects_divergence():
+    recorder, _ = record_game(seed=5, steps=2000)
+    recording = InputRecording.from_bytes(recorder.to_bytes())
+    # Another seed drops other powerups
+    recording.seed = 6
+    runs = [index for index, record in enumerate(recording.records) if record[0] == KIND_RUN]
+    recording.records[runs[len(runs) // 2]] = (KIND_RUN, 0, recording.records[runs[len(runs) // 2]][2])
+    result = replay(recording)
+    assert result['diverged_at'] is not None
+    assert result['steps'] < 2000
+
+
+def test_levels_and_hashes():
+    recorder, _ = record_game(11, settings.REPLAY_HASH_INTERVAL * 2)
+    recorder.start_level(2, 1)
+    recording = InputRecording.from_bytes(recorder.to_bytes())
+    assert recording.get_levels() == [(0, 0), (2, 1)]
+    hashes = recording.get_hashes()
+    assert sorted(hashes) == [settings.REPLAY_HASH_INTERVAL, settings.REPLAY_HASH_INTERVAL * 2]
+    assert list(hashes.values()) == [record[1] for record in recording.records if record[0] == KIND_HASH]
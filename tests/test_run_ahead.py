@@ -0,0 +1,109 @@
+import random
+
+import pytest
+import pygame
+
+from breakout_game.config import settings
+from breakout_game.core import INPUT_LAUNCH, INPUT_RIGHT
+from breakout_game.utils.mixer_wrapper import sound_bank
+from breakout_game.utils.run_ahead import RunAhead
+from breakout_game.sprites.sprite_manager import SpriteManager
+
+TICK_TIME = 1 / settings.TICK_RATE
+
+
+pytestmark = pytest.mark.usefixtures('disable_sound')
+
+
+@pytest.fixture
+def manager():
+    pygame.init()
+    sprite_manager = SpriteManager(rng=random.Random(0))
+    sprite_manager.init_level()
+    sprite_manager.step(TICK_TIME, INPUT_LAUNCH)
+    return sprite_manager
+
+
+def test_disabled_by_default():
+    run_ahead = RunAhead()
+    assert run_ahead.ticks == settings.RUN_AHEAD_TICKS
+    assert not run_ahead.enabled
+
+
+def test_negative_ticks():
+    with pytest.raises(ValueError):
+        RunAhead(-1)
+
+
+def test_disabled_does_not_step(manager):
+    run_ahead = RunAhead(0)
+    state_hash = manager.core.get_state_hash()
+    run_ahead.run(manager, TICK_TIME, INPUT_RIGHT)
+    run_ahead.roll_back(manager)
+    assert manager.core.get_state_hash() == state_hash
+    assert run_ahead.frames == 0
+
+
+def test_predicts_the_steps_ahead(manager):
+    predicted = SpriteManager(rng=random.Random(0))
+    predicted.init_level()
+    predicted.step(TICK_TIME, INPUT_LAUNCH)
+    for _ in range(3):
+        predicted.core.step(TICK_TIME, INPUT_RIGHT)
+
+    run_ahead = RunAhead(3)
+    run_ahead.run(manager, TICK_TIME, INPUT_RIGHT)
+    assert manager.core.get_state_hash() == predicted.core.get_state_hash()
+    assert manager.player.position.x == predicted.core.paddle.x
+
+
+def test_roll_back_restores_the_game(manager):
+    ball = manager.core.balls[0]
+    state_hash = manager.core.get_state_hash()
+    paddle_x = manager.player.position.x
+
+    run_ahead = RunAhead(5)
+    run_ahead.run(manager, TICK_TIME, INPUT_RIGHT)
+    assert manager.player.position.x > paddle_x
+    run_ahead.roll_back(manager)
+
+    assert manager.core.get_state_hash() == state_hash
+    assert manager.player.position.x == paddle_x
+    assert manager.core.balls[0] is ball
+    assert set(manager.ball_views) == {ball}
+
+
+def test_game_goes_on_as_without_run_ahead(manager):
+    reference = SpriteManager(rng=random.Random(0))
+    reference.init_level()
+    reference.step(TICK_TIME, INPUT_LAUNCH)
+
+    run_ahead = RunAhead(4)
+    for _ in range(50):
+        manager.step(TICK_TIME, INPUT_RIGHT)
+        reference.step(TICK_TIME, INPUT_RIGHT)
+        run_ahead.run(manager, TICK_TIME, INPUT_RIGHT)
+        run_ahead.roll_back(manager)
+    assert manager.core.get_state_hash() == reference.core.get_state_hash()
+
+
+def test_sounds_ahead_are_not_played(manager, mocker):
+    play = mocker.patch.object(sound_bank, 'play')
+    manager.core.play_sound('hit-paddle')
+    run_ahead = RunAhead(2)
+    run_ahead.run(manager, TICK_TIME, INPUT_RIGHT)
+    run_ahead.roll_back(manager)
+    play.assert_not_called()
+
+
+def test_stats(manager):
+    run_ahead = RunAhead(2)
+    run_ahead.run(manager, TICK_TIME, INPUT_RIGHT)
+    run_ahead.run(manager, TICK_TIME, INPUT_RIGHT)
+    run_ahead.roll_back(manager)
+    run_ahead.roll_back(manager)
+
+    assert run_ahead.frames == 1
+    assert run_ahead.last_ahead_time > 0
+    assert run_ahead.last_rollback_time > 0
+    assert run_ahead.average_added_time == pytest.approx(run_ahead.last_ahead_time + run_ahead.last_rollback_time)
@@ -1,16 +1,19 @@
+from collections import defaultdict
+
 import pytest
 import pygame
-import math
 from breakout_game.config import settings
 
-from unittest.mock import Mock
 from breakout_game.sprites.sprite_manager import SpriteManager
-from breakout_game.sprites.sprite import Player, Score, Scoreboard, Ball, Block, Heart
+from breakout_game.sprites.sprite import Player, Score, Scoreboard, Heart
+from breakout_game.sprites.ball import Ball
+from breakout_game.core import INPUT_LEFT, INPUT_RIGHT, INPUT_LAUNCH
+from breakout_game.core.entities import PowerUpState
+from breakout_game.core.powerup_manager import PowerUpTimer
+from breakout_game.sprites.sprite_manager import get_inputs
 
 
-@pytest.fixture(autouse=True)
-def disable_sound(mocker):
-    mocker.patch.object(pygame, "mixer", new_callable=Mock)
+pytestmark = pytest.mark.usefixtures('disable_sound')
 
 
 @pytest.fixture
@@ -35,13 +38,13 @@ def test_level(manager):
     assert isinstance(manager.score, Score)
     assert isinstance(manager.scoreboard, Scoreboard)
     assert isinstance(manager.player, Player)
-    assert isinstance(manager.balls[0], Ball)
-    assert isinstance(manager.hearts[0], Heart)
-    assert isinstance(manager.blocks[0], Block)
+    assert isinstance(manager.ball_views[manager.core.balls[0]], Ball)
+    assert isinstance(manager.heart_sprites_group.sprites()[0], Heart)
 
-    assert len(manager.balls) == 1
-    assert len(manager.blocks) == number_of_blocks
-    assert len(manager.power_ups) == 0
+    assert len(manager.ball_views) == 1
+    assert len(manager.heart_sprites_group) == settings.MAX_PLAYER_HEALTH
+    assert len(manager.core.block_field) == number_of_blocks
+    assert len(manager.power_up_views) == 0
     assert len(manager.power_up_infos) == 0
 
 
@@ -56,17 +59,18 @@ def test_create_score(manager):
 
 
 def test_create_heart(manager):
-    original_hearts_in_game = len(manager.hearts)
+    original_hearts_in_game = len(manager.heart_sprites_group)
     manager.create_heart((10, 10))
-    assert len(manager.hearts) == original_hearts_in_game + 1
+    assert len(manager.heart_sprites_group) == original_hearts_in_game + 1
 
 
-def test_create_block(manager):
-    original_blocks = len(manager.blocks)
-    manager.create_block(3, 10, 10)
-    manager.create_block(1, 20, 20)
-    manager.create_block(5, 30, 30)
-    assert len(manager.blocks) == original_blocks + 3
+def test_hearts_follow_health(manager):
+    manager.core.lose_health()
+    manager.sync()
+    assert len(manager.heart_sprites_group) == settings.MAX_PLAYER_HEALTH - 1
+    manager.core.add_health()
+    manager.sync()
+    assert len(manager.heart_sprites_group) == settings.MAX_PLAYER_HEALTH
 
 
 def test_create_player(manager):
@@ -74,23 +78,114 @@ def test_create_player(manager):
     assert manager.player is not None
 
 
-def test_create_ball(manager):
-    original_balls_in_game = len(manager.balls)
-    manager.create_ball(midbottom=(10, 100), angle_radians=math.pi / 2, speed=5)
-    assert len(manager.balls) == original_balls_in_game + 1
+def test_ball_views_follow_the_core(manager):
+    original_balls_in_game = len(manager.ball_views)
+    ball = manager.core.create_ball(midbottom=(10, 100), speed=5)
+    manager.sync()
+    assert len(manager.ball_views) == original_balls_in_game + 1
+    assert manager.ball_views[ball].rect.midbottom == (10, 100)
+    manager.core.balls.remove(ball)
+    manager.sync()
+    assert ball not in manager.ball_views
+    assert len(manager.ball_sprites_group) == original_balls_in_game
 
 
 def test_init_level(manager):
     manager.init_level(level_number=1, level_difficulty=2)
-    assert manager.level_difficulty == 2
+    assert manager.core.level_difficulty == 2
 
 
 def test_create_powerup(manager):
-    manager.create_powerup((10, 10), "big-ball")
-    assert len(manager.power_ups) == 1
+    manager.create_powerup(PowerUpState("big-ball", (10, 10)))
+    assert len(manager.power_up_views) == 1
 
 
 def test_create_powerup_timer_info(manager):
-    manager.create_powerup_timer_info("power", 5)
+    timer = PowerUpTimer()
+    timer.start(5, manager.core.time, "power")
+    manager.create_powerup_timer_info("power", timer)
     assert len(manager.power_up_infos) == 1
 
+
+def test_get_inputs():
+    keys = defaultdict(bool, {pygame.K_LEFT: True, pygame.K_SPACE: True})
+    assert get_inputs(keys) == INPUT_LEFT | INPUT_LAUNCH
+    assert get_inputs(defaultdict(bool, {pygame.K_RIGHT: True})) == INPUT_RIGHT
+
+
+def test_draw_all_returns_dirty_rects(manager):
+    surface = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    dirty_rects = manager.draw_all(surface)
+    assert manager.player.rect in dirty_rects
+    assert len(manager.draw_all(surface, redraw_all=False)) < len(dirty_rects)
+
+
+def test_damaged_block_invalidates_static_layer(manager):
+    surface = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    manager.draw_all(surface)
+    block_field = manager.core.block_field
+    block_field.changes.clear()
+    row, column = block_field.query(block_field.get_rect(0, 0).inflate(1000, 1000))[0]
+    block_field.damage([row], [column], [1])
+    manager.sync()
+    assert block_field.health[row, column] == 0
+    assert block_field.get_rect(row, column) in manager.draw_all(surface, redraw_all=False)
+    assert manager.static_layer.dirty_rects == []
+
+
+def test_score_is_rendered_only_on_change(manager):
+    manager.score.update()
+    image = manager.score.image
+    manager.score.update()
+    assert manager.score.image is image
+    manager.core.score += 10
+    manager.score.update()
+    assert manager.score.image is not image
+    assert manager.score.text == 'Score: 10'
+    assert manager.score.renders_per_second == 2
+
+
+def test_powerup_timer_granularity(manager):
+    manager.core.powerup_manager.activate_big_ball()
+    manager.sync()
+    timer_info = manager.power_up_infos[manager.core.powerup_manager.ball_size_timer]
+    manager.core.time += settings.BALL_SIZE_DURATION - 5.02
+    timer_info.update()
+    assert timer_info.text == 'BIG-BALL Time Left: 5.0'
+
+
+def test_draw_all_interpolates_moving_sprites(manager):
+    surface = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    player = manager.player
+    manager.save_positions()
+    manager.core.paddle.x += 100
+    player.update()
+    manager.draw_all(surface, redraw_all=False, alpha=0.5)
+    assert manager.player_sprites_group.spritedict[player].x == round(player.position.x) - 50
+    assert player.rect.x == round(player.position.x)
+
+
+def test_update_steps_the_core(manager):
+    ball = manager.core.balls[0]
+    manager.update(1 / settings.TICK_RATE, defaultdict(bool, {pygame.K_SPACE: True}))
+    assert ball.active
+    assert manager.core.time == pytest.approx(1 / settings.TICK_RATE)
+    assert manager.ball_views[ball].position.y == pytest.approx(ball.y)
+
+
+def test_restore_snapshot_rebuilds_the_views(manager):
+    core = manager.core
+    snapshot = manager.get_snapshot()
+    ball = core.balls[0]
+    core.powerup_manager.activate_big_paddle()
+    core.lose_health()
+    extra_ball = core.create_ball(midbottom=(100, 100))
+    manager.sync()
+    view = manager.ball_views[ball]
+    manager.restore_snapshot(snapshot)
+    assert extra_ball not in manager.ball_views
+    assert core.balls == [ball]
+    assert manager.ball_views[ball] is view
+    assert len(manager.heart_sprites_group) == settings.MAX_PLAYER_HEALTH
+    assert manager.player.rect.width == core.paddle.width == snapshot['paddle']['width']
+    assert len(manager.power_up_infos) == 0
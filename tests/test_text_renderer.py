@@ -0,0 +1,42 @@
+import pygame
+import pytest
+
+from breakout_game.config import settings
+from breakout_game.utils.text_renderer import GlyphAtlasFont, get_font
+
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    pygame.init()
+
+
+@pytest.mark.parametrize('text', ['Score: 12345', 'BIG-BALL Time Left: 3.2', 'WELCOME TO BREAKOUT!'])
+def test_render_matches_font(text):
+    font = GlyphAtlasFont(settings.GAME_FONT, settings.MENU_FONT_SIZE)
+    surface = font.render(text, True, 'white')
+    expected = font.font.render(text, True, 'white')
+    assert surface.get_size() == expected.get_size()
+    assert pygame.image.tobytes(surface, 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
+
+
+def test_atlas_is_built_once_per_color():
+    font = GlyphAtlasFont(settings.GAME_FONT, settings.SCORE_FONT_SIZE)
+    font.render('Score: 1', True, 'white')
+    atlas = font.get_atlas('white')
+    font.render('Score: 2', True, (255, 255, 255))
+    assert font.get_atlas('white') is atlas
+    font.render('Score: 3', True, 'red')
+    assert len(font.atlases) == 2
+
+
+def test_new_character_rebuilds_atlas():
+    font = GlyphAtlasFont(settings.GAME_FONT, settings.SCORE_FONT_SIZE)
+    atlas = font.get_atlas('white')
+    surface = font.render('é', True, 'white')
+    assert 'é' in font.characters
+    assert font.get_atlas('white') is not atlas
+    assert surface.get_size() == font.font.size('é')
+
+
+def test_get_font_is_shared():
+    assert get_font(settings.GAME_FONT, 20) is get_font(settings.GAME_FONT, 20)
@@ -0,0 +1,29 @@
+import numpy as np
+import pygame
+
+from breakout_game.core.uniform_grid import UniformGrid
+
+
+def test_cell_range():
+    grid = UniformGrid((10, 20), topleft=(5, 5))
+    assert grid.get_cell_range(pygame.Rect(5, 5, 10, 20)) == (0, 0, 0, 0)
+    assert grid.get_cell_range(pygame.Rect(14, 24, 2, 2)) == (0, 1, 0, 1)
+    assert grid.get_cell_range(pygame.Rect(0, 0, 4, 4)) == (-1, -1, -1, -1)
+
+
+def test_cell_ranges_match_cell_range():
+    grid = UniformGrid((10, 20), topleft=(5, 5))
+    rects = [pygame.Rect(5, 5, 10, 20), pygame.Rect(14, 24, 2, 2), pygame.Rect(33, 71, 25, 8)]
+    lows = np.array([rect.topleft for rect in rects])
+    highs = np.array([rect.bottomright for rect in rects]) - 1
+    first, last = grid.get_cell_ranges(lows, highs)
+    for index, rect in enumerate(rects):
+        first_row, last_row, first_column, last_column = grid.get_cell_range(rect)
+        assert first[index].tolist() == [first_column, first_row]
+        assert last[index].tolist() == [last_column, last_row]
+
+
+def test_cell_topleft():
+    grid = UniformGrid((10, 20), topleft=(5, 5))
+    assert grid.get_cell_topleft(2, 3) == (35, 45)
+    assert grid.get_cell_range(pygame.Rect(grid.get_cell_topleft(2, 3), (1, 1))) == (2, 2, 3, 3)